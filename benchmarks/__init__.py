@@ -0,0 +1 @@
+"""pyordstat benchmark suite."""
@@ -0,0 +1,60 @@
+"""Shared fixtures of the benchmark suite.
+
+Run the suite with `poe bench`, which saves the results under `.benchmarks`, and compare a
+later run against the last saved one with `poe bench-compare`, which fails if any
+benchmark got more than 20% slower on average. Each benchmark also records its throughput
+(points evaluated per second) and the peak memory allocated by a single call, and fails
+if that exceeds its memory budget.
+"""
+import tracemalloc
+from typing import Any, Callable, Optional
+
+import pytest
+
+Runner = Callable[..., Any]
+
+
+def peak_memory(func: Callable[..., Any], *args: Any, **kwargs: Any) -> int:
+    """Peak memory allocated by a single call, in bytes, as traced by tracemalloc."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.fixture
+def run(benchmark: Any) -> Runner:
+    """Benchmark a call, recording its throughput and peak memory.
+
+    The returned function takes the function to benchmark and its arguments, plus the
+    keyword-only points (number of points evaluated per call) and max_bytes (memory budget
+    of a single call, if any).
+    """
+
+    def runner(
+        func: Callable[..., Any],
+        *args: Any,
+        points: int,
+        max_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        # Warm up any caches before measuring memory, as the timed rounds do
+        func(*args, **kwargs)
+        peak = peak_memory(func, *args, **kwargs)
+
+        ans = benchmark(func, *args, **kwargs)
+
+        benchmark.extra_info["points"] = points
+        benchmark.extra_info["peak_bytes"] = peak
+        if benchmark.stats is not None:
+            benchmark.extra_info["throughput"] = points / benchmark.stats.stats.mean
+
+        if max_bytes is not None:
+            assert peak <= max_bytes, f"Peak memory {peak} B exceeds the budget of {max_bytes} B."
+
+        return ans
+
+    return runner
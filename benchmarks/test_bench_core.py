@@ -0,0 +1,82 @@
+"""Benchmarks of the core order statistic kernels."""
+import numpy as np
+import pytest
+
+from benchmarks.conftest import Runner
+from pyordstat.core import broadcast_nk, ordstat_cdf, ordstat_logcdf, ordstat_pdf
+from pyordstat.workspace import Workspace
+
+# Room for scalars, casting buffers and interpreter overhead on top of the arrays
+_SLACK = 2**17
+
+SIZES = [10**3, 10**5]
+SAMPLES = [10, 1000, 10**6]
+
+
+def _grid(size: int) -> tuple:
+    """Parent PDF and CDF values of a standard uniform on a grid of points."""
+    cdf = np.linspace(0, 1, size)
+    return np.ones(size), cdf
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("n", SAMPLES)
+@pytest.mark.parametrize("position", ["min", "median", "max"])
+def test_cdf(run: Runner, size: int, n: int, position: str) -> None:
+    """Order statistic CDF with the incomplete beta engine."""
+    k = {"min": 1, "median": (n + 1) // 2, "max": n}[position]
+    _, cdf = _grid(size)
+    run(ordstat_cdf, cdf, n, k, points=size, max_bytes=2 * cdf.nbytes + _SLACK)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("n", SAMPLES[:2])
+def test_pdf(run: Runner, size: int, n: int) -> None:
+    """Order statistic PDF, allocating its temporaries."""
+    pdf, cdf = _grid(size)
+    run(ordstat_pdf, pdf, cdf, n, (n + 1) // 2, points=size, max_bytes=4 * cdf.nbytes + _SLACK)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_pdf_in_place(run: Runner, size: int) -> None:
+    """Order statistic PDF computed in place, which should allocate nothing."""
+    pdf, cdf = _grid(size)
+    out = np.empty(size)
+    workspace = Workspace()
+    run(
+        ordstat_pdf,
+        pdf,
+        cdf,
+        1000,
+        500,
+        out=out,
+        workspace=workspace,
+        points=size,
+        max_bytes=_SLACK,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("n_pairs", [10, 100])
+def test_cdf_pairs(run: Runner, size: int, n_pairs: int) -> None:
+    """Order statistic CDFs of many (n, k) pairs in a single call."""
+    _, cdf = _grid(size)
+    n, k = broadcast_nk(1000, np.linspace(1, 1000, n_pairs).astype(int))
+    run(ordstat_cdf, cdf, n, k, points=size * n_pairs, max_bytes=2 * n_pairs * cdf.nbytes + _SLACK)
+
+
+@pytest.mark.parametrize("method", ["sum", "approx", "auto"])
+def test_cdf_methods(run: Runner, method: str) -> None:
+    """Alternative CDF engines, at a sample size each of them can handle."""
+    _, cdf = _grid(10**4)
+    n = 100 if method == "sum" else 10**6
+    run(ordstat_cdf, cdf, n, n // 2, method=method, points=len(cdf))
+
+
+@pytest.mark.parametrize("n", SAMPLES)
+def test_logcdf(run: Runner, n: int) -> None:
+    """Order statistic log CDF."""
+    _, cdf = _grid(10**4)
+    with np.errstate(divide="ignore"):
+        logcdf, logsf = np.log(cdf), np.log1p(-cdf)
+    run(ordstat_logcdf, logcdf, logsf, n, (n + 1) // 2, points=len(cdf))
@@ -0,0 +1,40 @@
+"""Benchmarks of order statistics of discrete distributions."""
+import numpy as np
+import pytest
+from scipy import stats
+
+from benchmarks.conftest import Runner
+from pyordstat.discrete import DiscreteOrderStatistics
+
+
+@pytest.fixture
+def poisson() -> DiscreteOrderStatistics:
+    """Order statistics of a Poisson distribution."""
+    return DiscreteOrderStatistics(
+        stats.poisson.pmf, stats.poisson.cdf, 1000, ppf=stats.poisson.ppf
+    )
+
+
+@pytest.mark.parametrize("size", [10**3, 10**5])
+@pytest.mark.parametrize("n", [10, 1000])
+def test_pmf(run: Runner, poisson: DiscreteOrderStatistics, size: int, n: int) -> None:
+    """Order statistic PMF at random points."""
+    x = np.random.default_rng(0).integers(800, 1200, size)
+    run(poisson.order_statistic_pmf, x, n, n // 2, points=size)
+
+
+def test_pmf_range(run: Runner, poisson: DiscreteOrderStatistics) -> None:
+    """Order statistic PMFs of many pairs over a contiguous range."""
+    k = np.arange(1, 101)
+    run(poisson.order_statistic_pmf_range, 800, 1200, 100, k, points=401 * len(k))
+
+
+def test_cdf(run: Runner, poisson: DiscreteOrderStatistics) -> None:
+    """Order statistic CDF over a contiguous range."""
+    x = np.arange(800, 1200)
+    run(poisson.order_statistic_cdf, x, 100, 50, points=len(x))
+
+
+def test_moments(run: Runner, poisson: DiscreteOrderStatistics) -> None:
+    """Mean of an order statistic, summed over the support."""
+    run(poisson.order_statistic_mean, 100, 50, points=1)
@@ -0,0 +1,65 @@
+"""Benchmarks of order statistics of finite distributions."""
+import numpy as np
+import pytest
+
+from benchmarks.conftest import Runner
+from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.histogram import HistogramBuilder
+
+SUPPORTS = [10**3, 10**5]
+
+
+def _finite(size: int) -> FiniteOrderStatistics:
+    """Finite distribution with a geometric-like PMF over a large support."""
+    x = np.arange(size)
+    return FiniteOrderStatistics(x, np.exp(-x / (size / 10)))
+
+
+@pytest.mark.parametrize("size", SUPPORTS)
+def test_construct(run: Runner, size: int) -> None:
+    """Construction from a shuffled support."""
+    x = np.random.default_rng(0).permutation(size)
+    run(FiniteOrderStatistics, x, np.ones(size), points=size)
+
+
+@pytest.mark.parametrize("size", SUPPORTS)
+@pytest.mark.parametrize("n", [10, 1000])
+def test_cdf(run: Runner, size: int, n: int) -> None:
+    """Order statistic CDF over the whole support."""
+    finite = _finite(size)
+    run(finite.order_statistic_cdf, n, n // 2, points=size, max_bytes=2 * 8 * size + 2**17)
+
+
+@pytest.mark.parametrize("size", SUPPORTS)
+def test_pmf_pairs(run: Runner, size: int) -> None:
+    """Order statistic PMFs of all order statistics of a small sample."""
+    finite = _finite(size)
+    run(finite.order_statistic_pmf, 10, np.arange(1, 11), points=10 * size)
+
+
+@pytest.mark.parametrize("size", SUPPORTS)
+def test_query_points(run: Runner, size: int) -> None:
+    """Order statistic CDF at arbitrary query points."""
+    finite = _finite(size)
+    x = np.random.default_rng(0).uniform(0, size, 10**4)
+    run(finite.order_statistic_cdf, 100, 50, x=x, points=len(x))
+
+
+@pytest.mark.parametrize("size", SUPPORTS)
+def test_table(run: Runner, size: int) -> None:
+    """Table of all order statistics of a sample of size 100."""
+    finite = _finite(size)
+    run(finite.order_statistic_table, 100, points=100 * size)
+
+
+def test_moments(run: Runner) -> None:
+    """Means of all order statistics of a sample of size 100."""
+    finite = _finite(10**4)
+    run(finite.order_statistic_mean, 100, np.arange(1, 101), points=100)
+
+
+def test_histogram(run: Runner) -> None:
+    """Ingestion of a stream of integer samples."""
+    rng = np.random.default_rng(0)
+    chunks = [rng.poisson(1000, size=10**5) for _ in range(10)]
+    run(HistogramBuilder, chunks, points=10**6)
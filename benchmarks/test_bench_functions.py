@@ -0,0 +1,72 @@
+"""Benchmarks of order statistics of the scipy-backed distributions."""
+import numpy as np
+import pytest
+
+from benchmarks.conftest import Runner
+from pyordstat.functions import (
+    RVBinomialStatistics,
+    RVGeomStatistics,
+    RVNormalStatistics,
+    RVUniformStatistics,
+)
+
+SIZE = 10**5
+
+
+@pytest.mark.parametrize("method", ["order_statistic_pdf", "order_statistic_cdf"])
+@pytest.mark.parametrize("cls", [RVNormalStatistics, RVUniformStatistics])
+def test_continuous(run: Runner, cls: type, method: str) -> None:
+    """Order statistic PDF and CDF of continuous distributions."""
+    ostat = cls(0.0, 1.0)
+    x = np.linspace(-3, 3, SIZE)
+    run(getattr(ostat, method), x, 100, 50, points=SIZE)
+
+
+def test_normal_cached(run: Runner) -> None:
+    """Order statistic PDF in place, with the parent evaluations cached."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    normal.enable_cache()
+    x = np.linspace(-3, 3, SIZE)
+    out = np.empty(SIZE)
+    run(normal.order_statistic_pdf, x, 100, 50, out=out, points=SIZE, max_bytes=2**17)
+
+
+def test_normal_logpdf(run: Runner) -> None:
+    """Order statistic log PDF for a very large sample."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    x = np.linspace(3, 6, SIZE)
+    run(normal.order_statistic_logpdf, x, 10**6, 10**6, points=SIZE)
+
+
+def test_normal_ppf(run: Runner) -> None:
+    """Order statistic quantiles."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    q = np.linspace(0.001, 0.999, SIZE)
+    run(normal.order_statistic_ppf, q, 100, 50, points=SIZE)
+
+
+def test_normal_rvs(run: Runner) -> None:
+    """Order statistic random variates."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    run(normal.order_statistic_rvs, 10**6, 10, SIZE, 0, points=SIZE)
+
+
+def test_normal_moments(run: Runner) -> None:
+    """Means of all order statistics of a sample of size 100."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    run(normal.order_statistic_mean, 100, np.arange(1, 101), points=100)
+
+
+def test_normal_batch(run: Runner) -> None:
+    """Order statistic CDF of a batch of 100 parents."""
+    normal = RVNormalStatistics(np.linspace(-1, 1, 100), 1.0)
+    x = np.linspace(-3, 3, 10**3)
+    run(normal.order_statistic_cdf, x, 100, 50, points=100 * len(x))
+
+
+@pytest.mark.parametrize("cls", [RVBinomialStatistics, RVGeomStatistics])
+def test_discrete(run: Runner, cls: type) -> None:
+    """Order statistic PMF of discrete distributions."""
+    ostat = RVBinomialStatistics(1000, 0.3) if cls is RVBinomialStatistics else cls(0.01)
+    x = np.arange(1, 1001)
+    run(ostat.order_statistic_pmf, x, 100, 50, points=len(x))
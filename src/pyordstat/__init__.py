@@ -1,14 +1,58 @@
-"""pyordstat package."""
-from pyordstat.continuous import ContinuousOrderStatistics
-from pyordstat.discrete import DiscreteOrderStatistics
-from pyordstat.finite import FiniteOrderStatistics
-from pyordstat.functions.rv_continuous import RVContOrderStatistics
-from pyordstat.functions.rv_discrete import RVDiscrOrderStatistics
+"""pyordstat package.
+
+The public classes are imported on first access, so that `import pyordstat` stays fast, and
+SciPy modules such as `scipy.stats` are only loaded by the classes that need them.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from pyordstat.continuous import ContinuousOrderStatistics
+    from pyordstat.discrete import DiscreteOrderStatistics
+    from pyordstat.finite import FiniteOrderStatistics
+    from pyordstat.functions.rv_continuous import RVContOrderStatistics
+    from pyordstat.functions.rv_discrete import RVDiscrOrderStatistics
+    from pyordstat.heterogeneous import HeterogeneousOrderStatistics
+    from pyordstat.histogram import HistogramBuilder
+    from pyordstat.table import OrderStatisticTable
+    from pyordstat.tabulated import ParentTable
+
+# Module defining each public name
+_LAZY: Dict[str, str] = {
+    "ContinuousOrderStatistics": "pyordstat.continuous",
+    "DiscreteOrderStatistics": "pyordstat.discrete",
+    "FiniteOrderStatistics": "pyordstat.finite",
+    "RVContOrderStatistics": "pyordstat.functions.rv_continuous",
+    "RVDiscrOrderStatistics": "pyordstat.functions.rv_discrete",
+    "HeterogeneousOrderStatistics": "pyordstat.heterogeneous",
+    "HistogramBuilder": "pyordstat.histogram",
+    "OrderStatisticTable": "pyordstat.table",
+    "ParentTable": "pyordstat.tabulated",
+}
 
 __all__ = [
     "ContinuousOrderStatistics",
-    "FiniteOrderStatistics",
     "DiscreteOrderStatistics",
+    "FiniteOrderStatistics",
+    "HeterogeneousOrderStatistics",
+    "HistogramBuilder",
+    "OrderStatisticTable",
+    "ParentTable",
     "RVContOrderStatistics",
     "RVDiscrOrderStatistics",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the classes not imported yet."""
+    return sorted(set(globals()) | set(__all__))
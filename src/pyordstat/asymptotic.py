@@ -0,0 +1,261 @@
+"""Asymptotic approximations of order statistics distributions for large samples.
+
+All approximations are expressed in probability space, through the parent CDF F: the k-th
+order statistic of a sample of size n is F^-1(U_(k)), with U_(k) ~ Beta(k, n-k+1).
+
+* Central order statistics (k/n -> p) use the normal limit of U_(k), with the exact mean and
+  variance of the beta distribution. Mapped through F^-1 this is the classical normal
+  approximation N(xi_p, p (1-p) / (n f(xi_p)^2)), without needing the parent quantile.
+* Extreme order statistics (k or n-k fixed) use the gamma limit of n U_(k) (or n (1-U_(k))),
+  which mapped through the parent tail gives the Gumbel, Frechet or Weibull limit of its
+  domain of attraction. The exponential transformation -log(1-F) makes it exact for the
+  minimum and maximum.
+
+Every approximation comes with an estimate of its absolute error on the CDF, from the
+leading terms neglected by the limit.
+"""
+from typing import TYPE_CHECKING, Callable, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.special import gammainc, gammaincc, gammaln, ndtr, xlogy
+
+if TYPE_CHECKING:
+    from pyordstat.core import IntOrIntArray
+
+LOWER = 0
+CENTRAL = 1
+UPPER = 2
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+# Maxima over z of |He_2(z)| phi(z) and |He_3(z)| phi(z), the Edgeworth correction terms
+_EDGEWORTH_2 = 1 / _SQRT_2PI
+_EDGEWORTH_3 = 0.5502
+
+
+def central_cdf(
+    cdf: NDArray[np.number], n: "IntOrIntArray", k: "IntOrIntArray"
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic CDF by its normal limit, for central k.
+
+    Args:
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic CDF.
+    """
+    mean, std = _beta_mean_std(n, k)
+    return ndtr((cdf - mean) / std)
+
+
+def central_pdf(
+    pdf: NDArray[np.number], cdf: NDArray[np.number], n: "IntOrIntArray", k: "IntOrIntArray"
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic PDF by its normal limit, for central k.
+
+    Args:
+        pdf (NDArray[np.number]): Values of the parent PDF.
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic PDF.
+    """
+    mean, std = _beta_mean_std(n, k)
+    z = (cdf - mean) / std
+    return np.exp(-0.5 * z**2) / (_SQRT_2PI * std) * pdf
+
+
+def central_error(n: "IntOrIntArray", k: "IntOrIntArray") -> NDArray[np.floating]:
+    """Estimated absolute error of `central_cdf`.
+
+    The estimate is the size of the first two Edgeworth corrections to the normal limit, from
+    the skewness and the excess kurtosis of Beta(k, n-k+1).
+
+    Args:
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.floating]: Error estimate.
+    """
+    a = np.asarray(k, dtype=float)
+    b = n - a + 1
+    s = a + b
+    skew = 2 * (b - a) * np.sqrt(s + 1) / ((s + 2) * np.sqrt(a * b))
+    kurt = 6 * ((a - b) ** 2 * (s + 1) - a * b * (s + 2)) / (a * b * (s + 2) * (s + 3))
+    return (
+        np.abs(skew) / 6 * _EDGEWORTH_2
+        + np.abs(kurt) / 24 * _EDGEWORTH_3
+        + skew**2 / 72 * _EDGEWORTH_2
+    )
+
+
+def extreme_cdf(
+    cdf: NDArray[np.number], n: "IntOrIntArray", k: "IntOrIntArray", upper: bool = False
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic CDF by its gamma limit, for extreme k.
+
+    Args:
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+        upper (bool, optional): Whether k is close to n (upper extremes) rather than to 1.
+            Defaults to False.
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic CDF.
+    """
+    with np.errstate(divide="ignore"):
+        if upper:
+            return gammaincc(n - k + 1, -n * np.log(cdf))
+        return gammainc(k, -n * np.log1p(-cdf))
+
+
+def extreme_pdf(
+    pdf: NDArray[np.number],
+    cdf: NDArray[np.number],
+    n: "IntOrIntArray",
+    k: "IntOrIntArray",
+    upper: bool = False,
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic PDF by its gamma limit, for extreme k.
+
+    Args:
+        pdf (NDArray[np.number]): Values of the parent PDF.
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+        upper (bool, optional): Whether k is close to n (upper extremes) rather than to 1.
+            Defaults to False.
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic PDF.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if upper:
+            a = n - k + 1
+            t = -n * np.log(cdf)
+            jacobian = n / cdf
+        else:
+            a = k
+            t = -n * np.log1p(-cdf)
+            jacobian = n / (1 - cdf)
+        ans = np.exp(xlogy(a - 1, t) - t - gammaln(a)) * jacobian * pdf
+
+    return np.nan_to_num(ans, nan=0.0, posinf=0.0)
+
+
+def extreme_error(n: "IntOrIntArray", k: "IntOrIntArray") -> NDArray[np.floating]:
+    """Estimated absolute error of `extreme_cdf` for lower extremes.
+
+    The exact transformed order statistic is a sum of k exponential spacings with rates
+    n, n-1, ..., n-k+1, rather than a Gamma(k) variable with rate n. The estimate is the
+    shift of its mean times the largest value of the Gamma(k) density. For upper extremes,
+    pass n-k+1 in place of k.
+
+    Args:
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.floating]: Error estimate.
+    """
+    a = np.asarray(k, dtype=float)
+    shift = a * (a - 1) / (2 * (n - a + 1))
+    return shift / np.sqrt(2 * np.pi * np.maximum(a - 1, 1))
+
+
+def approx_choice(
+    n: "IntOrIntArray", k: "IntOrIntArray"
+) -> Tuple[NDArray[np.int_], NDArray[np.floating]]:
+    """Choose the most accurate approximation for each (n, k) pair.
+
+    Args:
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        Tuple[NDArray[np.int_], NDArray[np.floating]]: The chosen approximation (LOWER,
+            CENTRAL or UPPER) and its estimated error.
+    """
+    errors = np.stack(
+        np.broadcast_arrays(extreme_error(n, k), central_error(n, k), extreme_error(n, n - k + 1))
+    )
+    choice = np.argmin(errors, axis=0)
+    return choice, np.take_along_axis(errors, choice[None], axis=0)[0]
+
+
+def approx_cdf(
+    cdf: NDArray[np.number], n: "IntOrIntArray", k: "IntOrIntArray"
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic CDF with the most accurate asymptotic form.
+
+    Args:
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic CDF.
+    """
+    choice, _ = approx_choice(n, k)
+    return _select(
+        choice,
+        lambda: extreme_cdf(cdf, n, k),
+        lambda: central_cdf(cdf, n, k),
+        lambda: extreme_cdf(cdf, n, k, upper=True),
+    )
+
+
+def approx_pdf(
+    pdf: NDArray[np.number], cdf: NDArray[np.number], n: "IntOrIntArray", k: "IntOrIntArray"
+) -> NDArray[np.number]:
+    """Approximate the k-th order statistic PDF with the most accurate asymptotic form.
+
+    Args:
+        pdf (NDArray[np.number]): Values of the parent PDF.
+        cdf (NDArray[np.number]): Values of the parent CDF.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s).
+
+    Returns
+    -------
+        NDArray[np.number]: Approximate order statistic PDF.
+    """
+    choice, _ = approx_choice(n, k)
+    return _select(
+        choice,
+        lambda: extreme_pdf(pdf, cdf, n, k),
+        lambda: central_pdf(pdf, cdf, n, k),
+        lambda: extreme_pdf(pdf, cdf, n, k, upper=True),
+    )
+
+
+def _beta_mean_std(
+    n: "IntOrIntArray", k: "IntOrIntArray"
+) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Mean and standard deviation of Beta(k, n-k+1)."""
+    mean = np.asarray(k / (n + 1))
+    return mean, np.sqrt(mean * (1 - mean) / (n + 2))
+
+
+def _select(
+    choice: NDArray[np.int_], *forms: Callable[[], NDArray[np.number]]
+) -> NDArray[np.number]:
+    """Evaluate only the approximations that were chosen, and pick between them."""
+    used = np.unique(choice)
+    if len(used) == 1:
+        return forms[used[0]]()
+    return np.choose(choice, [forms[i]() if i in used else np.zeros(()) for i in range(len(forms))])
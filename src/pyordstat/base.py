@@ -1,9 +1,39 @@
 """Base class for order statistics distributions."""
 from abc import ABC
-from typing import Any, Protocol, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+from pyordstat.cache import EvaluationCache
+from pyordstat.core import (
+    APPROX_TOL,
+    IntOrArray,
+    SeedLike,
+    SizeLike,
+    broadcast_nk,
+    ordstat_joint_uniform_rvs,
+    ordstat_quantile_level,
+    ordstat_rank,
+    ordstat_sample_size,
+    ordstat_uniform_rvs,
+)
+from pyordstat.instrumentation import Hook, Profile
+from pyordstat.parallel import parallel_evaluate
+from pyordstat.streaming import DEFAULT_MEMORY_BUDGET, ChunkedInput, evaluate_chunked, stream
+from pyordstat.workspace import Workspace
 
 
 class CallableDistrFunc(Protocol):
@@ -16,25 +46,97 @@ class CallableDistrFunc(Protocol):
 StatDistrFunc = Union[CallableDistrFunc, NDArray[np.number]]
 
 
+class BatchedDistrFunc:
+    """Distribution function with bound parameters, which may be arrays.
+
+    Array parameters are broadcast together into a batch of parameter sets of shape
+    batch_shape. When the function is called they are given trailing unit axes, so that
+    the result is evaluated for every parameter set at every point, with shape
+    (*batch_shape, *x.shape), in a single vectorized call.
+    """
+
+    _func: CallableDistrFunc
+    _args: Tuple[Any, ...]
+    _kwargs: Dict[str, Any]
+    batch_shape: Tuple[int, ...]
+
+    def __init__(self, func: CallableDistrFunc, *args: Any, **kwargs: Any) -> None:
+        """Bind parameters to a distribution function.
+
+        Args:
+            func (CallableDistrFunc): Distribution function, taking the values of the random
+                variable followed by the parameters.
+            *args (Any): Positional parameters, scalars or arrays.
+            **kwargs (Any): Keyword parameters, scalars or arrays.
+        """
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self.batch_shape = np.broadcast_shapes(*(np.shape(a) for a in (*args, *kwargs.values())))
+
+    def __call__(self, x: NDArray[np.number], ndim: Optional[int] = None) -> NDArray[np.number]:
+        """Evaluate the function for every parameter set.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variable (or probabilities).
+            ndim (Optional[int], optional): Number of trailing axes of x to evaluate every
+                parameter set at. Any axes of x before them must already leave room for the
+                batch axes, with unit or full axes. Defaults to None, for all axes of x.
+
+        Returns
+        -------
+            NDArray[np.number]: Function values, of shape (*batch_shape, *x.shape) if ndim
+                is None.
+        """
+        if not self.batch_shape:
+            return self._func(x, *self._args, **self._kwargs)
+
+        axes = (1,) * (np.ndim(x) if ndim is None else ndim)
+
+        def expand(a: Any) -> Any:
+            return np.reshape(a, np.shape(a) + axes) if np.ndim(a) > 0 else a
+
+        args = [expand(a) for a in self._args]
+        kwargs = {key: expand(a) for key, a in self._kwargs.items()}
+        return self._func(x, *args, **kwargs)
+
+
 class BaseOrderStatistics(ABC):
     """Base class for order statistics distributions."""
 
     _pdf: StatDistrFunc
     _cdf: StatDistrFunc
+    _ppf: Optional[CallableDistrFunc]
+    _cache: Optional[EvaluationCache] = None
+    _workspace: Optional[Workspace] = None
+    _profile: Optional[Profile] = None
+
+    approx_tol: float = APPROX_TOL
+    """Largest estimated error of the asymptotic approximations used by method "auto"."""
+
+    n_jobs: Optional[int] = 1
+    """Number of workers of `evaluate_parallel`; -1 uses all CPUs."""
+
+    parallel_backend: str = "thread"
+    """Backend of `evaluate_parallel`, either "thread" or "process"."""
 
     def __init__(
         self,
         pdf: StatDistrFunc,
         cdf: StatDistrFunc,
+        ppf: Optional[CallableDistrFunc] = None,
     ) -> None:
         """Initialise base order statistics distribution.
 
         Args:
             pdf (StatDistrFunc): Probability density function.
             cdf (StatDistrFunc): Cumulative distribution function.
+            ppf (Optional[CallableDistrFunc], optional): Percent point (quantile) function,
+                if known. Defaults to None.
         """
         self._pdf = pdf
         self._cdf = cdf
+        self._ppf = ppf
 
     @property
     def pdf(self) -> StatDistrFunc:
@@ -45,3 +147,505 @@ class BaseOrderStatistics(ABC):
     def cdf(self) -> StatDistrFunc:
         """Cumulative distribution function."""
         return self._cdf
+
+    @property
+    def batch_shape(self) -> Tuple[int, ...]:
+        """Shape of the batch of parent parameter sets, empty for a single parent.
+
+        Results for a batch have the batch axes after the (n, k) pairs axis, if any, and
+        before the axes of the points.
+        """
+        return cast(Tuple[int, ...], getattr(self._cdf, "batch_shape", ()))
+
+    def enable_cache(self, max_bytes: int = 64 * 2**20) -> None:
+        """Enable memoization of the parent PDF and CDF evaluations.
+
+        The logarithms of the parent functions are memoized too, where the parent provides
+        them. Evaluations are keyed by the content of the points they are made at, so repeated
+        calls on the same grids reuse them across (n, k) and across methods. The cache is
+        bounded in memory and evicts the least recently used evaluations first.
+
+        Args:
+            max_bytes (int, optional): Maximum total size of the cached evaluations, in bytes.
+                Defaults to 64 MiB.
+        """
+        self._cache = EvaluationCache(max_bytes)
+
+    def disable_cache(self) -> None:
+        """Disable memoization of the parent PDF and CDF evaluations, and drop the cache."""
+        self._cache = None
+
+    def cache_info(self) -> Optional[Dict[str, int]]:
+        """Statistics of the parent evaluation cache.
+
+        Returns
+        -------
+            Optional[Dict[str, int]]: Numbers of hits, misses and entries, and current and
+                maximum size in bytes, or None if the cache is disabled.
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    @property
+    def workspace(self) -> Workspace:
+        """Scratch buffers reused by the in-place kernels, when an output array is given."""
+        if self._workspace is None:
+            self._workspace = Workspace()
+        return self._workspace
+
+    @contextmanager
+    def profile(self, hook: Optional[Hook] = None, trace_memory: bool = False) -> Iterator[Profile]:
+        """Profile the order statistic methods called within a `with` block.
+
+        Records the calls of each method, the calls and points of each parent function,
+        the time spent evaluating the parent and the time spent in the order statistic
+        transform, and optionally the peak memory allocated by a call. Nothing is
+        instrumented outside of the block, so profiling costs nothing when not in use.
+
+        Args:
+            hook (Optional[Hook], optional): Function called with an event dictionary after
+                every parent evaluation and method call, for example to feed a metrics
+                system. Defaults to None.
+            trace_memory (bool, optional): Whether to trace the peak memory allocated by
+                each call with `tracemalloc`, which is slow. Defaults to False.
+
+        Raises
+        ------
+            RuntimeError: If the object is already being profiled.
+
+        Yields
+        ------
+            Profile: The profile, filled in as methods are called; see `Profile.as_dict`.
+        """
+        if self._profile is not None:
+            raise RuntimeError("This object is already being profiled.")
+
+        profile = Profile(hook, trace_memory)
+        originals = profile.attach(self)
+        self._profile = profile
+        try:
+            yield profile
+        finally:
+            self._profile = None
+            profile.detach(self, originals)
+
+    def stream(
+        self,
+        method: str,
+        x: ChunkedInput,
+        *args: Any,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        out: Optional[NDArray[np.number]] = None,
+        **kwargs: Any,
+    ) -> Iterator[NDArray[np.number]]:
+        """Evaluate an order statistic method chunk by chunk over x, yielding the results.
+
+        Args:
+            method (str): Name of a method taking the points as first argument, for example
+                "order_statistic_cdf".
+            x (ChunkedInput): Points, as a (possibly memory-mapped) array, which is
+                flattened, or an iterable of chunks.
+            *args (Any): Further arguments of the method, such as n and k.
+            memory_budget (int, optional): Memory budget of a single chunk, in bytes.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+            out (Optional[NDArray[np.number]], optional): Array to write the results into,
+                with the points along its last axis. Defaults to None.
+            **kwargs (Any): Further keyword arguments of the method.
+
+        Yields
+        ------
+            NDArray[np.number]: Results for each chunk, in order.
+        """
+        func = getattr(self, method)
+        yield from stream(lambda c: func(c, *args, **kwargs), x, memory_budget, out=out)
+
+    def evaluate_chunked(
+        self,
+        method: str,
+        x: ChunkedInput,
+        *args: Any,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        out: Optional[NDArray[np.number]] = None,
+        **kwargs: Any,
+    ) -> NDArray[np.number]:
+        """Evaluate an order statistic method chunk by chunk over x, collecting the results.
+
+        Args:
+            method (str): Name of a method taking the points as first argument, for example
+                "order_statistic_cdf".
+            x (ChunkedInput): Points, as a (possibly memory-mapped) array, which is
+                flattened, or an iterable of chunks.
+            *args (Any): Further arguments of the method, such as n and k.
+            memory_budget (int, optional): Memory budget of a single chunk, in bytes.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+            out (Optional[NDArray[np.number]], optional): Array to write the results into,
+                for example memory-mapped, with the points along its last axis. Defaults to
+                None.
+            **kwargs (Any): Further keyword arguments of the method.
+
+        Returns
+        -------
+            NDArray[np.number]: Results, with the points along the last axis.
+        """
+        func = getattr(self, method)
+        return evaluate_chunked(lambda c: func(c, *args, **kwargs), x, memory_budget, out=out)
+
+    def evaluate_parallel(
+        self,
+        method: str,
+        x: NDArray[np.number],
+        n: IntOrArray,
+        k: IntOrArray,
+        *args: Any,
+        **kwargs: Any,
+    ) -> NDArray[np.number]:
+        """Evaluate an order statistic method in parallel over chunks of x and (n, k) pairs.
+
+        The work is shared between `n_jobs` workers of the `parallel_backend` (see
+        `pyordstat.parallel.parallel_evaluate`), and the result is the same as that of the
+        method called directly.
+
+        Args:
+            method (str): Name of a method taking the points, n and k as first arguments,
+                for example "order_statistic_cdf".
+            x (NDArray[np.number]): Points.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            *args (Any): Further arguments of the method.
+            **kwargs (Any): Further keyword arguments of the method.
+
+        Returns
+        -------
+            NDArray[np.number]: Results of the method.
+        """
+        func = getattr(self, method)
+        return parallel_evaluate(
+            lambda xc, nc, kc: func(xc, nc, kc, *args, **kwargs),
+            x,
+            n,
+            k,
+            n_jobs=self.n_jobs,
+            backend=self.parallel_backend,
+        )
+
+    @property
+    def ppf(self) -> CallableDistrFunc:
+        """Percent point (quantile) function.
+
+        Raises
+        ------
+            NotImplementedError: If no quantile function was provided.
+        """
+        if self._ppf is None:
+            raise NotImplementedError("Quantile function not available for this distribution.")
+        return self._ppf
+
+    def order_statistic_ppf(
+        self, q: NDArray[np.number], n: IntOrArray, k: IntOrArray
+    ) -> NDArray[np.number]:
+        """Calculate the k-th order statistic percent point function of a sample of size n.
+
+        The quantiles are found by inverting the beta distribution of the order statistic
+        in probability space and applying the parent quantile function, so they cost one
+        parent quantile evaluation per point. For discrete distributions this is the
+        smallest x at which the order statistic CDF is at least q.
+
+        Args:
+            q (NDArray[np.number]): Probabilities.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+            NotImplementedError: If the parent quantile function is not known.
+
+        Returns
+        -------
+            NDArray[np.number]: Order statistic quantiles.
+        """
+        n, k = broadcast_nk(n, k, np.ndim(q))
+
+        return self._parent_quantile(ordstat_quantile_level(q, n, k), np.ndim(q))
+
+    def order_statistic_isf(
+        self, q: NDArray[np.number], n: IntOrArray, k: IntOrArray
+    ) -> NDArray[np.number]:
+        """Calculate the k-th order statistic inverse survival function of a sample of size n.
+
+        For discrete distributions this is the smallest x at which the order statistic
+        survival function is at most q.
+
+        Args:
+            q (NDArray[np.number]): Upper tail probabilities.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+            NotImplementedError: If the parent quantile function is not known.
+
+        Returns
+        -------
+            NDArray[np.number]: Order statistic inverse survival function values.
+        """
+        n, k = broadcast_nk(n, k, np.ndim(q))
+
+        return self._parent_quantile(ordstat_quantile_level(q, n, k, upper=True), np.ndim(q))
+
+    def order_statistic_rvs(
+        self,
+        n: IntOrArray,
+        k: IntOrArray,
+        size: SizeLike = None,
+        random_state: SeedLike = None,
+    ) -> NDArray[np.number]:
+        """Draw random variates of the k-th order statistic of a sample of size n.
+
+        Each variate is drawn as a single Beta(k, n-k+1) variate mapped through the parent
+        quantile function, without drawing or sorting the full sample. For a batch of
+        parents, the same uniform draws are mapped through every parent.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to draw, or an array of them.
+            size (SizeLike, optional): Number or shape of draws. Defaults to None.
+            random_state (SeedLike, optional): Seed or random number generator.
+                Defaults to None.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+            NotImplementedError: If the parent quantile function is not known.
+
+        Returns
+        -------
+            NDArray[np.number]: Random variates, of shape size, or (n_k_pairs, *size) if n or
+                k are arrays, with the batch axes before size.
+        """
+        u = ordstat_uniform_rvs(n, k, size, random_state)
+        paired = np.ndim(n) > 0 or np.ndim(k) > 0
+
+        return self._parent_quantile(u, np.ndim(u) - int(paired))
+
+    def order_statistic_joint_rvs(
+        self,
+        n: int,
+        ks: Sequence[int],
+        size: SizeLike = None,
+        random_state: SeedLike = None,
+    ) -> NDArray[np.number]:
+        """Draw several order statistics of the same samples of size n.
+
+        Each draw costs O(len(ks)) regardless of n, using uniform spacings mapped through
+        the parent quantile function.
+
+        Args:
+            n (int): Sample size.
+            ks (Sequence[int]): Strictly increasing order statistics to draw.
+            size (SizeLike, optional): Number or shape of draws. Defaults to None.
+            random_state (SeedLike, optional): Seed or random number generator.
+                Defaults to None.
+
+        Raises
+        ------
+            ValueError: If ks are not strictly increasing and between 1 and n.
+            NotImplementedError: If the parent quantile function is not known.
+
+        Returns
+        -------
+            NDArray[np.number]: Random variates, of shape (*batch_shape, *size, len(ks)).
+        """
+        return self._parent_quantile(ordstat_joint_uniform_rvs(n, ks, size, random_state))
+
+    def order_statistic_moment(
+        self, n: IntOrArray, k: IntOrArray, order: int = 1
+    ) -> NDArray[np.number]:
+        """Calculate a raw moment of the k-th order statistic of a sample of size n.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            order (int, optional): Order of the moment. Defaults to 1.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.number]: Moment, or array of moments of shape (n_k_pairs,).
+        """
+        return self._order_statistic_expect(lambda x: x**order, n, k)
+
+    def order_statistic_mean(self, n: IntOrArray, k: IntOrArray) -> NDArray[np.number]:
+        """Calculate the mean of the k-th order statistic of a sample of size n.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.number]: Mean, or array of means of shape (n_k_pairs,).
+        """
+        return self.order_statistic_moment(n, k, 1)
+
+    def order_statistic_var(self, n: IntOrArray, k: IntOrArray) -> NDArray[np.number]:
+        """Calculate the variance of the k-th order statistic of a sample of size n.
+
+        The variance is computed as a central moment, not as a difference of raw moments.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.number]: Variance, or array of variances of shape (n_k_pairs,).
+        """
+        mean = np.asarray(self.order_statistic_mean(n, k))[..., None]
+        return self._order_statistic_expect(lambda x: (x - mean) ** 2, n, k)
+
+    def order_statistic_sample_size(
+        self, t: ArrayLike, q: ArrayLike, k: IntOrArray = 1, largest: bool = False
+    ) -> NDArray[np.floating]:
+        """Find the smallest sample size n at which P(X_(k) <= t) >= q.
+
+        For example, with k = 1 this is the number of replicas needed for the fastest one
+        to finish within t with probability q. With largest=True, k counts from the largest
+        value instead and the target is P(X_(n-k+1) > t) >= q: with k = 1, the number of
+        samples needed for the maximum to exceed t with probability q.
+
+        The parent distribution is evaluated once per threshold, and the sample sizes are
+        then searched with `ordstat_sample_size`, without further parent evaluations.
+
+        Args:
+            t (ArrayLike): Thresholds.
+            q (ArrayLike): Target probabilities, below 1.
+            k (IntOrArray, optional): Order statistic, counted from the smallest value, or
+                from the largest if largest is True. Defaults to 1.
+            largest (bool, optional): Whether to count k from the largest value and target
+                the probability of exceeding t. Defaults to False.
+
+        Raises
+        ------
+            ValueError: If any k is less than 1.
+
+        Returns
+        -------
+            NDArray[np.floating]: Sample sizes of shape (*batch_shape, *shape), where shape
+                is the broadcast shape of t, q and k, as floats; inf where no sample size
+                up to 2**53 reaches the target, for example for thresholds below the
+                support.
+        """
+        p = self._threshold_probability(t, q, k, largest)
+        return ordstat_sample_size(p, q, k)
+
+    def order_statistic_rank(
+        self, t: ArrayLike, q: ArrayLike, n: IntOrArray, largest: bool = False
+    ) -> NDArray[np.int_]:
+        """Find the largest k at which P(X_(k) <= t) >= q in a sample of size n.
+
+        This is the number of samples, out of n, that are at most t with probability at
+        least q; divided by n, it is the fraction of the sample that meets the threshold.
+        With largest=True, k counts from the largest value instead and the target is
+        P(X_(n-k+1) > t) >= q.
+
+        Args:
+            t (ArrayLike): Thresholds.
+            q (ArrayLike): Target probabilities.
+            n (IntOrArray): Sample size.
+            largest (bool, optional): Whether to count k from the largest value and target
+                the probability of exceeding t. Defaults to False.
+
+        Raises
+        ------
+            ValueError: If any n is less than 1.
+
+        Returns
+        -------
+            NDArray[np.int_]: Order statistics of shape (*batch_shape, *shape), where shape
+                is the broadcast shape of t, q and n; 0 where no order statistic reaches
+                the target.
+        """
+        p = self._threshold_probability(t, q, n, largest)
+        return ordstat_rank(p, q, n)
+
+    def _threshold_probability(
+        self, t: ArrayLike, q: ArrayLike, nk: IntOrArray, largest: bool
+    ) -> NDArray[np.number]:
+        """Parent CDF, or survival function if largest, at t broadcast against q and nk."""
+        shape = np.broadcast_shapes(np.shape(t), np.shape(q), np.shape(nk))
+        cdf, sf = self._parent_cdf_sf(np.broadcast_to(np.asarray(t, dtype=float), shape))
+        return sf if largest else cdf
+
+    def _order_statistic_expect(
+        self,
+        func: Callable[[NDArray[np.number]], NDArray[np.number]],
+        n: IntOrArray,
+        k: IntOrArray,
+    ) -> NDArray[np.number]:
+        """Compute the expectation of func(X_(k)).
+
+        func receives points along a trailing axis, broadcast against a leading (n, k) pairs
+        axis when n or k are arrays, and the expectation is taken over the trailing axis.
+        """
+        raise NotImplementedError("Expectations not implemented for this distribution.")
+
+    def _broadcast_nk(
+        self, n: IntOrArray, k: IntOrArray, ndim: int = 1
+    ) -> Tuple[Union[int, NDArray[np.int_]], Union[int, NDArray[np.int_]]]:
+        """Broadcast (n, k) against parent values with ndim point axes after the batch axes."""
+        return broadcast_nk(n, k, ndim + len(self.batch_shape))
+
+    def _eval_parent(
+        self, name: str, func: CallableDistrFunc, x: NDArray[np.number]
+    ) -> NDArray[np.number]:
+        """Evaluate a parent distribution function, through the cache if enabled."""
+        if self._cache is None:
+            return func(x)
+        return self._cache.evaluate(name, func, x)
+
+    def _eval_pdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        """Evaluate the parent PDF (or PMF), through the cache if enabled."""
+        return self._eval_parent("pdf", cast(CallableDistrFunc, self._pdf), x)
+
+    def _eval_cdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        """Evaluate the parent CDF, through the cache if enabled."""
+        return self._eval_parent("cdf", cast(CallableDistrFunc, self._cdf), x)
+
+    def _parent_cdf_sf(
+        self, x: NDArray[np.number]
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Parent CDF and survival function at x."""
+        cdf = self._eval_cdf(x)
+        return cdf, 1 - cdf
+
+    def _parent_quantile(
+        self, u: NDArray[np.number], ndim: Optional[int] = None
+    ) -> NDArray[np.number]:
+        """Parent quantile function, used to map uniform levels to the distribution.
+
+        The last ndim axes of u (all by default) are mapped through every parent of a batch,
+        and the batch axes are inserted before them.
+        """
+        batch_ndim = len(self.batch_shape)
+        if batch_ndim == 0:
+            return self.ppf(u)
+
+        u = np.asarray(u)
+        ndim = u.ndim if ndim is None else ndim
+        lead = u.shape[: u.ndim - ndim]
+        u = u.reshape(lead + (1,) * batch_ndim + u.shape[u.ndim - ndim :])
+        return self.ppf(u, ndim=ndim)
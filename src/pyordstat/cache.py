@@ -0,0 +1,131 @@
+"""Memoization of parent distribution function evaluations."""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+CacheKey = Tuple[Hashable, str, Tuple[int, ...], str]
+
+
+class EvaluationCache:
+    """Least recently used cache of function evaluations, bounded in bytes.
+
+    Entries are keyed by a name for the function and by the dtype, shape and a content hash
+    of the points it was evaluated at, so that equal arrays hit the cache even if they are
+    different objects. Cached results are copies owned by the cache, returned read-only.
+
+    The cache can be shared between threads: its bookkeeping is done under a lock, while
+    the functions are evaluated outside of it.
+    """
+
+    _max_bytes: int
+    _entries: "OrderedDict[CacheKey, NDArray[np.number]]"
+    _nbytes: int
+    _hits: int
+    _misses: int
+
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes (int, optional): Maximum total size of the cached results, in bytes.
+                Defaults to 64 MiB.
+
+        Raises
+        ------
+            ValueError: If max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the cache without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Unpickle the cache with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def evaluate(
+        self,
+        name: Hashable,
+        func: Callable[[NDArray[np.number]], NDArray[np.number]],
+        x: NDArray[np.number],
+    ) -> NDArray[np.number]:
+        """Return func(x), from the cache if possible.
+
+        Args:
+            name (Hashable): Name identifying func.
+            func (Callable[[NDArray[np.number]], NDArray[np.number]]): Function to evaluate.
+            x (NDArray[np.number]): Points to evaluate it at.
+
+        Returns
+        -------
+            NDArray[np.number]: Values of func at x.
+        """
+        x_arr = np.asarray(x)
+        # Hashed through the buffer protocol, without copying the points
+        digest = hashlib.blake2b(np.ascontiguousarray(x_arr).data).hexdigest()
+        key = (name, x_arr.dtype.str, x_arr.shape, digest)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return cached
+            self._misses += 1
+
+        ans = np.asarray(func(x))
+        if ans.nbytes <= self._max_bytes:
+            # Only a copy owned by the cache is made read-only, never an array of the caller
+            ans = ans.copy()
+            ans.setflags(write=False)
+            with self._lock:
+                # Another thread may have stored the same evaluation in the meantime
+                if key not in self._entries:
+                    self._entries[key] = ans
+                    self._nbytes += ans.nbytes
+                    while self._nbytes > self._max_bytes:
+                        _, evicted = self._entries.popitem(last=False)
+                        self._nbytes -= evicted.nbytes
+
+        return ans
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Cache statistics.
+
+        Returns
+        -------
+            Dict[str, int]: Numbers of hits, misses and entries, and current and maximum
+                size in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "nbytes": self._nbytes,
+                "max_bytes": self._max_bytes,
+            }
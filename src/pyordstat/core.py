@@ -1,50 +1,302 @@
 """Core functionality for order statistics distributions."""
+from typing import Callable, Optional, Sequence, Tuple, Union
+
 import numpy as np
-from numpy.typing import NDArray
-from scipy.special import binom
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+from scipy.special import (
+    betainc,
+    betainccinv,
+    betaincinv,
+    betaln,
+    binom,
+    expit,
+    gammaln,
+    xlog1py,
+    xlogy,
+)
+
+from pyordstat.asymptotic import approx_cdf, approx_choice, approx_pdf
+from pyordstat.workspace import Workspace
+
+CDF_METHODS = ("beta", "sum", "approx", "auto")
+PDF_METHODS = ("beta", "approx", "auto")
+APPROX_TOL = 1e-6
+
+# Below this value the incomplete beta function is evaluated in log space by continued fraction
+_LOG_BETAINC_TINY = 1e-250
+_CF_MAXITER = 1000
+_CF_EPS = 1e-15
+_CF_FPMIN = 1e-300
+# Above this value the incomplete beta function is evaluated through its complement
+_LOG_BETAINC_SPLIT = 0.5
+
+# Largest sample size searched by `ordstat_sample_size`, below which floats are exact integers
+_MAX_SAMPLE_SIZE = 2.0**53
+
+IntOrArray = Union[int, ArrayLike]
+# Sample sizes and order statistics once validated and shaped by `broadcast_nk`
+IntOrIntArray = Union[int, NDArray[np.int_]]
+SizeLike = Optional[Union[int, Tuple[int, ...]]]
+SeedLike = Optional[Union[int, np.random.Generator]]
+
+
+def broadcast_nk(
+    n: IntOrArray, k: IntOrArray, ndim: int = 1
+) -> Tuple[IntOrIntArray, IntOrIntArray]:
+    """Validate sample sizes and order statistics and shape them for broadcasting.
+
+    Scalar n and k are returned unchanged. If either is an array, both are broadcast
+    together, flattened into a list of (n, k) pairs, and given ndim trailing unit axes,
+    so that they broadcast against values of the distribution functions of dimension
+    ndim and produce results of shape (n_k_pairs, *values.shape).
+
+    Args:
+        n (IntOrArray): Sample size(s).
+        k (IntOrArray): Order statistic(s).
+        ndim (int, optional): Number of dimensions of the values the order statistics
+            will be evaluated at. Defaults to 1.
+
+    Raises
+    ------
+        ValueError: If any k is not between 1 and n.
+
+    Returns
+    -------
+        Tuple[IntOrIntArray, IntOrIntArray]: Sample size(s) and order statistic(s).
+    """
+    if np.ndim(n) == 0 and np.ndim(k) == 0:
+        if (k <= 0) or (k > n):  # type: ignore[operator]
+            raise ValueError("k must be between 1 and n.")
+        return n, k  # type: ignore[return-value]
+
+    n_arr, k_arr = (a.ravel() for a in np.broadcast_arrays(np.asarray(n), np.asarray(k)))
+    if np.any((k_arr <= 0) | (k_arr > n_arr)):
+        raise ValueError("k must be between 1 and n.")
+
+    shape = (-1,) + (1,) * ndim
+    return n_arr.reshape(shape), k_arr.reshape(shape)
 
 
-def ordstat_pdf(
-    pdf: NDArray[np.number], cdf: NDArray[np.number], n: int, k: int
+def ordstat_pdf(  # noqa: PLR0913, PLR0917
+    pdf: NDArray[np.number],
+    cdf: NDArray[np.number],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+    method: str = "beta",
+    tol: float = APPROX_TOL,
+    dtype: Optional[DTypeLike] = None,
+    out: Optional[NDArray[np.number]] = None,
+    workspace: Optional[Workspace] = None,
 ) -> NDArray[np.number]:
     """Compute the k-th order statistic PDF of a sample of size n.
 
     Return the k-th order statistic probability density function of a sample of size n,
     given the values of PDF and CDF.
 
+    With any of dtype, out or workspace, the exact form is evaluated in place: in the
+    output array, at the precision of dtype, with a single temporary of the same size taken
+    from the workspace. Repeated calls with the same out and workspace then allocate
+    nothing but a few scalars per (n, k) pair.
+
     Args:
         pdf (NDArray[np.number]): Values of the PDF.
         cdf (NDArray[np.number]): Values of the CDF.
-        n (int): Sample size.
-        k (int): Order statistic to calculate.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+        method (str, optional): Either "beta" (exact), "approx" (asymptotic, see
+            `pyordstat.asymptotic`) or "auto" (asymptotic for the (n, k) pairs whose
+            estimated error is within tol, exact otherwise). Defaults to "beta".
+        tol (float, optional): Error tolerance for method "auto". Defaults to APPROX_TOL.
+        dtype (Optional[DTypeLike], optional): Data type to compute and return the result
+            in, for example np.float32. Defaults to None, for float64 or the dtype of out.
+        out (Optional[NDArray[np.number]], optional): Array to write the result into, of
+            the broadcast shape of the inputs. Defaults to None.
+        workspace (Optional[Workspace], optional): Workspace to take temporaries from.
+            Defaults to None.
+
+    Raises
+    ------
+        ValueError: If the method is not recognised.
 
     Returns
     -------
         NDArray[np.number]: Order statistic PDF.
     """
-    return k * binom(n, k) * (cdf ** (k - 1)) * ((1 - cdf) ** (n - k)) * pdf
+    if method not in PDF_METHODS:
+        raise ValueError(f"Unknown method {method!r}; must be one of {PDF_METHODS}.")
 
+    in_place = dtype is not None or out is not None or workspace is not None
 
-def ordstat_cdf(cdf: NDArray[np.number], n: int, k: int) -> NDArray[np.number]:
+    def exact() -> NDArray[np.number]:
+        if in_place:
+            return _ordstat_pdf_inplace(pdf, cdf, n, k, dtype, out, workspace)
+        return k * binom(n, k) * (cdf ** (k - 1)) * ((1 - cdf) ** (n - k)) * pdf
+
+    def approx() -> NDArray[np.number]:
+        return approx_pdf(pdf, cdf, n, k)
+
+    return _store(_select_method(method, exact, approx, n, k, tol), dtype, out)
+
+
+def ordstat_cdf(  # noqa: PLR0913, PLR0917
+    cdf: NDArray[np.number],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+    method: str = "beta",
+    tol: float = APPROX_TOL,
+    dtype: Optional[DTypeLike] = None,
+    out: Optional[NDArray[np.number]] = None,
+) -> NDArray[np.number]:
     """Compute the k-th order statistic CDF of a sample of size n.
 
     Return the k-th order statistic cumulative distribution function of a sample of size n,
     given the values of CDF.
 
+    By default this uses the identity between the order statistic CDF and the regularized
+    incomplete beta function, I_F(k, n-k+1), which costs O(len(cdf)) regardless of n.
+    The explicit binomial summation is kept available as method "sum" for cross-checking.
+    For very large samples, the asymptotic approximations of `pyordstat.asymptotic` are
+    available as method "approx", or as method "auto" to use them only for the (n, k)
+    pairs whose estimated error is within tol.
+
+    Method "beta" writes straight into out, at the precision of dtype, without temporaries
+    the size of the result. CDF values rounded just outside [0, 1], where the incomplete
+    beta function is not defined, are clipped into it.
+
     Args:
         cdf (NDArray[np.number]): Values of the CDF.
-        n (int): Sample size.
-        k (int): Order statistic to calculate.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+        method (str, optional): One of "beta" (incomplete beta function), "sum" (explicit
+            binomial summation), "approx" or "auto". Defaults to "beta".
+        tol (float, optional): Error tolerance for method "auto". Defaults to APPROX_TOL.
+        dtype (Optional[DTypeLike], optional): Data type to compute and return the result
+            in, for example np.float32. Defaults to None, for float64 or the dtype of out.
+        out (Optional[NDArray[np.number]], optional): Array to write the result into, of
+            the broadcast shape of the inputs. Defaults to None.
+
+    Raises
+    ------
+        ValueError: If the method is not recognised.
 
     Returns
     -------
         NDArray[np.number]: Order statistic CDF.
     """
+    if method != "sum":
+        cdf = _clip_probabilities(cdf)
+    if method == "beta":
+        if dtype is None and out is None:
+            return betainc(k, n - k + 1, cdf)
+        return betainc(k, n - k + 1, cdf, out=out, dtype=_result_dtype(dtype, out))
+    if method == "sum":
+        return _store(_ordstat_cdf_sum(cdf, n, k), dtype, out)
+    if method in ("approx", "auto"):
+        ans = _select_method(
+            method, lambda: betainc(k, n - k + 1, cdf), lambda: approx_cdf(cdf, n, k), n, k, tol
+        )
+        return _store(ans, dtype, out)
+
+    raise ValueError(f"Unknown method {method!r}; must be one of {CDF_METHODS}.")
+
+
+def _clip_probabilities(p: NDArray[np.number]) -> NDArray[np.number]:
+    """Clip probabilities into [0, 1], copying them only if some are outside."""
+    p = np.asarray(p)
+    if p.size > 0 and (np.min(p) < 0 or np.max(p) > 1):
+        return np.clip(p, 0.0, 1.0)
+    return p
+
+
+def _result_dtype(dtype: Optional[DTypeLike], out: Optional[NDArray[np.number]]) -> np.dtype:
+    """Return the data type of a result, from the requested dtype or else the output array."""
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.dtype(np.float64) if out is None else out.dtype
+
+
+def _store(
+    ans: NDArray[np.number],
+    dtype: Optional[DTypeLike],
+    out: Optional[NDArray[np.number]],
+) -> NDArray[np.number]:
+    """Return a result in the requested dtype, written into out if given."""
+    if out is not None:
+        if ans is not out:
+            out[...] = ans
+        return out
+    if dtype is not None:
+        return np.asarray(ans).astype(dtype, copy=False)
+    return ans
+
+
+def _ordstat_pdf_inplace(  # noqa: PLR0913, PLR0917
+    pdf: NDArray[np.number],
+    cdf: NDArray[np.number],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+    dtype: Optional[DTypeLike],
+    out: Optional[NDArray[np.number]],
+    workspace: Optional[Workspace],
+) -> NDArray[np.number]:
+    """Compute k C(n, k) F^(k-1) (1-F)^(n-k) f in out, with one temporary."""
+    dtype = _result_dtype(dtype, out)
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(pdf), np.shape(cdf), np.shape(n), np.shape(k))
+        out = np.empty(shape, dtype=dtype)
+    if workspace is None:
+        work = np.empty(out.shape, dtype=dtype)
+    else:
+        work = workspace.get("ordstat_pdf", out.shape, dtype)
+
+    np.power(cdf, k - 1, out=out, dtype=dtype)
+    np.subtract(1, cdf, out=work, dtype=dtype)
+    np.power(work, n - k, out=work, dtype=dtype)
+    np.multiply(out, work, out=out, dtype=dtype)
+    np.multiply(out, pdf, out=out, dtype=dtype)
+    np.multiply(out, k * binom(n, k), out=out, dtype=dtype)
+
+    return out
+
+
+def _select_method(  # noqa: PLR0913, PLR0917
+    method: str,
+    exact: Callable[[], NDArray[np.number]],
+    approx: Callable[[], NDArray[np.number]],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+    tol: float,
+) -> NDArray[np.number]:
+    """Evaluate the exact or asymptotic form, or each where accurate enough for "auto"."""
+    if method == "beta":
+        return exact()
+    if method == "approx":
+        return approx()
+
+    accurate = approx_choice(n, k)[1] <= tol
+    if np.all(accurate):
+        return approx()
+    if not np.any(accurate):
+        return exact()
+    return np.where(accurate, approx(), exact())
+
+
+def _ordstat_cdf_sum(
+    cdf: NDArray[np.number], n: IntOrIntArray, k: IntOrIntArray
+) -> NDArray[np.number]:
+    """Compute the k-th order statistic CDF by explicit binomial summation."""
+    if np.ndim(n) > 0 or np.ndim(k) > 0:
+        # Batches of (n, k) pairs are summed one pair at a time
+        n_arr, k_arr = np.broadcast_arrays(n, k)
+        shape = np.broadcast_shapes(n_arr.shape, np.shape(cdf))
+        values = [_ordstat_cdf_sum(cdf, int(ni), int(ki)) for ni, ki in zip(n_arr.flat, k_arr.flat)]
+        return np.reshape(values, shape)
+
     if k == 1:
         # Special case
         return 1 - (1 - cdf) ** n
 
-    j = np.arange(k, n + 1)
+    j = np.arange(int(k), int(n) + 1)
     bc = binom(n, j)
     is_scalar = np.isscalar(cdf)
     cdf = np.atleast_1d(cdf)
@@ -57,3 +309,506 @@ def ordstat_cdf(cdf: NDArray[np.number], n: int, k: int) -> NDArray[np.number]:
         return ans[0]
 
     return ans
+
+
+def check_ij(n: int, i: int, j: int) -> None:
+    """Validate a pair of order statistics i < j of a sample of size n.
+
+    Args:
+        n (int): Sample size.
+        i (int): Lower order statistic.
+        j (int): Upper order statistic.
+
+    Raises
+    ------
+        ValueError: If not 1 <= i < j <= n.
+    """
+    if not 1 <= i < j <= n:
+        raise ValueError("i and j must satisfy 1 <= i < j <= n.")
+
+
+def ordstat_joint_pdf(  # noqa: PLR0913, PLR0917
+    pdf_x: NDArray[np.number],
+    cdf_x: NDArray[np.number],
+    pdf_y: NDArray[np.number],
+    cdf_y: NDArray[np.number],
+    n: int,
+    i: int,
+    j: int,
+) -> NDArray[np.number]:
+    """Compute the joint PDF of the i-th and j-th order statistics of a sample of size n.
+
+    The values at x and at y broadcast against each other, so passing them along different
+    axes evaluates the PDF on a grid. The PDF is zero wherever cdf_y <= cdf_x.
+
+    Args:
+        pdf_x (NDArray[np.number]): Values of the PDF at x.
+        cdf_x (NDArray[np.number]): Values of the CDF at x.
+        pdf_y (NDArray[np.number]): Values of the PDF at y.
+        cdf_y (NDArray[np.number]): Values of the CDF at y.
+        n (int): Sample size.
+        i (int): Lower order statistic.
+        j (int): Upper order statistic.
+
+    Raises
+    ------
+        ValueError: If not 1 <= i < j <= n.
+
+    Returns
+    -------
+        NDArray[np.number]: Joint PDF of (X_(i), X_(j)) at (x, y).
+    """
+    check_ij(n, i, j)
+    log_c = gammaln(n + 1) - gammaln(i) - gammaln(j - i) - gammaln(n - j + 1)
+    between = np.subtract(cdf_y, cdf_x)
+
+    with np.errstate(invalid="ignore"):
+        log_p = xlogy(i - 1, cdf_x) + xlogy(j - i - 1, between) + xlog1py(n - j, -cdf_y)
+        return np.where(between > 0, np.exp(log_c + log_p) * pdf_x * pdf_y, 0.0)
+
+
+def ordstat_joint_cdf(
+    cdf_x: NDArray[np.number], cdf_y: NDArray[np.number], n: int, i: int, j: int
+) -> NDArray[np.number]:
+    """Compute the joint CDF of the i-th and j-th order statistics of a sample of size n.
+
+    P(X_(i) <= x, X_(j) <= y) is the CDF of X_(j) at y, minus the probability that fewer than
+    i samples are at most x while at least j are at most y. The latter is summed over the
+    number r < i of samples at most x, using the incomplete beta function for the samples
+    between x and y, so the cost is O(i) per point regardless of n.
+
+    Args:
+        cdf_x (NDArray[np.number]): Values of the CDF at x.
+        cdf_y (NDArray[np.number]): Values of the CDF at y.
+        n (int): Sample size.
+        i (int): Lower order statistic.
+        j (int): Upper order statistic.
+
+    Raises
+    ------
+        ValueError: If not 1 <= i < j <= n.
+
+    Returns
+    -------
+        NDArray[np.number]: Joint CDF of (X_(i), X_(j)) at (x, y).
+    """
+    check_ij(n, i, j)
+    cdf_x, cdf_y = np.broadcast_arrays(np.asarray(cdf_x, dtype=float), cdf_y)
+    sf_x = 1 - cdf_x
+
+    # Probability that a sample above x is at most y
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = np.clip(np.where(sf_x > 0, (cdf_y - cdf_x) / sf_x, 0.0), 0.0, 1.0)
+
+    ans = betainc(j, n - j + 1, cdf_y)
+    for r in range(i):
+        log_pmf = gammaln(n + 1) - gammaln(r + 1) - gammaln(n - r + 1)
+        pmf = np.exp(log_pmf + xlogy(r, cdf_x) + xlog1py(n - r, -cdf_x))
+        ans = ans - pmf * betainc(j - r, n - j + 1, q)
+
+    return np.clip(ans, 0.0, 1.0)
+
+
+def ordstat_quantile_level(
+    q: NDArray[np.number], n: IntOrIntArray, k: IntOrIntArray, upper: bool = False
+) -> NDArray[np.number]:
+    """Compute the parent CDF level at which the k-th order statistic has a given quantile.
+
+    The k-th order statistic of a sample of size n is distributed as the parent quantile
+    function applied to a Beta(k, n-k+1) variable, so its quantile q is the parent quantile
+    of the returned level. With upper=True, q is an upper tail probability (as for an
+    inverse survival function) instead.
+
+    Args:
+        q (NDArray[np.number]): Probabilities.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+        upper (bool, optional): Whether q is an upper tail probability. Defaults to False.
+
+    Returns
+    -------
+        NDArray[np.number]: Parent CDF levels.
+    """
+    if upper:
+        return betainccinv(k, n - k + 1, q)
+
+    return betaincinv(k, n - k + 1, q)
+
+
+def ordstat_sample_size(p: ArrayLike, q: ArrayLike, k: IntOrArray = 1) -> NDArray[np.floating]:
+    """Compute the smallest sample sizes at which the k-th order statistic is at most t.
+
+    Given the parent CDF p = F(t) at a threshold t, P(X_(k) <= t) = I_p(k, n-k+1) is the
+    probability that at least k of n samples are at most t, which grows with n. The
+    smallest n at which it reaches q is bracketed by doubling n and then found by
+    bisection, with one incomplete beta evaluation per candidate and no further parent
+    evaluations. Given the parent survival function at t instead, this is the smallest n
+    at which the k-th largest value exceeds t with probability at least q.
+
+    Args:
+        p (ArrayLike): Parent CDF at the thresholds.
+        q (ArrayLike): Target probabilities.
+        k (IntOrArray, optional): Order statistics. Defaults to 1.
+
+    Raises
+    ------
+        ValueError: If any k is less than 1.
+
+    Returns
+    -------
+        NDArray[np.floating]: Sample sizes, broadcast over p, q and k, as floats; inf where
+            no sample size up to 2**53 reaches the target, for example where p = 0.
+    """
+    p, q, k = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (p, q, k)))
+    if np.any(k < 1):
+        raise ValueError("k must be at least 1.")
+
+    def reached(n: NDArray[np.floating]) -> NDArray[np.bool_]:
+        return betainc(k, n - k + 1, p) >= q
+
+    # Bracket the answer in (lo, hi], doubling hi until the target is reached
+    lo, hi = k - 1, k.copy()
+    searching = ~reached(hi)
+    while np.any(searching):
+        lo = np.where(searching, hi, lo)
+        hi = np.where(searching, 2 * hi, hi)
+        searching &= (hi <= _MAX_SAMPLE_SIZE) & ~reached(hi)
+
+    unreachable = ~reached(hi)
+    while np.any(open_ := (hi - lo > 1) & ~unreachable):
+        mid = np.floor((lo + hi) / 2)
+        below = reached(mid)
+        hi = np.where(open_ & below, mid, hi)
+        lo = np.where(open_ & ~below, mid, lo)
+
+    return np.where(unreachable, np.inf, hi)
+
+
+def ordstat_rank(p: ArrayLike, q: ArrayLike, n: IntOrArray) -> NDArray[np.int_]:
+    """Compute the largest order statistics that are at most t with a given probability.
+
+    Given the parent CDF p = F(t) at a threshold t, P(X_(k) <= t) = I_p(k, n-k+1) falls
+    as k grows, and the largest k at which it is at least q is found by bisection over k,
+    with one incomplete beta evaluation per candidate. Given the parent survival function
+    at t instead, k counts from the largest value, and X_(n-k+1) exceeds t with
+    probability at least q.
+
+    Args:
+        p (ArrayLike): Parent CDF at the thresholds.
+        q (ArrayLike): Target probabilities.
+        n (IntOrArray): Sample sizes.
+
+    Raises
+    ------
+        ValueError: If any n is less than 1.
+
+    Returns
+    -------
+        NDArray[np.int_]: Order statistics, broadcast over p, q and n; 0 where even the
+            smallest value does not reach the target.
+    """
+    p, q, n = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (p, q, n)))
+    if np.any(n < 1):
+        raise ValueError("n must be at least 1.")
+
+    # The answer is in [lo, hi): lo reaches the target (trivially for k = 0), hi does not
+    lo, hi = np.zeros_like(n), n + 1
+    while np.any(open_ := hi - lo > 1):
+        mid = np.floor((lo + hi) / 2)
+        with np.errstate(invalid="ignore"):
+            above = open_ & (betainc(np.maximum(mid, 1), n - mid + 1, p) >= q)
+        lo = np.where(above, mid, lo)
+        hi = np.where(open_ & ~above, mid, hi)
+
+    return lo.astype(np.int_)
+
+
+def ordstat_quadrature(
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+    step: float = 0.125,
+    t_max: float = 4.0,
+    level: Optional[NDArray[np.number]] = None,
+) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Quadrature nodes and weights for expectations over the k-th order statistic.
+
+    Expectations are integrals over the probability q of the order statistic; the nodes
+    are placed with the tanh-sinh rule in q, which copes with the integrable singularities
+    that parent quantile functions usually have at q = 0 and q = 1, and are then mapped to
+    parent CDF levels u through the inverse incomplete beta function. The expectation of
+    g(X_(k)) is then sum(weights * g(ppf(u))). The upper half of the nodes is mapped from
+    the complementary probability, to keep resolution close to u = 1.
+
+    Args:
+        n (IntOrIntArray): Sample size(s), already broadcast with `broadcast_nk`.
+        k (IntOrIntArray): Order statistic(s), already broadcast with `broadcast_nk`.
+        step (float, optional): Step of the tanh-sinh rule. Defaults to 0.125.
+        t_max (float, optional): Truncation of the tanh-sinh rule. Defaults to 4.0.
+        level (Optional[NDArray[np.number]], optional): If given, the expectation is only
+            taken over u <= level, for integrands that are not smooth beyond it. The result
+            then gets the shape of level before the nodes axis. Defaults to None.
+
+    Returns
+    -------
+        Tuple[NDArray[np.floating], NDArray[np.floating]]: Parent CDF levels, of shape
+            (*np.shape(n)[:-1], n_nodes) (or (n_nodes,) for scalars), and weights.
+    """
+    t = np.arange(-t_max, t_max + step / 2, step)
+    s = np.pi / 2 * np.sinh(t)
+    q = expit(2 * s)
+    qc = expit(-2 * s)
+    weights = step * np.pi * np.cosh(t) * q * qc
+
+    if level is not None:
+        mass = betainc(k, n - k + 1, np.asarray(level)[..., None])
+        return betaincinv(k, n - k + 1, mass * q), mass * weights
+
+    u = np.where(t <= 0, betaincinv(k, n - k + 1, q), betainccinv(k, n - k + 1, qc))
+
+    return u, weights
+
+
+def ordstat_uniform_rvs(
+    n: IntOrArray, k: IntOrArray, size: SizeLike = None, random_state: SeedLike = None
+) -> NDArray[np.floating]:
+    """Draw the k-th order statistic of samples of size n from the standard uniform distribution.
+
+    Each draw is a single Beta(k, n-k+1) variate, so its cost does not depend on n. If n or k
+    are arrays they are broadcast into a list of (n, k) pairs, and the result has shape
+    (n_k_pairs, *size).
+
+    Args:
+        n (IntOrArray): Sample size, or an array of them.
+        k (IntOrArray): Order statistic, or an array of them.
+        size (SizeLike, optional): Number or shape of draws. Defaults to None.
+        random_state (SeedLike, optional): Seed or random number generator.
+            Defaults to None.
+
+    Returns
+    -------
+        NDArray[np.floating]: Uniform order statistic variates.
+    """
+    rng = np.random.default_rng(random_state)
+    shape = () if size is None else tuple(np.atleast_1d(size))
+    n, k = broadcast_nk(n, k, len(shape))
+    if np.ndim(n) > 0:
+        shape = (np.shape(n)[0], *shape)
+
+    return rng.beta(k, n - k + 1, size=shape if shape else None)
+
+
+def ordstat_joint_uniform_rvs(
+    n: int, ks: Sequence[int], size: SizeLike = None, random_state: SeedLike = None
+) -> NDArray[np.floating]:
+    """Draw several order statistics of the same standard uniform samples of size n.
+
+    Uses the representation of uniform order statistics as normalised partial sums of n+1
+    exponential spacings; the spacings between the requested order statistics are summed
+    directly as gamma variates, so each draw costs O(len(ks)) regardless of n.
+
+    Args:
+        n (int): Sample size.
+        ks (Sequence[int]): Strictly increasing order statistics to draw.
+        size (SizeLike, optional): Number or shape of draws. Defaults to None.
+        random_state (SeedLike, optional): Seed or random number generator.
+            Defaults to None.
+
+    Raises
+    ------
+        ValueError: If ks are not strictly increasing and between 1 and n.
+
+    Returns
+    -------
+        NDArray[np.floating]: Uniform order statistic variates, of shape (*size, len(ks)).
+    """
+    ks_arr = np.asarray(ks)
+    if ks_arr.ndim != 1 or len(ks_arr) == 0 or np.any(np.diff(ks_arr) <= 0):
+        raise ValueError("ks must be a non-empty, strictly increasing sequence.")
+    broadcast_nk(n, ks_arr)
+
+    rng = np.random.default_rng(random_state)
+    shape = () if size is None else tuple(np.atleast_1d(size))
+    gaps = np.diff(ks_arr, prepend=0, append=n + 1)
+    sums = np.cumsum(rng.standard_gamma(gaps, size=(*shape, len(gaps))), axis=-1)
+
+    return sums[..., :-1] / sums[..., -1:]
+
+
+def ordstat_logpdf(
+    logpdf: NDArray[np.number],
+    logcdf: NDArray[np.number],
+    logsf: NDArray[np.number],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+) -> NDArray[np.number]:
+    """Compute the logarithm of the k-th order statistic PDF of a sample of size n.
+
+    Works entirely in log space, so that it stays finite for sample sizes where the binomial
+    coefficient overflows and the powers of the CDF underflow.
+
+    Args:
+        logpdf (NDArray[np.number]): Values of the log PDF.
+        logcdf (NDArray[np.number]): Values of the log CDF.
+        logsf (NDArray[np.number]): Values of the log survival function, log(1-CDF).
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+
+    Returns
+    -------
+        NDArray[np.number]: Order statistic log PDF.
+    """
+    # k * binom(n, k) = 1 / B(k, n-k+1)
+    return -betaln(k, n - k + 1) + _xlogv(k - 1, logcdf) + _xlogv(n - k, logsf) + logpdf
+
+
+def ordstat_logcdf(
+    logcdf: NDArray[np.number], logsf: NDArray[np.number], n: IntOrIntArray, k: IntOrIntArray
+) -> NDArray[np.number]:
+    """Compute the logarithm of the k-th order statistic CDF of a sample of size n.
+
+    Args:
+        logcdf (NDArray[np.number]): Values of the log CDF.
+        logsf (NDArray[np.number]): Values of the log survival function, log(1-CDF).
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+
+    Returns
+    -------
+        NDArray[np.number]: Order statistic log CDF.
+    """
+    return _log_betainc(k, n - k + 1, logcdf, logsf)
+
+
+def ordstat_logsf(
+    logcdf: NDArray[np.number], logsf: NDArray[np.number], n: IntOrIntArray, k: IntOrIntArray
+) -> NDArray[np.number]:
+    """Compute the logarithm of the k-th order statistic survival function of a sample of size n.
+
+    Args:
+        logcdf (NDArray[np.number]): Values of the log CDF.
+        logsf (NDArray[np.number]): Values of the log survival function, log(1-CDF).
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+
+    Returns
+    -------
+        NDArray[np.number]: Order statistic log survival function.
+    """
+    # P(X_(k) > x) = I_{1-F}(n-k+1, k)
+    return _log_betainc(n - k + 1, k, logsf, logcdf)
+
+
+def ordstat_logpmf(  # noqa: PLR0913, PLR0917
+    logcdf: NDArray[np.number],
+    logsf: NDArray[np.number],
+    logcdf_prev: NDArray[np.number],
+    logsf_prev: NDArray[np.number],
+    n: IntOrIntArray,
+    k: IntOrIntArray,
+) -> NDArray[np.number]:
+    """Compute the logarithm of the k-th order statistic PMF of a sample of size n.
+
+    The PMF at a point is the difference between the order statistic CDF at that point and
+    at the previous point of the support; the difference is taken in log space, on the CDF
+    in the left half of the distribution and on the survival function in the right half.
+
+    Args:
+        logcdf (NDArray[np.number]): Values of the log CDF at the points.
+        logsf (NDArray[np.number]): Values of the log survival function at the points.
+        logcdf_prev (NDArray[np.number]): Values of the log CDF at the previous points.
+        logsf_prev (NDArray[np.number]): Values of the log survival function at the
+            previous points.
+        n (IntOrIntArray): Sample size(s).
+        k (IntOrIntArray): Order statistic(s) to calculate.
+
+    Returns
+    -------
+        NDArray[np.number]: Order statistic log PMF.
+    """
+    lcdf = ordstat_logcdf(logcdf, logsf, n, k)
+    lcdf_prev = ordstat_logcdf(logcdf_prev, logsf_prev, n, k)
+    lsf = ordstat_logsf(logcdf, logsf, n, k)
+    lsf_prev = ordstat_logsf(logcdf_prev, logsf_prev, n, k)
+
+    return np.where(lcdf < -np.log(2), _logsubexp(lcdf, lcdf_prev), _logsubexp(lsf_prev, lsf))
+
+
+def _xlogv(a: IntOrIntArray, logv: NDArray[np.number]) -> NDArray[np.number]:
+    """Compute a * log(v) given log(v), with the convention 0 * log(0) = 0."""
+    with np.errstate(invalid="ignore"):
+        return np.where(a == 0, 0.0, a * logv)
+
+
+def _logsubexp(la: NDArray[np.number], lb: NDArray[np.number]) -> NDArray[np.number]:
+    """Compute log(exp(la) - exp(lb)) for la >= lb."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(la == -np.inf, -np.inf, la + np.log1p(-np.exp(lb - la)))
+
+
+def _log_betainc(
+    a: IntOrIntArray,
+    b: IntOrIntArray,
+    logx: NDArray[np.number],
+    log1mx: NDArray[np.number],
+) -> NDArray[np.number]:
+    """Compute log I_x(a, b) given log(x) and log(1-x).
+
+    Uses the incomplete beta function where it does not underflow, its complement where the
+    result is close to one, and a continued fraction in log space in the far left tail.
+    """
+    a, b, logx, log1mx = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (a, b, logx, log1mx))
+    )
+    x = np.exp(logx)
+    lower = betainc(a, b, x)
+    upper = betainc(b, a, np.exp(log1mx))
+
+    with np.errstate(divide="ignore"):
+        ans = np.where(lower < _LOG_BETAINC_SPLIT, np.log(lower), np.log1p(-upper))
+
+    tail = (lower < _LOG_BETAINC_TINY) & (x > 0)
+    if np.any(tail):
+        ans[tail] = _log_betainc_cf(a[tail], b[tail], logx[tail], log1mx[tail])
+
+    if ans.ndim == 0:
+        return ans[()]
+
+    return ans
+
+
+def _log_betainc_cf(
+    a: NDArray[np.number],
+    b: NDArray[np.number],
+    logx: NDArray[np.number],
+    log1mx: NDArray[np.number],
+) -> NDArray[np.number]:
+    """Compute log I_x(a, b) with the modified Lentz continued fraction.
+
+    Only valid (and only used) for x < (a+1)/(a+b+2), where the fraction converges quickly.
+    """
+    x = np.exp(logx)
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+
+    def _clip(v: NDArray[np.number]) -> NDArray[np.number]:
+        return np.where(np.abs(v) < _CF_FPMIN, _CF_FPMIN, v)
+
+    c = np.ones_like(x)
+    d = 1 / _clip(1 - qab * x / qap)
+    h = d
+    for m in range(1, _CF_MAXITER + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 / _clip(1 + aa * d)
+        c = _clip(1 + aa / c)
+        h = h * d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 / _clip(1 + aa * d)
+        c = _clip(1 + aa / c)
+        delta = d * c
+        h = h * delta
+        if np.all(np.abs(delta - 1) < _CF_EPS):
+            break
+
+    return a * logx + b * log1mx - np.log(a) - betaln(a, b) + np.log(h)
@@ -1,21 +1,52 @@
 """Order statistics for discrete distributions of known PMF and CDF."""
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, cast
 
 import numpy as np
 from numpy.typing import NDArray
 
-from pyordstat.base import BaseOrderStatistics, CallableDistrFunc
-from pyordstat.core import ordstat_cdf
+from pyordstat.base import BaseOrderStatistics, BatchedDistrFunc, CallableDistrFunc
+from pyordstat.core import (
+    IntOrArray,
+    broadcast_nk,
+    ordstat_cdf,
+    ordstat_logcdf,
+    ordstat_logpmf,
+    ordstat_logsf,
+    ordstat_quantile_level,
+)
+
+if TYPE_CHECKING:
+    # scipy.stats is slow to import, and only needed for SciPy distributions
+    from scipy.stats.distributions import rv_frozen
+
+# The exponential search for the support spans the integers of magnitude below 2**_SEARCH_BITS
+_SEARCH_BITS = 62
 
 
 class DiscreteOrderStatistics(BaseOrderStatistics):
-    """Discrete order statistics."""
+    """Discrete order statistics.
+
+    All order statistic methods accept either scalar n and k or arrays of them. Arrays are
+    broadcast together into a list of (n, k) pairs and the result has shape
+    (n_k_pairs, *x.shape), or (n_k_pairs, *batch_shape, *x.shape) for a batch of parents
+    with array parameters, with the parent CDF evaluated only once per set of points.
+    """
 
     _pdf: CallableDistrFunc
     _cdf: CallableDistrFunc
+    _isf: Optional[CallableDistrFunc]
+
+    truncation_eps: float = 1e-14
+    """Probability mass left out of the support when summing over unbounded supports."""
 
     def __init__(
-        self, pmf: CallableDistrFunc, cdf: CallableDistrFunc, *args: Any, **kwargs: Any
+        self,
+        pmf: CallableDistrFunc,
+        cdf: CallableDistrFunc,
+        *args: Any,
+        ppf: Optional[CallableDistrFunc] = None,
+        isf: Optional[CallableDistrFunc] = None,
+        **kwargs: Any,
     ) -> None:
         """Initialize discrete order statistics.
 
@@ -23,19 +54,25 @@ class DiscreteOrderStatistics(BaseOrderStatistics):
             pmf (CallableDistrFunc): Probability mass function of the distribution.
             cdf (CallableDistrFunc): Cumulative distribution function of the distribution.
             *args (Any): Additional arguments to be passed to the PMF and CDF.
+            ppf (Optional[CallableDistrFunc], optional): Percent point (quantile) function of
+                the distribution, taking the same additional arguments. Required for
+                quantiles of the order statistics. Defaults to None.
+            isf (Optional[CallableDistrFunc], optional): Inverse survival function of the
+                distribution, taking the same additional arguments. Used to bound the
+                support of the largest order statistics accurately. Defaults to None.
             **kwargs (Any): Additional keyword arguments to be passed to the PMF and CDF.
+                Array arguments define a batch of parents, evaluated together (see
+                `batch_shape`).
         """
-
-        def bundled_pmf(x: NDArray[np.number]) -> NDArray[np.number]:
-            return pmf(x, *args, **kwargs)
-
-        def bundled_cdf(x: NDArray[np.number]) -> NDArray[np.number]:
-            return cdf(x, *args, **kwargs)
+        bundled_ppf = None if ppf is None else BatchedDistrFunc(ppf, *args, **kwargs)
+        bundled_isf = None if isf is None else BatchedDistrFunc(isf, *args, **kwargs)
 
         super().__init__(
-            cast(CallableDistrFunc, bundled_pmf),
-            cast(CallableDistrFunc, bundled_cdf),
+            cast(CallableDistrFunc, BatchedDistrFunc(pmf, *args, **kwargs)),
+            cast(CallableDistrFunc, BatchedDistrFunc(cdf, *args, **kwargs)),
+            cast(Optional[CallableDistrFunc], bundled_ppf),
         )
+        self._isf = cast(Optional[CallableDistrFunc], bundled_isf)
 
     @property
     def pdf(self) -> CallableDistrFunc:
@@ -47,7 +84,36 @@ class DiscreteOrderStatistics(BaseOrderStatistics):
         """Probability mass function of order statistics."""
         return self._pdf
 
-    def order_statistic_pmf(self, x: NDArray[np.number], n: int, k: int) -> NDArray[np.number]:
+    def parent_logcdf_logsf(
+        self, x: NDArray[np.number]
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Logarithms of the parent cumulative distribution and survival functions.
+
+        Subclasses with access to a more accurate log CDF and log survival function
+        should override this.
+
+        Args:
+            x (NDArray[np.number]): Values to evaluate the functions at.
+
+        Returns
+        -------
+            Tuple[NDArray[np.number], NDArray[np.number]]: Log CDF and log survival function
+                values.
+        """
+        cdf_vals = self._eval_cdf(x)
+        with np.errstate(divide="ignore"):
+            return np.log(cdf_vals), np.log1p(-cdf_vals)
+
+    def _parent_cdf_sf(
+        self, x: NDArray[np.number]
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Parent CDF and survival function at x, accurate in the tails if the logs are."""
+        logcdf, logsf = self.parent_logcdf_logsf(x)
+        return np.exp(logcdf), np.exp(logsf)
+
+    def order_statistic_pmf(
+        self, x: NDArray[np.number], n: IntOrArray, k: IntOrArray, method: str = "beta"
+    ) -> NDArray[np.number]:
         """Calculate the k-th order statistic PMF of a sample of size n.
 
         Return the k-th order statistic probability mass function of a sample of size n
@@ -55,19 +121,90 @@ class DiscreteOrderStatistics(BaseOrderStatistics):
 
         Args:
             x (NDArray[np.number]): Values to evaluate the PMF at.
-            n (int): Sample size.
-            k (int): Order statistic.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
 
         Returns
         -------
             NDArray[np.number]: PMF values.
         """
-        cdf_1 = self.order_statistic_cdf(x, n, k)
-        cdf_0 = self.order_statistic_cdf(x - 1, n, k)
+        x = np.asarray(x, dtype=int)
+        n, k = self._broadcast_nk(n, k)
+
+        # The parent CDF is evaluated once, on the union of x and x - 1
+        points, i_1, i_0 = _union_with_previous(x)
+        cdf = ordstat_cdf(self._eval_cdf(points), n, k, method=method, tol=self.approx_tol)
 
-        return cdf_1 - cdf_0
+        return cdf[..., i_1] - cdf[..., i_0]
 
-    def order_statistic_cdf(self, x: NDArray[np.number], n: int, k: int) -> NDArray[np.number]:
+    def order_statistic_pmf_range(
+        self, lo: int, hi: int, n: IntOrArray, k: IntOrArray, method: str = "beta"
+    ) -> NDArray[np.number]:
+        """Calculate the k-th order statistic PMF over a whole integer range.
+
+        Return the k-th order statistic probability mass function at every integer from lo
+        to hi (inclusive), from a single cumulative pass over lo - 1, ..., hi.
+
+        Args:
+            lo (int): First value of the range.
+            hi (int): Last value of the range.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
+
+        Returns
+        -------
+            NDArray[np.number]: PMF values at lo, ..., hi.
+        """
+        n, k = self._broadcast_nk(n, k)
+        cdf_vals = self._eval_cdf(np.arange(lo - 1, hi + 1))
+        cdf = ordstat_cdf(cdf_vals, n, k, method=method, tol=self.approx_tol)
+
+        return np.diff(cdf, axis=-1)
+
+    def order_statistic_pmf_truncated(
+        self, n: IntOrArray, k: IntOrArray, eps: Optional[float] = None, method: str = "beta"
+    ) -> Tuple[NDArray[np.int_], NDArray[np.number]]:
+        """Calculate the k-th order statistic PMF over all but eps of its mass.
+
+        The integer range runs from the order statistic quantile at eps / 2 to the one at
+        1 - eps / 2. The lower end is found through the parent quantile function if known,
+        and the upper end through the parent inverse survival function if known, so that
+        it stays accurate for the largest values of large samples. Otherwise, they are
+        found by exponential searches on the parent CDF and survival function. The PMF is then evaluated over the
+        range with `order_statistic_pmf_range`. The result is a compact table that later
+        queries can use without calling the parent again, for example as
+        `FiniteOrderStatistics(x, pmf)`.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            eps (Optional[float], optional): Probability mass left out, split between the
+                two tails. Defaults to None, for `truncation_eps`.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n, or the support cannot be bracketed.
+
+        Returns
+        -------
+            Tuple[NDArray[np.int_], NDArray[np.number]]: Values of the range, and PMF values
+                at them, covering at least 1 - eps of the mass of every requested order
+                statistic.
+        """
+        eps = self.truncation_eps if eps is None else eps
+        lo, hi = self._order_statistic_support(n, k, eps)
+
+        return np.arange(lo, hi + 1), self.order_statistic_pmf_range(lo, hi, n, k, method)
+
+    def order_statistic_cdf(
+        self, x: NDArray[np.number], n: IntOrArray, k: IntOrArray, method: str = "beta"
+    ) -> NDArray[np.number]:
         """Calculate the k-th order statistic CDF of a sample of size n.
 
         Return the k-th order statistic cumulative distribution function of a sample of size n
@@ -75,8 +212,10 @@ class DiscreteOrderStatistics(BaseOrderStatistics):
 
         Args:
             x (NDArray[np.number]): Values to evaluate the CDF at.
-            n (int): Sample size.
-            k (int): Order statistic.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
 
         Returns
         -------
@@ -84,5 +223,177 @@ class DiscreteOrderStatistics(BaseOrderStatistics):
         """
         # Guarantee that x are integers
         x = np.asarray(x, dtype=int)
-        cdf = self._cdf(x)
-        return ordstat_cdf(cdf, n, k)
+        n, k = self._broadcast_nk(n, k, x.ndim)
+        cdf = self._eval_cdf(x)
+        return ordstat_cdf(cdf, n, k, method=method, tol=self.approx_tol)
+
+    def order_statistic_logpmf(
+        self, x: NDArray[np.number], n: IntOrArray, k: IntOrArray
+    ) -> NDArray[np.number]:
+        """Calculate the logarithm of the k-th order statistic PMF of a sample of size n.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            x (NDArray[np.number]): Values to evaluate the log PMF at.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log PMF values.
+        """
+        x = np.asarray(x, dtype=int)
+        n, k = self._broadcast_nk(n, k, x.ndim)
+        points, i_1, i_0 = _union_with_previous(x)
+        logcdf, logsf = self.parent_logcdf_logsf(points)
+
+        return ordstat_logpmf(
+            logcdf[..., i_1], logsf[..., i_1], logcdf[..., i_0], logsf[..., i_0], n, k
+        )
+
+    def order_statistic_logcdf(
+        self, x: NDArray[np.number], n: IntOrArray, k: IntOrArray
+    ) -> NDArray[np.number]:
+        """Calculate the logarithm of the k-th order statistic CDF of a sample of size n.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            x (NDArray[np.number]): Values to evaluate the log CDF at.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log CDF values.
+        """
+        x = np.asarray(x, dtype=int)
+        n, k = self._broadcast_nk(n, k, x.ndim)
+        logcdf, logsf = self.parent_logcdf_logsf(x)
+        return ordstat_logcdf(logcdf, logsf, n, k)
+
+    def order_statistic_logsf(
+        self, x: NDArray[np.number], n: IntOrArray, k: IntOrArray
+    ) -> NDArray[np.number]:
+        """Calculate the logarithm of the k-th order statistic survival function.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            x (NDArray[np.number]): Values to evaluate the log survival function at.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log survival function values.
+        """
+        x = np.asarray(x, dtype=int)
+        n, k = self._broadcast_nk(n, k, x.ndim)
+        logcdf, logsf = self.parent_logcdf_logsf(x)
+        return ordstat_logsf(logcdf, logsf, n, k)
+
+    def order_statistic_rv(self, n: int, k: int) -> "rv_frozen":
+        """Return the k-th order statistic of a sample of size n as a frozen SciPy distribution.
+
+        All the methods of the distribution, including quantiles, random variates, moments
+        and entropy, use the order statistic methods of this class rather than the generic
+        numerical routines of SciPy.
+
+        Args:
+            n (int): Sample size.
+            k (int): Order statistic.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n, or the parent is a batch.
+
+        Returns
+        -------
+            rv_frozen: Frozen `rv_discrete` distribution of the order statistic.
+        """
+        from pyordstat.rv import DiscreteOrderStatisticRV  # noqa: PLC0415
+
+        return DiscreteOrderStatisticRV(self, n, k)()
+
+    def _order_statistic_expect(
+        self,
+        func: Callable[[NDArray[np.number]], NDArray[np.number]],
+        n: IntOrArray,
+        k: IntOrArray,
+    ) -> NDArray[np.number]:
+        """Compute the expectation of func(X_(k)), summed over the support of all pairs."""
+        lo, hi = self._order_statistic_support(n, k, self.truncation_eps)
+        x = np.arange(lo, hi + 1)
+        pmf = self.order_statistic_pmf_range(lo, hi, n, k)
+
+        return np.sum(func(x) * pmf, axis=-1)
+
+    def _order_statistic_support(self, n: IntOrArray, k: IntOrArray, eps: float) -> Tuple[int, int]:
+        """Integer range holding all but eps of the mass of every requested order statistic."""
+        q = np.asarray(eps / 2)
+        n, k = broadcast_nk(n, k, 0)
+
+        # Parent CDF level of the lower end, and parent survival level of the upper end, as
+        # the k-th smallest value is the (n-k+1)-th largest. The survival level stays
+        # accurate where the equivalent CDF level rounds to 1.
+        level = float(np.min(ordstat_quantile_level(q, n, k)))
+        tail = float(np.min(ordstat_quantile_level(q, n, n - k + 1)))
+
+        # Every parent of a batch must be covered. Quantile functions may return infinities
+        # for levels that round to 0 or 1, in which case the ends are searched for instead.
+        with np.errstate(divide="ignore"):
+            lo = np.min(self.ppf(np.asarray(level))) if self._ppf is not None else np.nan
+            hi = np.max(self._isf(np.asarray(tail))) if self._isf is not None else np.nan
+
+        if not np.isfinite(lo):
+            lo = self._search(
+                lambda x: np.max(self._batch_rows(self._eval_cdf(x), x), axis=0) >= level,
+                f"parent CDF level {level}",
+            )
+        if not np.isfinite(hi):
+            hi = self._search(
+                lambda x: np.max(self._batch_rows(self._parent_cdf_sf(x)[1], x), axis=0) <= tail,
+                f"parent survival level {tail}",
+            )
+
+        return int(lo), int(hi)
+
+    @staticmethod
+    def _batch_rows(values: NDArray[np.number], x: NDArray[np.int_]) -> NDArray[np.number]:
+        """Parent function values at x, with one row per parent of a batch."""
+        return np.asarray(values).reshape(-1, len(x))
+
+    def _search(self, reached: Callable[[NDArray[np.int_]], NDArray[np.bool_]], what: str) -> int:
+        """Smallest integer at which a condition, increasing with x, is met.
+
+        The condition is evaluated once over a grid of powers of two of both signs to
+        bracket the integer, which is then found by bisection.
+        """
+        powers = 2 ** np.arange(_SEARCH_BITS, dtype=np.int64)
+        grid = np.concatenate([-powers[::-1], [0], powers])
+        hits = reached(grid)
+        if not hits.any() or hits[0]:
+            raise ValueError(f"Could not bracket the {what} in the integers.")
+
+        first = int(np.argmax(hits))
+        lo, hi = int(grid[first - 1]), int(grid[first])
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if reached(np.array([mid]))[0]:
+                hi = mid
+            else:
+                lo = mid
+
+        return hi
+
+
+def _union_with_previous(
+    x: NDArray[np.number],
+) -> Tuple[NDArray[np.number], NDArray[np.int_], NDArray[np.int_]]:
+    """Find the sorted union of x and x - 1, and where each of them lies in it."""
+    points, inverse = np.unique(np.concatenate([x.ravel(), x.ravel() - 1]), return_inverse=True)
+    inverse = inverse.ravel()
+
+    return points, inverse[: x.size].reshape(x.shape), inverse[x.size :].reshape(x.shape)
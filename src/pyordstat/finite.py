@@ -1,38 +1,63 @@
 """Order statistics for discrete distributions with finite support."""
+import os
+from typing import Callable, Optional, Tuple, Union
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from pyordstat.base import BaseOrderStatistics
-from pyordstat.core import ordstat_cdf
+from pyordstat.core import (
+    IntOrArray,
+    broadcast_nk,
+    ordstat_cdf,
+    ordstat_joint_cdf,
+    ordstat_logcdf,
+    ordstat_logpmf,
+    ordstat_logsf,
+)
+from pyordstat.table import OrderStatisticTable
 
 
 class FiniteOrderStatistics(BaseOrderStatistics):
-    """Order statistics distribution for discrete distributions with finite support."""
+    """Order statistics distribution for discrete distributions with finite support.
+
+    All order statistic methods accept either scalar n and k or arrays of them. Arrays are
+    broadcast together into a list of (n, k) pairs and the result has shape
+    (n_k_pairs, len(x)).
+    """
 
     _x: NDArray[np.number]
     _pdf: NDArray[np.number]
     _cdf: NDArray[np.number]
+    _sf: NDArray[np.number]
 
     def __init__(self, x: NDArray[np.number], pmf: NDArray[np.number]) -> None:
         """Create a discrete order statistics distribution.
 
         Requires the values of the random variable and the probability mass function.
         The x values can be in any order, but the pdf values must be in the same order
-        as the x values, and they will be sorted in ascending order.
+        as the x values, and they will be sorted in ascending order (unless they already
+        are). To build the distribution from raw samples, see `HistogramBuilder`.
 
         Args:
             x (NDArray[np.number]): Support of the distribution.
             pdf (NDArray[np.number]): Probability mass function of the distribution.
         """
-        isort = np.argsort(x)
-        self._x = np.asarray(x)[isort]
-        pmf = np.asarray(pmf)[isort]
+        x = np.asarray(x)
+        pmf = np.asarray(pmf)
+        if np.any(x[1:] < x[:-1]):
+            isort = np.argsort(x)
+            x, pmf = x[isort], pmf[isort]
+        self._x = x
         cdf = np.cumsum(pmf)
 
         # Normalize
         pmf = pmf / cdf[-1]
         cdf = cdf / cdf[-1]
 
+        # Survival function, summed from the right to keep precision in the upper tail
+        self._sf = np.append(np.cumsum(pmf[::-1])[-2::-1], 0.0)
+
         super().__init__(pmf, cdf)
 
     @property
@@ -55,29 +80,314 @@ class FiniteOrderStatistics(BaseOrderStatistics):
         """Cumulative distribution function."""
         return self._cdf
 
-    def order_statistic_pmf(self, n: int, k: int) -> NDArray[np.number]:
+    def order_statistic_pmf(
+        self,
+        n: IntOrArray,
+        k: IntOrArray,
+        method: str = "beta",
+        x: Optional[NDArray[np.number]] = None,
+    ) -> NDArray[np.number]:
         """Order statistic probability mass function.
 
         Args:
-            n (int): Sample size.
-            k (int): Order statistic to calculate.
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
+            x (Optional[NDArray[np.number]], optional): Points to evaluate the PMF at; it is
+                zero away from the support. Defaults to None, for the whole support.
 
         Returns
         -------
-            NDArray[np.number]: Probability mass function of the k-th order statistic.
+            NDArray[np.number]: Probability mass function of the k-th order statistic, of
+                shape x.shape (len(self.x) if x is None), after the (n, k) pairs axis.
         """
-        cdf = self.order_statistic_cdf(n, k)
-        return np.diff(cdf, prepend=0)
+        if x is None:
+            cdf = self.order_statistic_cdf(n, k, method=method)
+            return np.diff(cdf, prepend=0)
+
+        x = np.asarray(x)
+        i = np.searchsorted(self._x, x, side="left")
+        i_last = np.minimum(i, len(self._x) - 1)
+        on_support = self._x[i_last] == x
+
+        # Parent CDF at each point and at the support point before it, the same off support
+        cdf = np.where(on_support, self._cdf[i_last], 0.0)
+        cdf_prev = np.where(on_support & (i > 0), self._cdf[np.maximum(i - 1, 0)], 0.0)
+        n, k = broadcast_nk(n, k, x.ndim + 1)
+        ans = ordstat_cdf(
+            np.stack([cdf, cdf_prev], axis=-1), n, k, method=method, tol=self.approx_tol
+        )
 
-    def order_statistic_cdf(self, n: int, k: int) -> NDArray[np.number]:
+        return ans[..., 0] - ans[..., 1]
+
+    def order_statistic_cdf(  # noqa: PLR0913, PLR0917
+        self,
+        n: IntOrArray,
+        k: IntOrArray,
+        method: str = "beta",
+        x: Optional[NDArray[np.number]] = None,
+        dtype: Optional[DTypeLike] = None,
+        out: Optional[NDArray[np.number]] = None,
+    ) -> NDArray[np.number]:
         """Order statistic cumulative distribution function.
 
+        With query points x, the parent CDF is looked up with a single binary search over
+        the support, and the order statistic CDF is only evaluated at the queried points.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
+            x (Optional[NDArray[np.number]], optional): Points to evaluate the CDF at.
+                Defaults to None, for the whole support.
+            dtype (Optional[DTypeLike], optional): Data type of the result, for example
+                np.float32. Defaults to None, for float64 or the dtype of out.
+            out (Optional[NDArray[np.number]], optional): Array to write the result into.
+                Defaults to None.
+
+        Returns
+        -------
+            NDArray[np.number]: Cumulative distribution function of the k-th order statistic,
+                of shape x.shape (len(self.x) if x is None), after the (n, k) pairs axis.
+        """
+        cdf, _ = self._parent_cdf_sf(x)
+        n, k = broadcast_nk(n, k, cdf.ndim)
+        return ordstat_cdf(cdf, n, k, method=method, tol=self.approx_tol, dtype=dtype, out=out)
+
+    def order_statistic_sf(  # noqa: PLR0913, PLR0917
+        self,
+        n: IntOrArray,
+        k: IntOrArray,
+        method: str = "beta",
+        x: Optional[NDArray[np.number]] = None,
+        dtype: Optional[DTypeLike] = None,
+        out: Optional[NDArray[np.number]] = None,
+    ) -> NDArray[np.number]:
+        """Order statistic survival function.
+
+        The k-th order statistic exceeds x when at least n-k+1 samples do, so the survival
+        function is computed from the parent survival function, keeping its precision in
+        the upper tail.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+            method (str, optional): Engine used by `ordstat_cdf`, one of "beta", "sum",
+                "approx" or "auto" (within `approx_tol`). Defaults to "beta".
+            x (Optional[NDArray[np.number]], optional): Points to evaluate the survival
+                function at. Defaults to None, for the whole support.
+            dtype (Optional[DTypeLike], optional): Data type of the result, for example
+                np.float32. Defaults to None, for float64 or the dtype of out.
+            out (Optional[NDArray[np.number]], optional): Array to write the result into.
+                Defaults to None.
+
+        Returns
+        -------
+            NDArray[np.number]: Survival function of the k-th order statistic, of shape
+                x.shape (len(self.x) if x is None), after the (n, k) pairs axis.
+        """
+        _, sf = self._parent_cdf_sf(x)
+        n, k = broadcast_nk(n, k, sf.ndim)
+        return ordstat_cdf(
+            sf, n, n - k + 1, method=method, tol=self.approx_tol, dtype=dtype, out=out
+        )
+
+    def order_statistic_logpmf(self, n: IntOrArray, k: IntOrArray) -> NDArray[np.number]:
+        """Order statistic log probability mass function.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log probability mass function of the k-th order statistic.
+        """
+        n, k = broadcast_nk(n, k)
+        logcdf, logsf = self._parent_logcdf_logsf()
+        logcdf_prev = np.append(-np.inf, logcdf[:-1])
+        logsf_prev = np.append(0.0, logsf[:-1])
+
+        return ordstat_logpmf(logcdf, logsf, logcdf_prev, logsf_prev, n, k)
+
+    def order_statistic_logcdf(self, n: IntOrArray, k: IntOrArray) -> NDArray[np.number]:
+        """Order statistic log cumulative distribution function.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log cumulative distribution function of the k-th order statistic.
+        """
+        n, k = broadcast_nk(n, k)
+        logcdf, logsf = self._parent_logcdf_logsf()
+        return ordstat_logcdf(logcdf, logsf, n, k)
+
+    def order_statistic_logsf(self, n: IntOrArray, k: IntOrArray) -> NDArray[np.number]:
+        """Order statistic log survival function.
+
+        The calculation is carried out in log space and remains accurate for very large n.
+
+        Args:
+            n (IntOrArray): Sample size, or an array of them.
+            k (IntOrArray): Order statistic to calculate, or an array of them.
+
+        Returns
+        -------
+            NDArray[np.number]: Log survival function of the k-th order statistic.
+        """
+        n, k = broadcast_nk(n, k)
+        logcdf, logsf = self._parent_logcdf_logsf()
+        return ordstat_logsf(logcdf, logsf, n, k)
+
+    def order_statistic_joint_cdf(self, n: int, i: int, j: int) -> NDArray[np.number]:
+        """Joint CDF of the i-th and j-th order statistics on the support grid.
+
+        Args:
+            n (int): Sample size.
+            i (int): Lower order statistic.
+            j (int): Upper order statistic.
+
+        Raises
+        ------
+            ValueError: If not 1 <= i < j <= n.
+
+        Returns
+        -------
+            NDArray[np.number]: Joint CDF, of shape (len(x), len(x)), with X_(i) along the
+                first axis and X_(j) along the second.
+        """
+        return ordstat_joint_cdf(self._cdf[:, None], self._cdf[None, :], n, i, j)
+
+    def order_statistic_joint_pmf(self, n: int, i: int, j: int) -> NDArray[np.number]:
+        """Joint PMF of the i-th and j-th order statistics on the support grid.
+
         Args:
             n (int): Sample size.
-            k (int): Order statistic to calculate.
+            i (int): Lower order statistic.
+            j (int): Upper order statistic.
+
+        Raises
+        ------
+            ValueError: If not 1 <= i < j <= n.
 
         Returns
         -------
-            NDArray[np.number]: Cumulative distribution function of the k-th order statistic.
+            NDArray[np.number]: Joint PMF, of shape (len(x), len(x)), with X_(i) along the
+                first axis and X_(j) along the second.
         """
-        return ordstat_cdf(self._cdf, n, k)
+        levels = np.append(0.0, self._cdf)
+        cdf = ordstat_joint_cdf(levels[:, None], levels[None, :], n, i, j)
+        return np.diff(np.diff(cdf, axis=0), axis=1)
+
+    def order_statistic_spacing_pmf(
+        self, n: int, i: int, j: int
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Distribution of the spacing X_(j) - X_(i) of a sample of size n.
+
+        The joint PMF is summed over the pairs of support points with the same difference,
+        which takes O(len(x)^2) time and memory.
+
+        Args:
+            n (int): Sample size.
+            i (int): Lower order statistic.
+            j (int): Upper order statistic.
+
+        Raises
+        ------
+            ValueError: If not 1 <= i < j <= n.
+
+        Returns
+        -------
+            Tuple[NDArray[np.number], NDArray[np.number]]: Sorted values of the spacing and
+                their probabilities.
+        """
+        joint = self.order_statistic_joint_pmf(n, i, j)
+        a, b = np.triu_indices(len(self._x))
+        w, inverse = np.unique(self._x[b] - self._x[a], return_inverse=True)
+        return w, np.bincount(inverse.ravel(), weights=joint[a, b], minlength=len(w))
+
+    def order_statistic_range_pmf(self, n: int) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Distribution of the sample range X_(n) - X_(1).
+
+        Args:
+            n (int): Sample size, at least 2.
+
+        Raises
+        ------
+            ValueError: If n is smaller than 2.
+
+        Returns
+        -------
+            Tuple[NDArray[np.number], NDArray[np.number]]: Sorted values of the range and
+                their probabilities.
+        """
+        return self.order_statistic_spacing_pmf(n, 1, n)
+
+    def order_statistic_table(
+        self,
+        n: int,
+        path: Optional[Union[str, os.PathLike]] = None,
+        dtype: DTypeLike = np.float64,
+    ) -> OrderStatisticTable:
+        """Table of the CDFs of all the order statistics of a sample of size n.
+
+        The whole table is built in a single pass, rather than one k at a time. With a path,
+        it is written straight to disk and can be reopened memory-mapped from other processes
+        with `OrderStatisticTable.load`.
+
+        Args:
+            n (int): Sample size.
+            path (Optional[Union[str, os.PathLike]], optional): Directory to store the table
+                in. Defaults to None, keeping it in memory.
+            dtype (DTypeLike, optional): Data type of the table. Defaults to np.float64.
+
+        Returns
+        -------
+            OrderStatisticTable: Table of shape (n, len(x)), whose (k-1)-th row is the CDF of
+                the k-th order statistic.
+        """
+        return OrderStatisticTable.build(self._x, self._cdf, n, path=path, dtype=dtype)
+
+    def _order_statistic_expect(
+        self,
+        func: Callable[[NDArray[np.number]], NDArray[np.number]],
+        n: IntOrArray,
+        k: IntOrArray,
+    ) -> NDArray[np.number]:
+        """Compute the expectation of func(X_(k)), as an exact sum over the support."""
+        return np.sum(func(self._x) * self.order_statistic_pmf(n, k), axis=-1)
+
+    def _parent_quantile(
+        self, u: NDArray[np.number], ndim: Optional[int] = None
+    ) -> NDArray[np.number]:
+        """Smallest support values at which the parent CDF is at least u."""
+        i = np.searchsorted(self._cdf, u, side="left")
+        return self._x[np.minimum(i, len(self._x) - 1)]
+
+    def _parent_cdf_sf(
+        self, x: Optional[NDArray[np.number]] = None
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Parent CDF and survival function at x, or over the support if x is None."""
+        if x is None:
+            return self._cdf, self._sf
+
+        # Index of the last support point at or below each of the points
+        i = np.searchsorted(self._x, x, side="right") - 1
+        below = i < 0
+        i = np.maximum(i, 0)
+
+        return np.where(below, 0.0, self._cdf[i]), np.where(below, 1.0, self._sf[i])
+
+    def _parent_logcdf_logsf(self) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Logarithms of the parent CDF and survival function over the support."""
+        with np.errstate(divide="ignore"):
+            return np.log(self._cdf), np.log(self._sf)
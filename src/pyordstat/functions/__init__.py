@@ -11,10 +11,10 @@ from pyordstat.functions.rv_discrete import (
 )
 
 __all__ = [
-    "RVNormalStatistics",
-    "RVUniformStatistics",
     "RVBinomialStatistics",
-    "RVGeomStatistics",
     "RVContOrderStatistics",
     "RVDiscrOrderStatistics",
+    "RVGeomStatistics",
+    "RVNormalStatistics",
+    "RVUniformStatistics",
 ]
@@ -1,26 +1,65 @@
 """Order statistics for specific continuous distributions."""
+from typing import Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
 from scipy import stats
 from scipy.stats import rv_continuous
 
+from pyordstat.base import BatchedDistrFunc
 from pyordstat.continuous import ContinuousOrderStatistics
 
+FloatOrArray = Union[float, NDArray[np.floating]]
+
 
 class RVContOrderStatistics(ContinuousOrderStatistics):
-    """Base class for order statistics based on rv_continuous distributions."""
+    """Base class for order statistics based on rv_continuous distributions.
+
+    Frozen distributions with array parameters define a batch of parents (see
+    `batch_shape`).
+    """
+
+    _distribution: rv_continuous
+    _logpdf: BatchedDistrFunc
+    _logcdf: BatchedDistrFunc
+    _logsf: BatchedDistrFunc
 
     def __init__(self, distribution: rv_continuous) -> None:
-        super().__init__(distribution.pdf, distribution.cdf)
+        dist = getattr(distribution, "dist", distribution)
+        args = getattr(distribution, "args", ())
+        kwds = getattr(distribution, "kwds", {})
+
+        super().__init__(dist.pdf, dist.cdf, *args, ppf=dist.ppf, **kwds)
+        self._distribution = distribution
+        self._logpdf = BatchedDistrFunc(dist.logpdf, *args, **kwds)
+        self._logcdf = BatchedDistrFunc(dist.logcdf, *args, **kwds)
+        self._logsf = BatchedDistrFunc(dist.logsf, *args, **kwds)
+
+    def parent_logpdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        """Logarithm of the parent probability density function."""
+        return self._eval_parent("logpdf", self._logpdf, x)
+
+    def parent_logcdf_logsf(
+        self, x: NDArray[np.number]
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Logarithms of the parent cumulative distribution and survival functions."""
+        return (
+            self._eval_parent("logcdf", self._logcdf, x),
+            self._eval_parent("logsf", self._logsf, x),
+        )
 
 
 class RVUniformStatistics(RVContOrderStatistics):
     """Uniform distribution order statistics."""
 
-    def __init__(self, loc: float = 0.0, scale: float = 1.0) -> None:
+    def __init__(self, loc: FloatOrArray = 0.0, scale: FloatOrArray = 1.0) -> None:
         """Initialize uniform distribution order statistics.
 
         Args:
-            loc (float, optional): Starting point of distribution. Defaults to 0.0.
-            scale (float, optional): Scale of distribution. Defaults to 1.0.
+            loc (FloatOrArray, optional): Starting point of distribution, or an array of
+                them. Defaults to 0.0.
+            scale (FloatOrArray, optional): Scale of distribution, or an array of them.
+                Defaults to 1.0.
         """
         distr = stats.uniform(loc=loc, scale=scale)
         super().__init__(distr)
@@ -29,12 +68,14 @@ class RVUniformStatistics(RVContOrderStatistics):
 class RVNormalStatistics(RVContOrderStatistics):
     """Normal distribution order statistics."""
 
-    def __init__(self, loc: float, scale: float) -> None:
+    def __init__(self, loc: FloatOrArray, scale: FloatOrArray) -> None:
         """Initialize normal distribution order statistics.
 
         Args:
-            loc (float, optional): Starting point of distribution. Defaults to 0.0.
-            scale (float, optional): Scale of distribution. Defaults to 1.0.
+            loc (FloatOrArray, optional): Starting point of distribution, or an array of
+                them. Defaults to 0.0.
+            scale (FloatOrArray, optional): Scale of distribution, or an array of them.
+                Defaults to 1.0.
         """
         distr = stats.norm(loc=loc, scale=scale)
         super().__init__(distr)
@@ -1,26 +1,58 @@
 """Order statistics for specific discrete distributions."""
+from typing import Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
 from scipy import stats
 from scipy.stats import rv_discrete
 
+from pyordstat.base import BatchedDistrFunc
 from pyordstat.discrete import DiscreteOrderStatistics
 
 
 class RVDiscrOrderStatistics(DiscreteOrderStatistics):
-    """Base class for order statistics based on rv_discrete distributions."""
+    """Base class for order statistics based on rv_discrete distributions.
+
+    Frozen distributions with array parameters define a batch of parents (see
+    `batch_shape`).
+    """
+
+    _distribution: rv_discrete
+    _logcdf: BatchedDistrFunc
+    _logsf: BatchedDistrFunc
 
     def __init__(self, distribution: rv_discrete) -> None:
-        super().__init__(distribution.pmf, distribution.cdf)
+        dist = getattr(distribution, "dist", distribution)
+        args = getattr(distribution, "args", ())
+        kwds = getattr(distribution, "kwds", {})
+
+        super().__init__(dist.pmf, dist.cdf, *args, ppf=dist.ppf, isf=dist.isf, **kwds)
+        self._distribution = distribution
+        self._logcdf = BatchedDistrFunc(dist.logcdf, *args, **kwds)
+        self._logsf = BatchedDistrFunc(dist.logsf, *args, **kwds)
+
+    def parent_logcdf_logsf(
+        self, x: NDArray[np.number]
+    ) -> Tuple[NDArray[np.number], NDArray[np.number]]:
+        """Logarithms of the parent cumulative distribution and survival functions."""
+        return (
+            self._eval_parent("logcdf", self._logcdf, x),
+            self._eval_parent("logsf", self._logsf, x),
+        )
 
 
 class RVBinomialStatistics(RVDiscrOrderStatistics):
     """Binomial distribution order statistics."""
 
-    def __init__(self, n: int, p: float) -> None:
+    def __init__(
+        self, n: Union[int, NDArray[np.int_]], p: Union[float, NDArray[np.floating]]
+    ) -> None:
         """Initialize binomial distribution order statistics.
 
         Args:
-            n (int): Number of trials.
-            p (float): Probability of success.
+            n (Union[int, NDArray[np.int_]]): Number of trials, or an array of them.
+            p (Union[float, NDArray[np.floating]]): Probability of success, or an array of
+                them.
         """
         distr = stats.binom(n, p)
         super().__init__(distr)
@@ -29,11 +61,12 @@ class RVBinomialStatistics(RVDiscrOrderStatistics):
 class RVGeomStatistics(RVDiscrOrderStatistics):
     """Geometric distribution order statistics."""
 
-    def __init__(self, p: float) -> None:
+    def __init__(self, p: Union[float, NDArray[np.floating]]) -> None:
         """Initialize geometric distribution order statistics.
 
         Args:
-            p (float): Probability of success.
+            p (Union[float, NDArray[np.floating]]): Probability of success, or an array of
+                them.
         """
         distr = stats.geom(p)
         super().__init__(distr)
@@ -0,0 +1,155 @@
+"""Order statistics of independent, non-identically distributed random variables."""
+from typing import Callable, List, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyordstat.base import CallableDistrFunc
+from pyordstat.core import IntOrArray
+from pyordstat.finite import FiniteOrderStatistics
+
+ParentLike = Union[
+    CallableDistrFunc,
+    FiniteOrderStatistics,
+    Tuple[NDArray[np.number], NDArray[np.number]],
+]
+
+
+class HeterogeneousOrderStatistics:
+    """Order statistics of independent random variables with different distributions.
+
+    The k-th smallest of the variables is at most x exactly when at least k of them are, and
+    the number of variables at most x follows a Poisson binomial distribution, with success
+    probabilities given by the parent CDFs at x. Its distribution is built one parent at a
+    time with the standard dynamic programming recurrence, vectorized across x, which costs
+    O(n^2) per point instead of the permanents of the textbook formula.
+
+    Parents can be CDF callables, scipy distributions (or any object with a cdf method),
+    `FiniteOrderStatistics`, or (x, pmf) pairs of arrays for finite distributions.
+    """
+
+    _cdfs: List[Callable[[NDArray[np.number]], NDArray[np.number]]]
+
+    def __init__(self, parents: Sequence[ParentLike]) -> None:
+        """Create the order statistics of independent parents.
+
+        Args:
+            parents (Sequence[ParentLike]): Distribution of each variable.
+
+        Raises
+        ------
+            ValueError: If there are no parents.
+        """
+        if len(parents) == 0:
+            raise ValueError("At least one parent distribution is required.")
+
+        self._cdfs = [_parent_cdf(parent) for parent in parents]
+
+    @property
+    def n(self) -> int:
+        """Number of variables."""
+        return len(self._cdfs)
+
+    def parent_cdfs(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        """Evaluate the CDF of every parent.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variables.
+
+        Returns
+        -------
+            NDArray[np.number]: CDF values, of shape (n, *x.shape).
+        """
+        x = np.asarray(x)
+        return np.stack([np.broadcast_to(cdf(x), x.shape) for cdf in self._cdfs])
+
+    def count_pmf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        """Distribution of the number of variables that are at most x.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variables.
+
+        Returns
+        -------
+            NDArray[np.number]: Probabilities that exactly 0, ..., n variables are at most x,
+                of shape (n + 1, *x.shape).
+        """
+        cdfs = self.parent_cdfs(x)
+        pmf = np.zeros((self.n + 1, *cdfs.shape[1:]))
+        pmf[0] = 1.0
+        moved = np.empty_like(pmf)
+
+        for m, p in enumerate(cdfs):
+            # Adding a parent moves the mass of each count up by one with probability p
+            np.multiply(pmf[: m + 1], p, out=moved[: m + 1])
+            pmf[: m + 2] *= 1 - p
+            pmf[1 : m + 2] += moved[: m + 1]
+
+        return pmf
+
+    def order_statistic_cdf(self, x: NDArray[np.number], k: IntOrArray) -> NDArray[np.number]:
+        """Calculate the CDF of the k-th smallest of the variables.
+
+        All order statistics are obtained from the same recurrence, so asking for several
+        k at once costs the same as asking for one.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variables.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.number]: Order statistic CDF, of shape x.shape, or (len(k), *x.shape)
+                if k is an array.
+        """
+        k_arr = np.asarray(k)
+        if np.any((k_arr <= 0) | (k_arr > self.n)):
+            raise ValueError("k must be between 1 and n.")
+
+        # P(at least k variables are at most x), summed from the top to keep the upper tail
+        tail = np.cumsum(self.count_pmf(x)[::-1], axis=0)[::-1]
+        return np.clip(tail[k_arr.ravel()].reshape(k_arr.shape + tail.shape[1:]), 0.0, 1.0)
+
+    def order_statistic_sf(self, x: NDArray[np.number], k: IntOrArray) -> NDArray[np.number]:
+        """Calculate the survival function of the k-th smallest of the variables.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variables.
+            k (IntOrArray): Order statistic, or an array of them.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.number]: Order statistic survival function, of shape x.shape, or
+                (len(k), *x.shape) if k is an array.
+        """
+        k_arr = np.asarray(k)
+        if np.any((k_arr <= 0) | (k_arr > self.n)):
+            raise ValueError("k must be between 1 and n.")
+
+        # P(fewer than k variables are at most x)
+        head = np.cumsum(self.count_pmf(x), axis=0)
+        return np.clip(head[k_arr.ravel() - 1].reshape(k_arr.shape + head.shape[1:]), 0.0, 1.0)
+
+
+def _parent_cdf(parent: ParentLike) -> Callable[[NDArray[np.number]], NDArray[np.number]]:
+    """Turn any supported parent into a CDF callable."""
+    if isinstance(parent, tuple):
+        parent = FiniteOrderStatistics(*parent)
+
+    if isinstance(parent, FiniteOrderStatistics):
+        finite = parent
+
+        def finite_cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+            return finite._parent_cdf_sf(x)[0]
+
+        return finite_cdf
+
+    return getattr(parent, "cdf", parent)
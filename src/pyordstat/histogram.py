@@ -0,0 +1,204 @@
+"""Incremental construction of finite distributions from streams of samples."""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.streaming import ChunkedInput
+from pyordstat.table import OrderStatisticTable
+
+# Integer chunks spanning at most this many values per sample are counted with bincount
+_BINCOUNT_SPAN = 4
+
+
+class HistogramBuilder:
+    """Empirical distribution built incrementally from chunks of samples.
+
+    Only the distinct sample values and their counts are kept, never the raw samples, so
+    streams of any length can be ingested one chunk at a time. Builders fed by different
+    workers can be merged, and the finite distribution and order statistic tables derived
+    from the histogram are cached and refreshed as samples arrive.
+    """
+
+    _values: NDArray[np.number]
+    _counts: NDArray[np.int64]
+    _distribution: Optional[FiniteOrderStatistics]
+    _tables: Dict[Tuple[int, np.dtype], Tuple[OrderStatisticTable, NDArray[np.number]]]
+
+    def __init__(self, samples: Optional[ChunkedInput] = None) -> None:
+        """Create a histogram, optionally ingesting a first batch of samples.
+
+        Args:
+            samples (Optional[ChunkedInput], optional): Samples, as an array or an iterable of
+                chunks. Defaults to None, for an empty histogram.
+        """
+        self._values = np.empty(0)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._distribution = None
+        self._tables = {}
+
+        if samples is not None:
+            self.update(samples)
+
+    @property
+    def values(self) -> NDArray[np.number]:
+        """Sorted distinct sample values."""
+        return self._values
+
+    @property
+    def counts(self) -> NDArray[np.int64]:
+        """Number of samples at each value."""
+        return self._counts
+
+    @property
+    def n_samples(self) -> int:
+        """Total number of samples ingested."""
+        return int(np.sum(self._counts))
+
+    def update(self, samples: ChunkedInput) -> "HistogramBuilder":
+        """Ingest samples.
+
+        Args:
+            samples (ChunkedInput): Samples, as an array or an iterable of chunks. Arrays are
+                flattened, and can be memory-mapped.
+
+        Returns
+        -------
+            HistogramBuilder: This builder, updated.
+        """
+        chunks = [samples] if isinstance(samples, np.ndarray) else samples
+        for chunk in chunks:
+            values, counts = _chunk_counts(np.asarray(chunk).reshape(-1))
+            self._add(values, counts)
+
+        return self
+
+    def merge(self, other: "HistogramBuilder") -> "HistogramBuilder":
+        """Add the samples of another builder, for example one fed by another worker.
+
+        Args:
+            other (HistogramBuilder): Builder to merge into this one; it is left unchanged.
+
+        Returns
+        -------
+            HistogramBuilder: This builder, updated.
+        """
+        self._add(other.values, other.counts)
+        return self
+
+    def distribution(self) -> FiniteOrderStatistics:
+        """Finite distribution of the samples ingested so far.
+
+        Raises
+        ------
+            ValueError: If no samples were ingested.
+
+        Returns
+        -------
+            FiniteOrderStatistics: The empirical distribution.
+        """
+        if len(self._values) == 0:
+            raise ValueError("No samples have been ingested.")
+
+        if self._distribution is None:
+            self._distribution = FiniteOrderStatistics(self._values, self._counts)
+        return self._distribution
+
+    def order_statistic_table(
+        self, n: int, tol: float = 0.0, dtype: DTypeLike = np.float64
+    ) -> OrderStatisticTable:
+        """Table of the CDFs of all the order statistics of a sample of size n.
+
+        The table is kept between calls. When samples have been added since, only the
+        columns of new values, and of values whose empirical CDF has moved by more than tol
+        since their column was computed, are recomputed in place; the others are reused.
+        With tol = 0 the table is exact.
+
+        Args:
+            n (int): Sample size.
+            tol (float, optional): Largest change of the parent CDF at which a column is
+                reused. Defaults to 0.0.
+            dtype (DTypeLike, optional): Data type of the table. Defaults to np.float64.
+
+        Raises
+        ------
+            ValueError: If no samples were ingested, or n is not positive.
+
+        Returns
+        -------
+            OrderStatisticTable: Table of shape (n, len(values)), as
+                `FiniteOrderStatistics.order_statistic_table`.
+        """
+        distribution = self.distribution()
+        x, cdf = distribution.x, distribution.cdf
+        key = (n, np.dtype(dtype))
+
+        if key not in self._tables:
+            self._tables[key] = (OrderStatisticTable.build(x, cdf, n, dtype=dtype), cdf.copy())
+            return self._tables[key][0]
+
+        table, built_cdf = self._tables[key]
+        if len(table.x) != len(x):
+            # The support only grows: move the existing columns to their new positions
+            position = np.searchsorted(x, table.x)
+            values = np.empty((n, len(x)), dtype=dtype)
+            values[:, position] = table.table
+            moved_cdf = np.full(len(x), np.nan)
+            moved_cdf[position] = built_cdf
+            table, built_cdf = OrderStatisticTable(x, values), moved_cdf
+
+        # New columns have a NaN reference CDF and are always stale
+        stale = ~(np.abs(cdf - built_cdf) <= tol)
+        if np.any(stale):
+            table.table[:, stale] = OrderStatisticTable.build(x[stale], cdf[stale], n).table
+            built_cdf[stale] = cdf[stale]
+
+        self._tables[key] = (table, built_cdf)
+        return table
+
+    def _add(self, values: NDArray[np.number], counts: NDArray[np.int64]) -> None:
+        """Add counts at sorted distinct values."""
+        if len(values) == 0:
+            return
+        if len(self._values) == 0:
+            self._values, self._counts = values.copy(), counts.copy()
+            self._distribution = None
+            return
+
+        position = np.searchsorted(self._values, values)
+        known = position < len(self._values)
+        known[known] = self._values[position[known]] == values[known]
+
+        if np.all(known):
+            # Common once the support has been seen: no new values, update in place
+            self._counts[position] += counts
+        else:
+            merged = np.union1d(self._values, values)
+            merged_counts = np.zeros(len(merged), dtype=np.int64)
+            merged_counts[np.searchsorted(merged, self._values)] = self._counts
+            merged_counts[np.searchsorted(merged, values)] += counts
+            self._values, self._counts = merged, merged_counts
+
+        self._distribution = None
+
+
+def _chunk_counts(chunk: NDArray[np.number]) -> Tuple[NDArray[np.number], NDArray[np.int64]]:
+    """Sorted distinct values of a chunk of samples and their counts."""
+    if len(chunk) == 0:
+        return chunk, np.empty(0, dtype=np.int64)
+
+    if np.issubdtype(chunk.dtype, np.integer):
+        lo, hi = int(chunk.min()), int(chunk.max())
+        if hi - lo < _BINCOUNT_SPAN * len(chunk):
+            # Dense integer samples are counted in linear time, without sorting. Offsets are
+            # taken in a 64-bit type of the same signedness, exact even above 2**63.
+            wide = chunk.astype(np.uint64 if chunk.dtype.kind == "u" else np.int64, copy=False)
+            start = wide.dtype.type(lo)
+            counts = np.bincount((wide - start).astype(np.intp))
+            (index,) = np.nonzero(counts)
+            values = (index.astype(wide.dtype) + start).astype(chunk.dtype)
+            return values, counts[index].astype(np.int64)
+
+    values, counts = np.unique(chunk, return_counts=True)
+    return values, counts.astype(np.int64)
@@ -0,0 +1,223 @@
+"""Opt-in profiling of parent evaluations, timings and temporary allocations."""
+import functools
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+Hook = Callable[[Dict[str, Any]], None]
+
+# Attributes holding parent distribution functions, and the names they are reported under
+PARENT_FUNCTIONS = {
+    "_pdf": "pdf",
+    "_cdf": "cdf",
+    "_ppf": "ppf",
+    "_isf": "isf",
+    "_logpdf": "logpdf",
+    "_logcdf": "logcdf",
+    "_logsf": "logsf",
+}
+
+METHOD_PREFIX = "order_statistic_"
+
+
+class Profile:
+    """Counters and timings collected while profiling an order statistics object.
+
+    Every call to an order statistic method is timed, and split into the time spent
+    evaluating the parent distribution functions and the rest, the order statistic
+    transform. Methods called by other methods, such as the moments behind the mean, are
+    part of the outer call and are not counted separately. Parent evaluations served by
+    the evaluation cache are not parent calls.
+
+    If trace_memory is set, the peak memory allocated during each method call is traced
+    with `tracemalloc`. This slows down the calls noticeably, and with several threads the
+    peaks of concurrent calls overlap.
+    """
+
+    hook: Optional[Hook]
+    trace_memory: bool
+    calls: Dict[str, int]
+    parent_calls: Dict[str, int]
+    parent_points: Dict[str, int]
+    parent_seconds: float
+    transform_seconds: float
+    peak_bytes: Optional[int]
+
+    def __init__(self, hook: Optional[Hook] = None, trace_memory: bool = False) -> None:
+        """Create an empty profile.
+
+        Args:
+            hook (Optional[Hook], optional): Function called with an event dictionary after
+                every parent evaluation and every method call. Defaults to None.
+            trace_memory (bool, optional): Whether to trace the peak memory allocated by
+                each method call. Defaults to False.
+        """
+        self.hook = hook
+        self.trace_memory = trace_memory
+        self.calls = {}
+        self.parent_calls = {}
+        self.parent_points = {}
+        self.parent_seconds = 0.0
+        self.transform_seconds = 0.0
+        self.peak_bytes = 0 if trace_memory else None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Export the profile.
+
+        Returns
+        -------
+            Dict[str, Any]: Method calls, parent calls and points evaluated by function
+                name, seconds spent in the parent functions and in the transform, and peak
+                bytes allocated by a single call (None unless memory is traced).
+        """
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "parent_calls": dict(self.parent_calls),
+                "parent_points": dict(self.parent_points),
+                "parent_seconds": self.parent_seconds,
+                "transform_seconds": self.transform_seconds,
+                "peak_bytes": self.peak_bytes,
+            }
+
+    def attach(self, obj: Any) -> Dict[str, Any]:
+        """Instrument the parent functions and order statistic methods of an object.
+
+        The instrumented versions are set as instance attributes, so that nothing is
+        intercepted, and nothing is paid, outside of profiling.
+
+        Args:
+            obj (Any): Order statistics object.
+
+        Returns
+        -------
+            Dict[str, Any]: Original parent functions, to restore with `detach`.
+        """
+        originals = {}
+        for attr, name in PARENT_FUNCTIONS.items():
+            func = obj.__dict__.get(attr)
+            if callable(func):
+                originals[attr] = func
+                setattr(obj, attr, _InstrumentedFunc(self, name, func))
+
+        for name in dir(type(obj)):
+            if name.startswith(METHOD_PREFIX) and callable(getattr(type(obj), name)):
+                setattr(obj, name, self._instrument_method(name, getattr(obj, name)))
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            originals["tracemalloc"] = True
+
+        return originals
+
+    def detach(self, obj: Any, originals: Dict[str, Any]) -> None:
+        """Restore an object instrumented by `attach`.
+
+        Args:
+            obj (Any): Order statistics object.
+            originals (Dict[str, Any]): Value returned by `attach`.
+        """
+        if originals.pop("tracemalloc", False):
+            tracemalloc.stop()
+        for attr, func in originals.items():
+            setattr(obj, attr, func)
+        for name in [name for name in vars(obj) if name.startswith(METHOD_PREFIX)]:
+            delattr(obj, name)
+
+    def record_parent(self, name: str, points: int, seconds: float) -> None:
+        """Record one evaluation of a parent function."""
+        local = self._local
+        if getattr(local, "depth", 0) > 0:
+            local.parent_seconds += seconds
+
+        with self._lock:
+            self.parent_calls[name] = self.parent_calls.get(name, 0) + 1
+            self.parent_points[name] = self.parent_points.get(name, 0) + points
+            self.parent_seconds += seconds
+
+        if self.hook is not None:
+            self.hook({"event": "parent", "function": name, "points": points, "seconds": seconds})
+
+    def record_call(
+        self, name: str, seconds: float, parent_seconds: float, peak_bytes: Optional[int]
+    ) -> None:
+        """Record one call of an order statistic method."""
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.transform_seconds += seconds - parent_seconds
+            if peak_bytes is not None:
+                self.peak_bytes = max(self.peak_bytes or 0, peak_bytes)
+
+        if self.hook is not None:
+            self.hook(
+                {
+                    "event": "call",
+                    "method": name,
+                    "seconds": seconds,
+                    "parent_seconds": parent_seconds,
+                    "transform_seconds": seconds - parent_seconds,
+                    "peak_bytes": peak_bytes,
+                }
+            )
+
+    def _instrument_method(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a bound method so that its outermost calls are recorded."""
+
+        @functools.wraps(method)
+        def instrumented(*args: Any, **kwargs: Any) -> Any:
+            local = self._local
+            depth = getattr(local, "depth", 0)
+            if depth > 0:
+                local.depth = depth + 1
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    local.depth = depth
+
+            local.depth = 1
+            local.parent_seconds = 0.0
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1] - base if self.trace_memory else None
+                local.depth = 0
+                self.record_call(name, seconds, local.parent_seconds, peak)
+
+        return instrumented
+
+
+class _InstrumentedFunc:
+    """Parent distribution function recording its evaluations in a profile.
+
+    Other attributes, such as the batch shape of a `BatchedDistrFunc`, are those of the
+    wrapped function.
+    """
+
+    def __init__(self, profile: Profile, name: str, func: Callable[..., Any]) -> None:
+        self._profile = profile
+        self._name = name
+        self._func = func
+
+    def __call__(self, x: NDArray[np.number], *args: Any, **kwargs: Any) -> NDArray[np.number]:
+        start = time.perf_counter()
+        try:
+            return self._func(x, *args, **kwargs)
+        finally:
+            self._profile.record_parent(self._name, np.size(x), time.perf_counter() - start)
+
+    def __getattr__(self, attr: str) -> Any:
+        func = self.__dict__.get("_func")
+        if func is None:
+            raise AttributeError(attr)
+        return getattr(func, attr)
@@ -0,0 +1,182 @@
+"""Parallel evaluation of order statistics over grids and (n, k) sweeps."""
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyordstat.core import IntOrArray
+
+BACKENDS = ("thread", "process")
+
+PairFunc = Callable[[NDArray[np.number], Any, Any], NDArray[np.number]]
+
+# Tasks per worker, so that uneven tasks still balance out
+_TASKS_PER_JOB = 4
+
+# State of the current process backend evaluation, inherited by forked workers
+_process_state: Optional[Tuple[PairFunc, NDArray[np.number], Any, Any, NDArray[np.number]]] = None
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Turn an n_jobs setting into a number of workers.
+
+    Args:
+        n_jobs (Optional[int]): Number of workers. None means 1, and negative values count
+            back from the number of CPUs, so that -1 uses all of them.
+
+    Returns
+    -------
+        int: Number of workers, at least 1.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def parallel_evaluate(  # noqa: PLR0913, PLR0917
+    func: PairFunc,
+    x: NDArray[np.number],
+    n: IntOrArray,
+    k: IntOrArray,
+    n_jobs: Optional[int] = -1,
+    backend: str = "thread",
+) -> NDArray[np.number]:
+    """Evaluate func(x, n, k) in parallel, split over chunks of x and groups of (n, k) pairs.
+
+    func must behave like the order statistic methods: with arrays of n and k its result has
+    a leading (n, k) pairs axis, and its last axis runs over the (flattened) points. Each
+    task evaluates one contiguous group of pairs on one contiguous chunk of points and
+    writes into its own slice of the output, so the result does not depend on the number
+    of workers or on the order in which tasks finish.
+
+    The "thread" backend relies on NumPy and SciPy releasing the GIL in their ufuncs. The
+    "process" backend forks worker processes that write into a shared memory output, and
+    is only available where the fork start method is.
+
+    Args:
+        func (PairFunc): Function of the points, n and k.
+        x (NDArray[np.number]): Points.
+        n (IntOrArray): Sample size, or an array of them.
+        k (IntOrArray): Order statistic, or an array of them.
+        n_jobs (Optional[int], optional): Number of workers, as for `resolve_n_jobs`.
+            Defaults to -1, for all CPUs.
+        backend (str, optional): Either "thread" or "process". Defaults to "thread".
+
+    Raises
+    ------
+        ValueError: If the backend is not recognised or not available.
+
+    Returns
+    -------
+        NDArray[np.number]: Results, of the same shape as func(x, n, k).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; must be one of {BACKENDS}.")
+    if backend == "process" and "fork" not in multiprocessing.get_all_start_methods():
+        raise ValueError("The process backend requires the fork start method.")
+
+    x = np.asarray(x)
+    x_flat = x.reshape(-1)
+    paired = np.ndim(n) > 0 or np.ndim(k) > 0
+    if paired:
+        n, k = (a.ravel() for a in np.broadcast_arrays(np.asarray(n), np.asarray(k)))
+    n_pairs = np.size(n) if paired else 1
+
+    # Output layout from a single-point, single-pair probe
+    probe = np.asarray(
+        func(x_flat[:1], n[:1], k[:1]) if paired else func(x_flat[:1], n, k)  # type: ignore[index]
+    )
+    shape = ((n_pairs,) if paired else ()) + probe.shape[int(paired) : -1] + (x_flat.size,)
+
+    jobs = resolve_n_jobs(n_jobs)
+    tasks = _partition(n_pairs, x_flat.size, jobs * _TASKS_PER_JOB, paired)
+
+    if backend == "thread":
+        out = np.empty(shape, dtype=probe.dtype)
+        with ThreadPoolExecutor(jobs) as executor:
+            _run(executor, _evaluate_task, [(func, x_flat, n, k, out, t) for t in tasks])
+    else:
+        out = _evaluate_processes(func, x_flat, n, k, shape, probe.dtype, jobs, tasks)
+
+    return out.reshape(shape[:-1] + x.shape)
+
+
+def _partition(
+    n_pairs: int, n_points: int, n_tasks: int, paired: bool
+) -> List[Tuple[Optional[slice], slice]]:
+    """Split the pairs and the points into contiguous blocks, pairs first."""
+    n_groups = min(n_pairs, n_tasks) if paired else 1
+    n_chunks = max(1, min(n_points, n_tasks // n_groups))
+
+    groups = _blocks(n_pairs, n_groups) if paired else [None]
+    return [(g, c) for g in groups for c in _blocks(n_points, n_chunks)]
+
+
+def _blocks(size: int, count: int) -> List[slice]:
+    """Split range(size) into count contiguous slices of nearly equal length."""
+    edges = np.linspace(0, size, count + 1).astype(int)
+    return [slice(a, b) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def _evaluate_task(  # noqa: PLR0913, PLR0917
+    func: PairFunc,
+    x: NDArray[np.number],
+    n: Any,
+    k: Any,
+    out: NDArray[np.number],
+    task: Tuple[Optional[slice], slice],
+) -> None:
+    """Evaluate one block of pairs on one chunk of points, into its slice of the output."""
+    group, chunk = task
+    if group is None:
+        out[..., chunk] = func(x[chunk], n, k)
+    else:
+        out[group, ..., chunk] = func(x[chunk], n[group], k[group])
+
+
+def _evaluate_process_task(task: Tuple[Optional[slice], slice]) -> None:
+    """Evaluate a task in a forked worker, from the inherited state."""
+    assert _process_state is not None
+    _evaluate_task(*_process_state, task)
+
+
+def _evaluate_processes(  # noqa: PLR0913, PLR0917
+    func: PairFunc,
+    x: NDArray[np.number],
+    n: Any,
+    k: Any,
+    shape: Tuple[int, ...],
+    dtype: np.dtype,
+    jobs: int,
+    tasks: List[Tuple[Optional[slice], slice]],
+) -> NDArray[np.number]:
+    """Run the tasks in forked processes, writing into a shared memory output."""
+    global _process_state  # noqa: PLW0603
+
+    shm = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    try:
+        shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _process_state = (func, x, n, k, shared)
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(jobs, mp_context=context) as executor:
+            _run(executor, _evaluate_process_task, [(t,) for t in tasks])
+        out = shared.copy()
+        del shared
+    finally:
+        _process_state = None
+        shm.close()
+        shm.unlink()
+
+    return out
+
+
+def _run(executor: Executor, task: Callable[..., None], args: List[Tuple[Any, ...]]) -> None:
+    """Submit all tasks and wait for them, raising the first error."""
+    for future in [executor.submit(task, *a) for a in args]:
+        future.result()
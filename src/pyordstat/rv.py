@@ -0,0 +1,180 @@
+"""Order statistics as SciPy distributions.
+
+The classes here wrap the k-th order statistic of a sample of size n as an `rv_continuous`
+or `rv_discrete` distribution. Every method SciPy would otherwise compute by generic
+numerical integration, root finding or inversion is implemented through the beta
+transformation of the order statistic: X_(k) = F^-1(U_(k)), with U_(k) ~ Beta(k, n-k+1).
+"""
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.stats import rv_continuous, rv_discrete
+
+from pyordstat.core import SeedLike, SizeLike, broadcast_nk
+
+if TYPE_CHECKING:
+    from pyordstat.continuous import ContinuousOrderStatistics
+    from pyordstat.discrete import DiscreteOrderStatistics
+
+OrderStatisticsLike = Union["ContinuousOrderStatistics", "DiscreteOrderStatistics"]
+
+
+class _OrderStatisticMethods:
+    """Methods shared by the continuous and discrete order statistic distributions."""
+
+    _ostat: OrderStatisticsLike
+    _n: int
+    _k: int
+
+    def _bind(self, ostat: OrderStatisticsLike, n: int, k: int, lowest: float) -> Dict[str, Any]:
+        """Check and store the order statistic, and return the support of its parent.
+
+        The support runs from the parent quantile at level lowest to the one at level 1.
+        """
+        if ostat.batch_shape:
+            raise ValueError("Only a single parent distribution can be a SciPy distribution.")
+        if np.ndim(n) > 0 or np.ndim(k) > 0:
+            raise ValueError("n and k must be scalars.")
+        broadcast_nk(n, k)
+
+        self._ostat = ostat
+        self._n = int(n)
+        self._k = int(k)
+
+        return {
+            "a": _parent_quantile(ostat, lowest, -np.inf),
+            "b": _parent_quantile(ostat, 1.0, np.inf),
+        }
+
+    def _updated_ctor_param(self) -> Dict[str, Any]:
+        # Frozen distributions build a new instance from the constructor parameters
+        params: Dict[str, Any] = super()._updated_ctor_param()  # type: ignore[misc]
+        params.update(ostat=self._ostat, n=self._n, k=self._k)
+        return params
+
+    def _cdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_cdf(x, self._n, self._k)
+
+    def _logcdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_logcdf(x, self._n, self._k)
+
+    def _logsf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_logsf(x, self._n, self._k)
+
+    def _sf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.exp(self._logsf(x))
+
+    def _ppf(self, q: NDArray[np.number]) -> NDArray[np.number]:
+        try:
+            return self._ostat.order_statistic_ppf(q, self._n, self._k)
+        except NotImplementedError:
+            return super()._ppf(q)  # type: ignore[misc]
+
+    def _isf(self, q: NDArray[np.number]) -> NDArray[np.number]:
+        try:
+            return self._ostat.order_statistic_isf(q, self._n, self._k)
+        except NotImplementedError:
+            return super()._isf(q)  # type: ignore[misc]
+
+    def _rvs(self, size: SizeLike = None, random_state: SeedLike = None) -> NDArray[np.number]:
+        try:
+            return self._ostat.order_statistic_rvs(self._n, self._k, size, random_state)
+        except NotImplementedError:
+            return super()._rvs(size=size, random_state=random_state)  # type: ignore[misc]
+
+    def _munp(self, order: int) -> NDArray[np.number]:
+        return self._ostat.order_statistic_moment(self._n, self._k, order)
+
+    def _stats(self) -> Tuple[Any, Any, None, None]:
+        return (
+            self._ostat.order_statistic_mean(self._n, self._k),
+            self._ostat.order_statistic_var(self._n, self._k),
+            None,
+            None,
+        )
+
+
+class ContinuousOrderStatisticRV(_OrderStatisticMethods, rv_continuous):  # type: ignore[misc]
+    """SciPy continuous distribution of the k-th order statistic of a sample of size n."""
+
+    _ostat: "ContinuousOrderStatistics"
+
+    def __init__(self, ostat: "ContinuousOrderStatistics", n: int, k: int, **kwargs: Any) -> None:
+        """Create the distribution of an order statistic.
+
+        Args:
+            ostat (ContinuousOrderStatistics): Order statistics of the parent distribution.
+            n (int): Sample size.
+            k (int): Order statistic.
+            **kwargs (Any): Further arguments of `rv_continuous`.
+
+        Raises
+        ------
+            ValueError: If the parent is a batch, or k is not between 1 and n.
+        """
+        kwargs.update(self._bind(ostat, n, k, 0.0))
+        kwargs.setdefault("name", f"order_statistic_{k}_of_{n}")
+        super().__init__(**kwargs)
+
+    def _pdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_pdf(x, self._n, self._k)
+
+    def _logpdf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_logpdf(x, self._n, self._k)
+
+    def _entropy(self) -> NDArray[np.number]:
+        # Differential entropy -E[log f_(k)(X_(k))], integrated in probability space
+        return -self._ostat._order_statistic_expect(self._logpdf, self._n, self._k)
+
+
+class DiscreteOrderStatisticRV(_OrderStatisticMethods, rv_discrete):  # type: ignore[misc]
+    """SciPy discrete distribution of the k-th order statistic of a sample of size n."""
+
+    _ostat: "DiscreteOrderStatistics"
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "DiscreteOrderStatisticRV":
+        """Create the instance, as `rv_discrete.__new__` only accepts its own arguments."""
+        return super(rv_discrete, cls).__new__(cls)
+
+    def __init__(self, ostat: "DiscreteOrderStatistics", n: int, k: int, **kwargs: Any) -> None:
+        """Create the distribution of an order statistic.
+
+        Args:
+            ostat (DiscreteOrderStatistics): Order statistics of the parent distribution.
+            n (int): Sample size.
+            k (int): Order statistic.
+            **kwargs (Any): Further arguments of `rv_discrete`.
+
+        Raises
+        ------
+            ValueError: If the parent is a batch, or k is not between 1 and n.
+        """
+        # The quantile at the smallest positive level is the first point of the support
+        kwargs.update(self._bind(ostat, n, k, np.finfo(float).tiny))
+        kwargs.setdefault("name", f"order_statistic_{k}_of_{n}")
+        super().__init__(**kwargs)
+
+    def _pmf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_pmf(x, self._n, self._k)
+
+    def _logpmf(self, x: NDArray[np.number]) -> NDArray[np.number]:
+        return self._ostat.order_statistic_logpmf(x, self._n, self._k)
+
+    def _entropy(self) -> NDArray[np.number]:
+        def neg_log_pmf(x: NDArray[np.number]) -> NDArray[np.number]:
+            # Points outside the support carry no mass, and contribute nothing to the sum
+            logpmf = self._logpmf(x)
+            return np.where(np.isfinite(logpmf), -logpmf, 0.0)
+
+        return self._ostat._order_statistic_expect(neg_log_pmf, self._n, self._k)
+
+
+def _parent_quantile(ostat: OrderStatisticsLike, q: float, default: float) -> float:
+    """Parent quantile at level q, or default if the quantile function is not known."""
+    try:
+        value = float(np.asarray(ostat.ppf(np.array(q))))
+    except NotImplementedError:
+        return default
+
+    return default if np.isnan(value) else value
@@ -0,0 +1,118 @@
+"""Chunked evaluation of order statistics over arrays larger than memory."""
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+"""Default memory budget of a single chunk, in bytes."""
+
+_PROBE_SIZE = 1024
+_OVERHEAD = 4.0
+
+ChunkedInput = Union[NDArray[np.number], Iterable[NDArray[np.number]]]
+
+
+def chunk_size(bytes_per_point: float, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> int:
+    """Compute the number of points per chunk that fits in a memory budget.
+
+    Args:
+        bytes_per_point (float): Memory used per evaluated point, including temporaries.
+        memory_budget (int, optional): Memory budget, in bytes. Defaults to
+            DEFAULT_MEMORY_BUDGET.
+
+    Returns
+    -------
+        int: Chunk size, at least 1.
+    """
+    return max(1, int(memory_budget // max(bytes_per_point, 1.0)))
+
+
+def stream(
+    func: Callable[[NDArray[np.number]], NDArray[np.number]],
+    x: ChunkedInput,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    out: Optional[NDArray[np.number]] = None,
+) -> Iterator[NDArray[np.number]]:
+    """Evaluate a function over x chunk by chunk, yielding the results.
+
+    func must map a one-dimensional array of points to results whose last axis runs over
+    the points, like the order statistic methods. x is either an array, which is flattened
+    and can be memory-mapped, since only one chunk of it is read at a time, or an iterable
+    of arrays. Chunks are split further so that each evaluation fits in memory_budget: the
+    first evaluation is made on a small probe chunk, and the size of its result (times a
+    safety factor for temporaries) sets the size of the following chunks.
+
+    Args:
+        func (Callable[[NDArray[np.number]], NDArray[np.number]]): Function to evaluate.
+        x (ChunkedInput): Points, as an array or an iterable of chunks.
+        memory_budget (int, optional): Memory budget of a single chunk, in bytes. Defaults to
+            DEFAULT_MEMORY_BUDGET.
+        out (Optional[NDArray[np.number]], optional): Array to write the results into, for
+            example memory-mapped, with the points along its last axis. The yielded results
+            are then views of it. Defaults to None.
+
+    Yields
+    ------
+        NDArray[np.number]: Results for each chunk, in order.
+    """
+    blocks = [x] if isinstance(x, np.ndarray) else x
+    size = _PROBE_SIZE
+    offset = 0
+
+    for block in blocks:
+        block = np.asarray(block).reshape(-1)  # noqa: PLW2901
+        start = 0
+        while start < len(block):
+            chunk = np.asarray(block[start : start + size])
+            ans = np.asarray(func(chunk))
+            if out is not None:
+                dest = out[..., offset : offset + len(chunk)]
+                dest[...] = ans
+                ans = dest
+
+            yield ans
+
+            size = chunk_size(_OVERHEAD * (ans.nbytes + chunk.nbytes) / len(chunk), memory_budget)
+            start += len(chunk)
+            offset += len(chunk)
+
+
+def evaluate_chunked(
+    func: Callable[[NDArray[np.number]], NDArray[np.number]],
+    x: ChunkedInput,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    out: Optional[NDArray[np.number]] = None,
+) -> NDArray[np.number]:
+    """Evaluate a function over x chunk by chunk, collecting the results.
+
+    Args:
+        func (Callable[[NDArray[np.number]], NDArray[np.number]]): Function to evaluate, as
+            for `stream`.
+        x (ChunkedInput): Points, as an array or an iterable of chunks.
+        memory_budget (int, optional): Memory budget of a single chunk, in bytes. Defaults to
+            DEFAULT_MEMORY_BUDGET.
+        out (Optional[NDArray[np.number]], optional): Array to write the results into, with
+            the points along its last axis. Defaults to None, allocating it if x is an array
+            and concatenating the results otherwise.
+
+    Returns
+    -------
+        NDArray[np.number]: Results, with the points along the last axis.
+    """
+    if out is not None:
+        for _ in stream(func, x, memory_budget, out=out):
+            pass
+        return out
+
+    if not isinstance(x, np.ndarray):
+        return np.concatenate(list(stream(func, x, memory_budget)), axis=-1)
+
+    offset = 0
+    for ans in stream(func, x, memory_budget):
+        if out is None:
+            out = np.empty((*ans.shape[:-1], x.size), dtype=ans.dtype)
+        out[..., offset : offset + ans.shape[-1]] = ans
+        offset += ans.shape[-1]
+
+    return out if out is not None else np.asarray(func(np.asarray(x).reshape(-1)))
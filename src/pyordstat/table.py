@@ -0,0 +1,190 @@
+"""Precomputed tables of all order statistics over a finite support."""
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+from scipy.special import gammaln, xlog1py, xlogy
+
+_X_FILE = "x.npy"
+_CDF_FILE = "cdf.npy"
+
+
+class OrderStatisticTable:
+    """CDFs of all the order statistics of a sample of size n, over a finite support.
+
+    Row k-1 of the table holds the CDF of the k-th order statistic at every point of the
+    support. Tables can be saved to a directory and reopened memory-mapped, so that several
+    processes share a single read-only copy.
+    """
+
+    _x: NDArray[np.number]
+    _table: NDArray[np.floating]
+
+    def __init__(self, x: NDArray[np.number], table: NDArray[np.floating]) -> None:
+        """Wrap an existing table.
+
+        Args:
+            x (NDArray[np.number]): Sorted support of the distribution, of size m.
+            table (NDArray[np.floating]): Order statistic CDFs, of shape (n, m).
+
+        Raises
+        ------
+            ValueError: If the shapes of x and table do not match.
+        """
+        if np.ndim(table) != 2 or np.shape(table)[1] != len(x):  # noqa: PLR2004
+            raise ValueError("table must have shape (n, len(x)).")
+
+        self._x = x
+        self._table = table
+
+    @classmethod
+    def build(
+        cls,
+        x: NDArray[np.number],
+        cdf: NDArray[np.number],
+        n: int,
+        path: Optional[Union[str, os.PathLike]] = None,
+        dtype: DTypeLike = np.float64,
+    ) -> "OrderStatisticTable":
+        """Build the table of all order statistics of a sample of size n.
+
+        The CDF of the k-th order statistic at a point is the probability that at least k of
+        the n samples fall at or below it, so the rows are built with a single downward
+        recurrence over k, adding one binomial probability (computed in log space) per row.
+        This costs O(n m) time and O(m) memory on top of the table itself.
+
+        Args:
+            x (NDArray[np.number]): Sorted support of the distribution.
+            cdf (NDArray[np.number]): Parent CDF on the support.
+            n (int): Sample size.
+            path (Optional[Union[str, os.PathLike]], optional): If given, the table is written
+                directly into a memory-mapped file in this directory, as by `save`.
+                Defaults to None.
+            dtype (DTypeLike, optional): Data type of the table. Defaults to np.float64.
+
+        Raises
+        ------
+            ValueError: If n is not positive.
+
+        Returns
+        -------
+            OrderStatisticTable: The table.
+        """
+        if n < 1:
+            raise ValueError("n must be positive.")
+
+        x = np.asarray(x)
+        cdf = np.clip(np.asarray(cdf, dtype=float), 0.0, 1.0)
+        shape = (n, len(x))
+
+        if path is None:
+            table = np.empty(shape, dtype=dtype)
+        else:
+            path = Path(path)
+            path.mkdir(parents=True, exist_ok=True)
+            np.save(path / _X_FILE, x)
+            table = np.lib.format.open_memmap(path / _CDF_FILE, mode="w+", dtype=dtype, shape=shape)
+
+        j = np.arange(n + 1)
+        log_binom = gammaln(n + 1) - gammaln(j + 1) - gammaln(n - j + 1)
+        # P(N >= k) = P(N >= k+1) + P(N = k), with N ~ Binomial(n, F)
+        tail = np.zeros(len(x))
+        for k in range(n, 0, -1):
+            tail += np.exp(log_binom[k] + xlogy(k, cdf) + xlog1py(n - k, -cdf))
+            table[k - 1] = np.minimum(tail, 1.0)
+
+        if path is not None:
+            table.flush()  # type: ignore[attr-defined]
+
+        return cls(x, table)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap: bool = True) -> "OrderStatisticTable":
+        """Load a table saved with `save`.
+
+        Args:
+            path (Union[str, os.PathLike]): Directory the table was saved to.
+            mmap (bool, optional): Whether to memory-map the table read-only instead of
+                reading it into memory. Defaults to True.
+
+        Returns
+        -------
+            OrderStatisticTable: The table.
+        """
+        path = Path(path)
+        table = np.load(path / _CDF_FILE, mmap_mode="r" if mmap else None)
+        return cls(np.load(path / _X_FILE), table)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Save the table to a directory, in a format that can be memory-mapped.
+
+        Args:
+            path (Union[str, os.PathLike]): Directory to save the table to.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / _X_FILE, self._x)
+        np.save(path / _CDF_FILE, self._table)
+
+    @property
+    def n(self) -> int:
+        """Sample size."""
+        return self._table.shape[0]
+
+    @property
+    def x(self) -> NDArray[np.number]:
+        """Support of the distribution."""
+        return self._x
+
+    @property
+    def table(self) -> NDArray[np.floating]:
+        """Order statistic CDFs, of shape (n, len(x))."""
+        return self._table
+
+    def cdf(self, k: int) -> NDArray[np.floating]:
+        """CDF of the k-th order statistic over the support.
+
+        Args:
+            k (int): Order statistic.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.floating]: Row of the table (a view, not a copy).
+        """
+        if (k <= 0) or (k > self.n):
+            raise ValueError("k must be between 1 and n.")
+        return self._table[k - 1]
+
+    def pmf(self, k: int) -> NDArray[np.floating]:
+        """PMF of the k-th order statistic over the support.
+
+        Args:
+            k (int): Order statistic.
+
+        Raises
+        ------
+            ValueError: If k is not between 1 and n.
+
+        Returns
+        -------
+            NDArray[np.floating]: PMF values.
+        """
+        return np.diff(self.cdf(k), prepend=0)
+
+    def column(self, i: int) -> NDArray[np.floating]:
+        """CDFs of all order statistics at the i-th point of the support.
+
+        Args:
+            i (int): Index of the support point.
+
+        Returns
+        -------
+            NDArray[np.floating]: Column of the table (a view, not a copy).
+        """
+        return self._table[:, i]
@@ -0,0 +1,239 @@
+"""Tabulated parent distributions for expensive PDF and CDF functions."""
+import os
+import warnings
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyordstat.base import CallableDistrFunc
+
+if TYPE_CHECKING:
+    from scipy.interpolate import CubicHermiteSpline, PPoly
+
+
+class ParentTable:
+    """Table of a parent PDF and CDF, evaluated by monotone interpolation.
+
+    The CDF is interpolated with a piecewise cubic Hermite interpolant that uses the
+    tabulated PDF as its derivative, with the Fritsch-Carlson limiter applied wherever that
+    would break monotonicity; the PDF is the derivative of the same interpolant. The two
+    are therefore consistent with each other, the CDF is monotone and the PDF non-negative.
+    Outside the tabulated range the PDF is zero and the CDF is held at its end values.
+
+    Tables can be pickled, or saved to disk as their tabulated values with `save`, to be
+    shared between processes.
+    """
+
+    _x: NDArray[np.floating]
+    _pdf: NDArray[np.floating]
+    _cdf: NDArray[np.floating]
+    _ppf_cdf: NDArray[np.floating]
+    _ppf_x: NDArray[np.floating]
+    _pdf_interp: "PPoly"
+    _cdf_interp: "CubicHermiteSpline"
+
+    def __init__(
+        self, x: NDArray[np.number], pdf: NDArray[np.number], cdf: NDArray[np.number]
+    ) -> None:
+        """Create a table from precomputed values.
+
+        Args:
+            x (NDArray[np.number]): Strictly increasing grid points.
+            pdf (NDArray[np.number]): Values of the PDF at the grid points.
+            cdf (NDArray[np.number]): Values of the CDF at the grid points.
+
+        Raises
+        ------
+            ValueError: If the arrays have different shapes or x is not strictly increasing.
+        """
+        self._x = np.asarray(x, dtype=float)
+        self._pdf = np.asarray(pdf, dtype=float)
+        self._cdf = np.asarray(cdf, dtype=float)
+
+        if not (self._x.ndim == 1 and self._x.shape == self._pdf.shape == self._cdf.shape):
+            raise ValueError("x, pdf and cdf must be one-dimensional arrays of the same size.")
+        if np.any(np.diff(self._x) <= 0):
+            raise ValueError("x must be strictly increasing.")
+
+        self._cdf_interp = _monotone_hermite(self._x, self._cdf, self._pdf)
+        self._pdf_interp = self._cdf_interp.derivative()
+
+        # The inverse interpolation keeps only the first point of each flat stretch of the CDF
+        self._ppf_cdf, first = np.unique(self._cdf, return_index=True)
+        self._ppf_x = self._x[first]
+
+    @classmethod
+    def build(  # noqa: PLR0913, PLR0917
+        cls,
+        pdf: CallableDistrFunc,
+        cdf: CallableDistrFunc,
+        lo: float,
+        hi: float,
+        tol: float = 1e-8,
+        n_init: int = 65,
+        max_points: int = 2**20,
+    ) -> "ParentTable":
+        """Tabulate a PDF and CDF on an adaptive grid.
+
+        Starting from a uniform grid, every interval whose midpoint is not reproduced by the
+        interpolation within tol (absolutely for the CDF, relative to the largest tabulated
+        value for the PDF, whose error is estimated from that of the CDF) is bisected, until
+        all intervals pass. Each refinement round evaluates the functions once, on all the new
+        midpoints at the same time.
+
+        Args:
+            pdf (CallableDistrFunc): Probability density function.
+            cdf (CallableDistrFunc): Cumulative distribution function.
+            lo (float): Lower end of the tabulated range.
+            hi (float): Upper end of the tabulated range.
+            tol (float, optional): Interpolation error tolerance. Defaults to 1e-8.
+            n_init (int, optional): Size of the initial uniform grid. Defaults to 65.
+            max_points (int, optional): Maximum size of the table. Refinement stops with a
+                warning if it is reached. Defaults to 2**20.
+
+        Raises
+        ------
+            ValueError: If the range or the tolerance are not valid.
+
+        Returns
+        -------
+            ParentTable: The tabulated distribution.
+        """
+        if not (np.isfinite(lo) and np.isfinite(hi) and lo < hi):
+            raise ValueError("lo and hi must be finite, with lo < hi.")
+        if tol <= 0:
+            raise ValueError("tol must be positive.")
+
+        x = np.linspace(lo, hi, n_init)
+        pdf_vals = np.asarray(pdf(x), dtype=float)
+        cdf_vals = np.asarray(cdf(x), dtype=float)
+        active = np.ones(len(x) - 1, dtype=bool)
+
+        while np.any(active):
+            if len(x) + np.sum(active) > max_points:
+                warnings.warn(
+                    f"Tabulation stopped at {len(x)} points before reaching tol={tol}.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                break
+
+            i = np.nonzero(active)[0]
+            x_mid = 0.5 * (x[i] + x[i + 1])
+            pdf_mid = np.asarray(pdf(x_mid), dtype=float)
+            cdf_mid = np.asarray(cdf(x_mid), dtype=float)
+
+            interp = _monotone_hermite(x, cdf_vals, pdf_vals)
+            cdf_err = np.abs(cdf_mid - interp(x_mid))
+            # The error of the derivative of a cubic Hermite interpolant vanishes at the
+            # midpoint; its maximum over the interval is estimated from the CDF error instead
+            pdf_err = np.maximum(
+                np.abs(pdf_mid - interp.derivative()(x_mid)), 4 * cdf_err / (x[i + 1] - x[i])
+            )
+            pdf_scale = max(np.max(np.abs(pdf_vals)), np.max(np.abs(pdf_mid)))
+            bad = (cdf_err > tol) | (pdf_err > tol * pdf_scale)
+
+            # Both halves of a failed interval are refined further
+            flags = np.zeros(len(active), dtype=bool)
+            flags[i] = bad
+            active = np.repeat(flags, np.where(active, 2, 1))
+
+            x = np.insert(x, i + 1, x_mid)
+            pdf_vals = np.insert(pdf_vals, i + 1, pdf_mid)
+            cdf_vals = np.insert(cdf_vals, i + 1, cdf_mid)
+
+        return cls(x, pdf_vals, cdf_vals)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "ParentTable":
+        """Load a table saved with `save`.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file.
+
+        Returns
+        -------
+            ParentTable: The loaded table.
+        """
+        with np.load(path) as data:
+            return cls(data["x"], data["pdf"], data["cdf"])
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Save the table to a .npz file.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file.
+        """
+        np.savez(path, x=self._x, pdf=self._pdf, cdf=self._cdf)
+
+    @property
+    def x(self) -> NDArray[np.floating]:
+        """Grid points of the table."""
+        return self._x
+
+    def pdf(self, x: NDArray[np.number]) -> NDArray[np.floating]:
+        """Interpolated probability density function.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variable.
+
+        Returns
+        -------
+            NDArray[np.floating]: PDF values.
+        """
+        return np.nan_to_num(self._pdf_interp(x), nan=0.0)
+
+    def cdf(self, x: NDArray[np.number]) -> NDArray[np.floating]:
+        """Interpolated cumulative distribution function.
+
+        Args:
+            x (NDArray[np.number]): Values of the random variable.
+
+        Returns
+        -------
+            NDArray[np.floating]: CDF values.
+        """
+        x_clip = np.clip(x, self._x[0], self._x[-1])
+        return self._cdf_interp(x_clip)
+
+    def ppf(self, q: NDArray[np.number]) -> NDArray[np.floating]:
+        """Percent point function, by inverse interpolation of the table.
+
+        Args:
+            q (NDArray[np.number]): Probabilities.
+
+        Returns
+        -------
+            NDArray[np.floating]: Quantiles.
+        """
+        q_arr = np.asarray(q, dtype=float)
+        cdf_vals, x = self._ppf_cdf, self._ppf_x
+        # Newton step from the linear inverse interpolation, kept within its bracket
+        j = np.clip(np.searchsorted(cdf_vals, q_arr, side="right") - 1, 0, len(x) - 2)
+        x0 = np.interp(q_arr, cdf_vals, x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x1 = x0 - (self._cdf_interp(x0) - q_arr) / self._pdf_interp(x0)
+        return np.where(np.isfinite(x1), np.clip(x1, x[j], x[j + 1]), x0)
+
+
+def _monotone_hermite(
+    x: NDArray[np.floating], y: NDArray[np.floating], dydx: NDArray[np.floating]
+) -> "CubicHermiteSpline":
+    """Cubic Hermite interpolant of non-decreasing data, limited to stay monotone."""
+    from scipy.interpolate import CubicHermiteSpline  # noqa: PLC0415
+
+    delta = np.diff(y) / np.diff(x)
+    d = np.maximum(dydx, 0.0)
+
+    # Fritsch-Carlson: flat intervals get zero slopes at both ends, and the slopes of the
+    # other intervals are scaled down until alpha^2 + beta^2 <= 9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = d[:-1] / delta
+        beta = d[1:] / delta
+        tau = np.where(delta > 0, np.minimum(1.0, 3 / np.hypot(alpha, beta)), 0.0)
+    scale = np.ones_like(d)
+    scale[:-1] = tau
+    scale[1:] = np.minimum(scale[1:], tau)
+
+    return CubicHermiteSpline(x, y, d * scale, extrapolate=False)
@@ -0,0 +1,57 @@
+"""Reusable scratch buffers for allocation-free evaluation."""
+import threading
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+BufferKey = Tuple[str, Tuple[int, ...], np.dtype]
+
+
+class Workspace:
+    """Scratch buffers reused across calls, keyed by name, shape and dtype.
+
+    Kernels that take a workspace ask it for their temporaries instead of allocating them,
+    so that repeated calls with the same shapes allocate nothing after the first one. Each
+    thread gets its own buffers, so a workspace can be shared by threads evaluating
+    different chunks at the same time.
+    """
+
+    _local: threading.local
+
+    def __init__(self) -> None:
+        """Create an empty workspace."""
+        self._local = threading.local()
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype: DTypeLike) -> NDArray[np.number]:
+        """Return an uninitialised buffer, reusing the previous one of the same kind.
+
+        Args:
+            name (str): Name of the temporary, so that one kernel can hold several.
+            shape (Tuple[int, ...]): Shape of the buffer.
+            dtype (DTypeLike): Data type of the buffer.
+
+        Returns
+        -------
+            NDArray[np.number]: The buffer. Its contents are overwritten by the next user.
+        """
+        buffers = self._buffers()
+        key = (name, tuple(shape), np.dtype(dtype))
+        if key not in buffers:
+            buffers[key] = np.empty(shape, dtype=dtype)
+        return buffers[key]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the buffers of the current thread, in bytes."""
+        return sum(buffer.nbytes for buffer in self._buffers().values())
+
+    def clear(self) -> None:
+        """Release the buffers of the current thread."""
+        self._buffers().clear()
+
+    def _buffers(self) -> Dict[BufferKey, NDArray[np.number]]:
+        """Buffers of the current thread."""
+        if not hasattr(self._local, "buffers"):
+            self._local.buffers = {}
+        return self._local.buffers
@@ -0,0 +1,61 @@
+"""Tests for asymptotic approximations of order statistics."""
+import numpy as np
+from scipy import stats
+from scipy.integrate import trapezoid
+from scipy.special import betainc
+
+from pyordstat.asymptotic import (
+    CENTRAL,
+    LOWER,
+    UPPER,
+    approx_cdf,
+    approx_choice,
+    central_error,
+    extreme_cdf,
+    extreme_error,
+)
+from pyordstat.core import APPROX_TOL, broadcast_nk, ordstat_cdf
+from pyordstat.functions import RVNormalStatistics
+
+
+def test_error_estimates():
+    """Test that the error estimates bound the actual errors."""
+    cdf = np.linspace(0, 1, 100001)
+
+    for n, k in [
+        (100, 2),
+        (1000, 5),
+        (1000, 500),
+        (10**6, 20),
+        (10**6, 10**5),
+        (10**6, 10**6),
+    ]:
+        exact = betainc(k, n - k + 1, cdf)
+        _, err = approx_choice(n, k)
+        assert np.max(np.abs(approx_cdf(cdf, n, k) - exact)) <= err + 1e-15
+        assert np.max(np.abs(extreme_cdf(cdf, n, k) - exact)) <= extreme_error(n, k) + 1e-15
+
+    assert approx_choice(10**6, 1)[0] == LOWER
+    assert approx_choice(10**6, 5 * 10**5)[0] == CENTRAL
+    assert approx_choice(10**6, 10**6 - 3)[0] == UPPER
+    assert central_error(10**6, 5 * 10**5) < APPROX_TOL
+
+
+def test_auto_method():
+    """Test switching between exact and asymptotic engines."""
+    cdf = np.linspace(0, 1, 1001)
+    n, k = broadcast_nk([10, 10**6, 10**6], [5, 1, 5 * 10**5])
+    exact = ordstat_cdf(cdf, n, k)
+
+    auto = ordstat_cdf(cdf, n, k, method="auto", tol=1e-6)
+    assert np.array_equal(auto[0], exact[0])
+    assert np.allclose(auto, exact, atol=1e-6)
+    assert not np.allclose(ordstat_cdf(cdf, n, k, method="approx"), exact, atol=1e-6)
+
+    normal = RVNormalStatistics(0.0, 1.0)
+    x = np.linspace(4, 9, 1001)
+    n = 10**7
+    pdf = normal.order_statistic_pdf(x, n, n, method="auto")
+    assert np.allclose(pdf, np.exp(normal.order_statistic_logpdf(x, n, n)))
+    assert np.isclose(trapezoid(pdf, x), 1, atol=1e-4)
+    assert np.allclose(normal.order_statistic_cdf(x, n, n, method="approx"), stats.norm.cdf(x) ** n)
@@ -0,0 +1,97 @@
+"""Tests for the parent evaluation cache."""
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from pyordstat.cache import EvaluationCache
+from pyordstat.continuous import ContinuousOrderStatistics
+from pyordstat.functions import RVNormalStatistics
+
+
+def test_evaluation_cache():
+    """Test LRU eviction and statistics of the evaluation cache."""
+    calls = []
+
+    def square(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append(float(x[0]))
+        return x**2
+
+    cache = EvaluationCache(max_bytes=2 * 80)
+    x1, x2, x3 = (np.arange(10.0) + i for i in range(3))
+
+    assert np.allclose(cache.evaluate("sq", square, x1), x1**2)
+    assert np.allclose(cache.evaluate("sq", square, x1.copy()), x1**2)
+    assert calls == [0.0]
+
+    cache.evaluate("sq", square, x2)
+    cache.evaluate("sq", square, x1)
+    cache.evaluate("sq", square, x3)  # evicts x2, the least recently used
+    assert cache.info() == {"hits": 2, "misses": 3, "entries": 2, "nbytes": 160, "max_bytes": 160}
+
+    cache.evaluate("sq", square, x2)
+    assert calls == [0.0, 1.0, 2.0, 1.0]
+
+    # Same content, different dtype or function name
+    cache.evaluate("sq", square, x1.astype(np.float32))
+    cache.evaluate("other", square, x1)
+    assert calls[4:] == [0.0, 0.0]
+
+    # Arrays of the caller are not made read-only, only the cached copies
+    table = np.arange(10.0)
+    cached = cache.evaluate("table", lambda x: table, x1)
+    assert table.flags.writeable
+    assert not cached.flags.writeable
+    assert cache.evaluate("identity", lambda x: x, x1) is not x1
+    assert x1.flags.writeable
+
+    with pytest.raises(ValueError, match="max_bytes"):
+        EvaluationCache(-1)
+
+
+def test_ordstat_cache():
+    """Test reuse of parent evaluations across order statistic methods."""
+    calls = []
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append("pdf")
+        return np.exp(-x)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append("cdf")
+        return 1 - np.exp(-x)
+
+    exp_ordstat = ContinuousOrderStatistics(pdf, cdf)
+    assert exp_ordstat.cache_info() is None
+
+    exp_ordstat.enable_cache()
+    x = np.linspace(0, 5, 50)
+    pdf_2_1 = exp_ordstat.order_statistic_pdf(x, 2, 1)
+    exp_ordstat.order_statistic_pdf(x, 5, 3)
+    exp_ordstat.order_statistic_cdf(np.linspace(0, 5, 50), 7, 7)
+    exp_ordstat.order_statistic_logsf(x, 7, 7)
+
+    assert calls == ["pdf", "cdf"]
+    info = exp_ordstat.cache_info()
+    assert {"hits": info["hits"], "misses": info["misses"]} == {"hits": 4, "misses": 2}
+    assert np.allclose(pdf_2_1, 2 * pdf(x) * (1 - cdf(x)))
+
+    exp_ordstat.disable_cache()
+    calls.clear()
+    exp_ordstat.order_statistic_cdf(x, 7, 7)
+    assert calls == ["cdf"]
+
+
+def test_log_cache():
+    """Test reuse of the parent log-space evaluations of SciPy distributions."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    normal.enable_cache()
+    x = np.linspace(-5, 5, 50)
+
+    logpdf = normal.order_statistic_logpdf(x, 7, 3)
+    normal.order_statistic_logcdf(x, 7, 7)
+    normal.order_statistic_logsf(x, 7, 1)
+    assert np.array_equal(normal.order_statistic_logpdf(x, 7, 3), logpdf)
+
+    # The log PDF, log CDF and log survival function are each evaluated once
+    info = normal.cache_info()
+    assert {"hits": info["hits"], "misses": info["misses"]} == {"hits": 7, "misses": 3}
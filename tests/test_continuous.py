@@ -1,7 +1,11 @@
 """Tests for continuous order statistics."""
+import tracemalloc
+
 import numpy as np
 import pytest
 from numpy.typing import NDArray
+from scipy import stats
+from scipy.integrate import trapezoid
 
 from pyordstat.continuous import ContinuousOrderStatistics
 
@@ -44,8 +48,198 @@ def test_c_ordstat():
     assert np.allclose(cdf_3_2, cdf_3_2_targ)
 
     # Test errors
-    with pytest.raises(ValueError, match="k must be between 1 and n."):
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
         exp_ordstat.order_statistic_pdf(x, 2, 3)
 
-    with pytest.raises(ValueError, match="k must be between 1 and n."):
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
         exp_ordstat.order_statistic_cdf(x, 2, 0)
+
+
+def test_c_ordstat_log():
+    """Test continuous order statistics in log space."""
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.exp(-x)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return 1 - np.exp(-x)
+
+    exp_ordstat = ContinuousOrderStatistics(pdf, cdf)
+
+    x = np.linspace(0.1, 5, 20)
+
+    assert np.allclose(
+        np.exp(exp_ordstat.order_statistic_logpdf(x, 5, 3)),
+        exp_ordstat.order_statistic_pdf(x, 5, 3),
+    )
+    assert np.allclose(
+        np.exp(exp_ordstat.order_statistic_logcdf(x, 5, 3)),
+        exp_ordstat.order_statistic_cdf(x, 5, 3),
+    )
+    assert np.allclose(
+        np.exp(exp_ordstat.order_statistic_logsf(x, 5, 3)),
+        1 - exp_ordstat.order_statistic_cdf(x, 5, 3),
+    )
+
+    # The minimum of n exponentials is exponential with rate n, for any n
+    n = 10**7
+    x = np.linspace(0, 1e-6, 11)
+    assert np.allclose(exp_ordstat.order_statistic_logsf(x, n, 1), -n * x)
+    assert np.allclose(exp_ordstat.order_statistic_logpdf(x, n, 1), np.log(n) - n * x)
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        exp_ordstat.order_statistic_logcdf(x, 2, 3)
+
+
+def test_c_ordstat_batch():
+    """Test continuous order statistics over batches of (n, k) pairs."""
+    calls = []
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append("pdf")
+        return np.exp(-x)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append("cdf")
+        return 1 - np.exp(-x)
+
+    exp_ordstat = ContinuousOrderStatistics(pdf, cdf)
+
+    x = np.linspace(0, 5, 30)
+    n = 10
+    k = np.arange(1, n + 1)
+
+    pdf_all = exp_ordstat.order_statistic_pdf(x, n, k)
+    assert pdf_all.shape == (n, len(x))
+    assert calls == ["pdf", "cdf"]
+
+    cdf_all = exp_ordstat.order_statistic_cdf(x, n, k)
+    logpdf_all = exp_ordstat.order_statistic_logpdf(x, n, k)
+    for i, ki in enumerate(k):
+        assert np.allclose(pdf_all[i], exp_ordstat.order_statistic_pdf(x, n, ki))
+        assert np.allclose(cdf_all[i], exp_ordstat.order_statistic_cdf(x, n, ki))
+        assert np.allclose(logpdf_all[i], exp_ordstat.order_statistic_logpdf(x, n, ki))
+
+    # Mixed sample sizes
+    cdf_mix = exp_ordstat.order_statistic_cdf(x, [2, 3], [1, 2])
+    assert np.allclose(cdf_mix[0], exp_ordstat.order_statistic_cdf(x, 2, 1))
+    assert np.allclose(cdf_mix[1], exp_ordstat.order_statistic_cdf(x, 3, 2))
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        exp_ordstat.order_statistic_pdf(x, n, [0, 1])
+
+
+def test_c_ordstat_ppf():
+    """Test continuous order statistic quantiles."""
+
+    def pdf(x: NDArray[np.number], scale: float) -> NDArray[np.number]:
+        return np.exp(-x / scale) / scale
+
+    def cdf(x: NDArray[np.number], scale: float) -> NDArray[np.number]:
+        return 1 - np.exp(-x / scale)
+
+    def ppf(q: NDArray[np.number], scale: float) -> NDArray[np.number]:
+        return -scale * np.log1p(-q)
+
+    exp_ordstat = ContinuousOrderStatistics(pdf, cdf, 2.0, ppf=ppf)
+
+    # The minimum of n exponentials is exponential with n times the rate
+    q = np.linspace(0.1, 0.9, 9)
+    assert np.allclose(exp_ordstat.order_statistic_ppf(q, 4, 1), ppf(q, 0.5))
+    assert np.allclose(exp_ordstat.order_statistic_isf(q, 4, 1), ppf(1 - q, 0.5))
+
+    with pytest.raises(NotImplementedError):
+        ContinuousOrderStatistics(pdf, cdf, 2.0).order_statistic_ppf(q, 4, 1)
+
+
+def test_c_ordstat_moments():
+    """Test continuous order statistic moments with and without the parent ppf."""
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.where(x >= 0, np.exp(-x), 0.0)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.where(x >= 0, -np.expm1(-x), 0.0)
+
+    def ppf(q: NDArray[np.number]) -> NDArray[np.number]:
+        return -np.log1p(-q)
+
+    n = 5
+    k = np.arange(1, n + 1)
+    # Renyi representation of exponential order statistics
+    mean_targ = np.cumsum(1 / np.arange(n, 0, -1))
+    var_targ = np.cumsum(1 / np.arange(n, 0, -1) ** 2)
+
+    for exp_ordstat in [
+        ContinuousOrderStatistics(pdf, cdf, ppf=ppf),
+        ContinuousOrderStatistics(pdf, cdf),
+    ]:
+        assert np.allclose(exp_ordstat.order_statistic_mean(n, k), mean_targ)
+        assert np.allclose(exp_ordstat.order_statistic_var(n, k), var_targ)
+        assert np.isclose(exp_ordstat.order_statistic_mean(n, 1), mean_targ[0])
+
+
+def test_c_ordstat_joint():
+    """Test joint distributions, spacings and ranges of continuous order statistics."""
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.where((x >= 0) & (x <= 1), 1.0, 0.0)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        return np.clip(x, 0.0, 1.0)
+
+    def ppf(q: NDArray[np.number]) -> NDArray[np.number]:
+        return q
+
+    n = 5
+    unif_ordstat = ContinuousOrderStatistics(pdf, cdf, ppf=ppf)
+
+    # The joint PDF integrates to one, and to the marginal PDFs along each axis
+    g = np.linspace(0, 1, 1001)
+    joint = unif_ordstat.order_statistic_joint_pdf(g, g, n, 2, 4)
+    assert joint.shape == (1001, 1001)
+    marginal = unif_ordstat.order_statistic_pdf(g, n, 2)
+    assert np.allclose(trapezoid(joint, g, axis=1), marginal, atol=1e-3)
+
+    joint_cdf = unif_ordstat.order_statistic_joint_cdf(g, g, n, 2, 4)
+    assert np.allclose(joint_cdf[:, -1], unif_ordstat.order_statistic_cdf(g, n, 2))
+    assert np.allclose(joint_cdf[-1], unif_ordstat.order_statistic_cdf(g, n, 4))
+
+    # Uniform spacings X_(j) - X_(i) are Beta(j - i, n - j + i + 1)
+    w = np.linspace(-0.1, 1.1, 25)
+    assert np.allclose(unif_ordstat.order_statistic_range_cdf(w, n), stats.beta(n - 1, 2).cdf(w))
+    assert np.allclose(unif_ordstat.order_statistic_range_pdf(w, n), stats.beta(n - 1, 2).pdf(w))
+    assert np.allclose(
+        unif_ordstat.order_statistic_spacing_cdf(w, n, 2, 4), stats.beta(2, n - 1).cdf(w)
+    )
+
+    # Without the parent ppf, the spacing is integrated over the real line
+    norm_ordstat = ContinuousOrderStatistics(stats.norm.pdf, stats.norm.cdf)
+    assert np.isclose(
+        norm_ordstat.order_statistic_range_cdf(1.0, 2), 2 * stats.norm(0, np.sqrt(2)).cdf(1) - 1
+    )
+
+    with pytest.raises(ValueError, match="1 <= i < j <= n"):
+        unif_ordstat.order_statistic_joint_pdf(g, g, n, 4, 2)
+
+
+def test_c_ordstat_in_place():
+    """Test in-place evaluation of continuous order statistics."""
+    ostat = ContinuousOrderStatistics(stats.norm.pdf, stats.norm.cdf)
+    x = np.linspace(-4, 4, 10**6)
+    out = np.empty(x.shape, dtype=np.float32)
+
+    assert ostat.order_statistic_pdf(x, 10, 3, out=out) is out
+    assert np.allclose(out, ostat.order_statistic_pdf(x, 10, 3), atol=1e-7)
+    assert ostat.order_statistic_cdf(x, 10, 3, dtype=np.float32).dtype == np.float32
+
+    # With the cache, the parent evaluations are reused and nothing is allocated
+    ostat.enable_cache()
+    ostat.order_statistic_pdf(x, 10, 3, out=out)
+    tracemalloc.start()
+    for _ in range(3):
+        ostat.order_statistic_pdf(x, 10, 3, out=out)
+        ostat.order_statistic_cdf(x, 10, 3, out=out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < out.nbytes / 100
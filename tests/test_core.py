@@ -0,0 +1,177 @@
+"""Tests for core order statistics functions."""
+import tracemalloc
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from pyordstat.core import (
+    CDF_METHODS,
+    broadcast_nk,
+    ordstat_cdf,
+    ordstat_joint_uniform_rvs,
+    ordstat_pdf,
+    ordstat_rank,
+    ordstat_sample_size,
+    ordstat_uniform_rvs,
+)
+from pyordstat.workspace import Workspace
+
+# Smallest Kolmogorov-Smirnov p-value accepted for samples of the expected distribution
+KS_PVALUE = 1e-3
+
+
+def test_cdf_methods():
+    """Test that the incomplete beta and summation engines agree."""
+    cdf = np.linspace(0, 1, 11)
+
+    for n, k in [(1, 1), (2, 1), (3, 2), (10, 4), (25, 25)]:
+        cdf_beta = ordstat_cdf(cdf, n, k)
+        cdf_sum = ordstat_cdf(cdf, n, k, method="sum")
+
+        assert np.allclose(cdf_beta, cdf_sum)
+
+    assert np.isclose(ordstat_cdf(0.5, 3, 2), 0.5)
+
+    # Parent CDF values rounded just outside [0, 1]
+    rounded = np.array([-1e-17, 0.0, 0.5, 1.0, 1 + 2e-16])
+    for method in CDF_METHODS:
+        expected = ordstat_cdf(np.clip(rounded, 0, 1), 3, 2, method=method)
+        assert np.allclose(ordstat_cdf(rounded, 3, 2, method=method), expected)
+
+    with pytest.raises(ValueError, match="Unknown method"):
+        ordstat_cdf(cdf, 3, 2, method="magic")
+
+
+def test_cdf_large_n():
+    """Test the incomplete beta engine for large sample sizes."""
+    n = 100000
+    cdf = np.linspace(0, 1, 1001)
+
+    # The median of a large sample concentrates around the parent median
+    cdf_med = ordstat_cdf(cdf, n, n // 2)
+    assert np.all(np.diff(cdf_med) >= 0)
+    assert np.isclose(cdf_med[500], 0.5, atol=0.01)
+    assert np.isclose(cdf_med[490], 0.0, atol=1e-6)
+    assert np.isclose(cdf_med[510], 1.0, atol=1e-6)
+
+
+def test_broadcast_nk():
+    """Test validation and broadcasting of (n, k) pairs."""
+    assert broadcast_nk(3, 2) == (3, 2)
+
+    n, k = broadcast_nk(5, [1, 2, 3], ndim=2)
+    assert n.shape == (3, 1, 1)
+    assert np.all(n.ravel() == [5, 5, 5])
+    assert np.all(k.ravel() == [1, 2, 3])
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        broadcast_nk(3, 4)
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        broadcast_nk([3, 4], [1, 0])
+
+
+def test_cdf_batch():
+    """Test batched evaluation of the CDF engines."""
+    cdf = np.linspace(0, 1, 11)
+    n, k = broadcast_nk([4, 5, 6], [1, 3, 6])
+
+    cdf_beta = ordstat_cdf(cdf, n, k)
+    cdf_sum = ordstat_cdf(cdf, n, k, method="sum")
+
+    assert cdf_beta.shape == (3, 11)
+    assert np.allclose(cdf_beta, cdf_sum)
+    for i, (ni, ki) in enumerate([(4, 1), (5, 3), (6, 6)]):
+        assert np.allclose(cdf_beta[i], ordstat_cdf(cdf, ni, ki))
+
+
+def test_uniform_rvs():
+    """Test direct sampling of uniform order statistics."""
+    u = ordstat_uniform_rvs(1000, 10, size=5000, random_state=0)
+    assert u.shape == (5000,)
+    assert stats.kstest(u, stats.beta(10, 991).cdf).pvalue > KS_PVALUE
+
+    u = ordstat_uniform_rvs(10, [1, 10], size=(4, 3), random_state=0)
+    assert u.shape == (2, 4, 3)
+
+    u = ordstat_joint_uniform_rvs(1000, [10, 500, 1000], size=5000, random_state=1)
+    assert u.shape == (5000, 3)
+    assert np.all(np.diff(u, axis=-1) > 0)
+    for i, k in enumerate([10, 500, 1000]):
+        assert stats.kstest(u[:, i], stats.beta(k, 1001 - k).cdf).pvalue > KS_PVALUE
+
+    with pytest.raises(ValueError, match="strictly increasing"):
+        ordstat_joint_uniform_rvs(10, [3, 2])
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        ordstat_joint_uniform_rvs(10, [3, 11])
+
+
+def test_in_place_kernels():
+    """Test reduced precision and in-place evaluation of the PDF and CDF."""
+    x = np.linspace(0.01, 0.99, 10**6)
+    pdf = stats.beta(2, 3).pdf(x)
+    cdf = stats.beta(2, 3).cdf(x)
+    n, k = broadcast_nk([10, 10], [3, 7])
+
+    pdf_ref = ordstat_pdf(pdf, cdf, n, k)
+    cdf_ref = ordstat_cdf(cdf, n, k)
+
+    assert ordstat_cdf(cdf, n, k, dtype=np.float32).dtype == np.float32
+    assert np.allclose(ordstat_cdf(cdf, n, k, dtype=np.float32), cdf_ref, atol=1e-6)
+    assert np.allclose(ordstat_pdf(pdf, cdf, n, k, dtype=np.float32), pdf_ref, rtol=1e-5)
+    assert np.allclose(ordstat_cdf(cdf, 10, 3, method="sum", dtype=np.float32), cdf_ref[0])
+
+    out = np.empty(pdf_ref.shape, dtype=np.float32)
+    workspace = Workspace()
+    assert ordstat_pdf(pdf, cdf, n, k, out=out, workspace=workspace) is out
+    assert np.allclose(out, pdf_ref, rtol=1e-5)
+    assert workspace.nbytes == out.nbytes
+
+    # After warm-up, repeated calls allocate nothing the size of the result
+    pdf32, cdf32 = pdf.astype(np.float32), cdf.astype(np.float32)
+    ordstat_pdf(pdf32, cdf32, n, k, out=out, workspace=workspace)
+    tracemalloc.start()
+    for _ in range(3):
+        ordstat_pdf(pdf32, cdf32, n, k, out=out, workspace=workspace)
+        ordstat_cdf(cdf32, n, k, out=out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < out.nbytes / 100
+
+    # Without them, every call allocates temporaries the size of the result
+    tracemalloc.start()
+    ordstat_pdf(pdf, cdf, n, k)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak >= 2 * pdf_ref.nbytes
+
+
+def test_sample_size_and_rank():
+    """Test the sample size and rank solvers against a direct search."""
+    p = np.array([0.0, 1e-3, 0.1, 0.5, 0.99, 1.0])[:, None]
+    k = np.array([1, 3, 10])
+
+    q = 0.9
+    n = ordstat_sample_size(p, q, k)
+    assert n.shape == (6, 3)
+    assert np.all(np.isinf(n[0]))
+    assert np.all(n[-1] == k)
+    finite = np.isfinite(n)
+    kk = np.broadcast_to(k, n.shape)[finite]
+    pp = np.broadcast_to(p, n.shape)[finite]
+    assert np.all(stats.binom.sf(kk - 1, n[finite], pp) >= q)
+    assert np.all((n[finite] == kk) | (stats.binom.sf(kk - 1, n[finite] - 1, pp) < q))
+
+    rank = ordstat_rank(p[:, 0], q, 50)
+    expected = [
+        max((j for j in range(1, 51) if stats.binom.sf(j - 1, 50, pi) >= q), default=0)
+        for pi in p[:, 0]
+    ]
+    assert np.all(rank == expected)
+
+    with pytest.raises(ValueError, match="k must"):
+        ordstat_sample_size(0.5, 0.9, 0)
+    with pytest.raises(ValueError, match="n must"):
+        ordstat_rank(0.5, 0.9, 0)
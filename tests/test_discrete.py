@@ -0,0 +1,100 @@
+"""Tests for discrete order statistics."""
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from scipy import stats
+
+from pyordstat.discrete import DiscreteOrderStatistics
+from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.functions import RVGeomStatistics
+
+
+def test_d_ordstat_pmf():
+    """Test that the discrete PMF evaluates the parent CDF once."""
+    calls = []
+
+    def pmf(x: NDArray[np.number], p: float) -> NDArray[np.number]:
+        return stats.geom.pmf(x, p)
+
+    def cdf(x: NDArray[np.number], p: float) -> NDArray[np.number]:
+        calls.append(np.size(x))
+        return stats.geom.cdf(x, p)
+
+    geom_ordstat = DiscreteOrderStatistics(pmf, cdf, 0.3)
+
+    x = np.arange(1, 21)
+    pmf_3_2 = geom_ordstat.order_statistic_pmf(x, 3, 2)
+    assert calls == [21]
+
+    cdf_targ = geom_ordstat.order_statistic_cdf(np.arange(0, 21), 3, 2)
+    assert np.allclose(pmf_3_2, np.diff(cdf_targ))
+    assert np.allclose(geom_ordstat.order_statistic_pmf(x, 3, 2, method="sum"), pmf_3_2)
+
+    # Whole range mode
+    calls.clear()
+    pmf_range = geom_ordstat.order_statistic_pmf_range(1, 20, [3, 4], [2, 4])
+    assert calls == [21]
+    assert np.allclose(pmf_range[0], pmf_3_2)
+    assert np.allclose(pmf_range[1], geom_ordstat.order_statistic_pmf(x, 4, 4))
+
+    # Arbitrary, unsorted points
+    x = np.array([[5, 2], [9, 2]])
+    assert np.allclose(geom_ordstat.order_statistic_pmf(x, 3, 2), pmf_3_2[x - 1])
+    assert np.allclose(np.exp(geom_ordstat.order_statistic_logpmf(x, 3, 2)), pmf_3_2[x - 1])
+
+
+def test_d_ordstat_pmf_truncated():
+    """Test the automatic support, with and without a parent quantile function."""
+    calls = []
+
+    def cdf(x: NDArray[np.number], mu: float) -> NDArray[np.number]:
+        calls.append(np.size(x))
+        return stats.poisson.cdf(x, mu)
+
+    searched = DiscreteOrderStatistics(stats.poisson.pmf, cdf, 30.0)
+    with_ppf = DiscreteOrderStatistics(stats.poisson.pmf, cdf, 30.0, ppf=stats.poisson.ppf)
+
+    x, pmf = searched.order_statistic_pmf_truncated(5, [1, 5], eps=1e-10)
+    assert pmf.shape == (2, len(x))
+    assert np.all(np.diff(x) == 1)
+    assert np.all(np.sum(pmf, axis=-1) >= 1 - 1e-10)
+    assert np.allclose(pmf, searched.order_statistic_pmf(x, 5, [1, 5]))
+
+    # The range is that of the order statistic quantiles, not of a wide guess
+    x_ppf, _ = with_ppf.order_statistic_pmf_truncated(5, [1, 5], eps=1e-10)
+    assert np.array_equal(x, x_ppf)
+    assert x[0] == with_ppf.order_statistic_ppf(5e-11, 5, 1)
+    assert x[-1] == with_ppf.order_statistic_isf(5e-11, 5, 5)
+
+    # Moments no longer need the quantile function
+    assert np.allclose(
+        searched.order_statistic_mean(5, [1, 5]), with_ppf.order_statistic_mean(5, [1, 5])
+    )
+
+    # Later queries go through the table, without calling the parent
+    x, pmf = searched.order_statistic_pmf_truncated(5, 5)
+    n_calls = len(calls)
+    mean = FiniteOrderStatistics(x, pmf).order_statistic_mean(1, 1)
+    assert len(calls) == n_calls
+    assert np.isclose(mean, searched.order_statistic_mean(5, 5))
+
+    # A CDF that never reaches 1 has no finite support
+    defective = DiscreteOrderStatistics(stats.poisson.pmf, lambda x, mu: 0.5 + 0 * x, 1.0)
+    with pytest.raises(ValueError, match="bracket"):
+        defective.order_statistic_pmf_truncated(3, 2)
+
+
+def test_d_ordstat_pmf_truncated_large_sample():
+    """Test the automatic support of the extreme order statistics of a very large sample."""
+    geom = RVGeomStatistics(0.3)
+    n = 10**6
+    eps = 1e-14
+
+    # The upper end of the maximum is far in the parent tail, where the parent CDF is 1
+    x, pmf = geom.order_statistic_pmf_truncated(n, [1, n], eps=eps)
+    assert np.all(np.isfinite(pmf))
+    assert np.all(np.sum(pmf, axis=-1) >= 1 - eps)
+    assert np.allclose(pmf, geom.order_statistic_pmf(x, n, [1, n]))
+
+    # P(X_(n) > x) = 1 - (1 - 0.7^x)^n
+    assert -np.expm1(n * np.log1p(-(0.7 ** float(x[-1])))) <= eps / 2
@@ -1,7 +1,10 @@
 """Tests for finite order statistics."""
 import numpy as np
+import pytest
 
 from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.histogram import HistogramBuilder
+from pyordstat.table import OrderStatisticTable
 
 
 def test_finite():
@@ -17,3 +20,191 @@ def test_finite():
 
     assert np.allclose(pmf_2, [0.75, 0.25])
     assert np.allclose(cdf_2, [0.75, 1.0])
+
+
+def test_finite_log():
+    """Test finite order statistics in log space."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+
+    assert np.allclose(np.exp(die.order_statistic_logpmf(5, 2)), die.order_statistic_pmf(5, 2))
+    assert np.allclose(np.exp(die.order_statistic_logcdf(5, 2)), die.order_statistic_cdf(5, 2))
+    assert np.allclose(np.exp(die.order_statistic_logsf(5, 2)), 1 - die.order_statistic_cdf(5, 2))
+
+    # Probability that the maximum of n rolls is a one
+    n = 1000
+    assert np.isclose(die.order_statistic_logpmf(n, n)[0], -n * np.log(6))
+
+
+def test_finite_batch():
+    """Test finite order statistics over batches of (n, k) pairs."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+
+    k = np.arange(1, 6)
+    pmf_all = die.order_statistic_pmf(5, k)
+
+    assert pmf_all.shape == (5, 6)
+    assert np.allclose(pmf_all.sum(axis=1), 1.0)
+    for i, ki in enumerate(k):
+        assert np.allclose(pmf_all[i], die.order_statistic_pmf(5, ki))
+
+
+def test_finite_quantiles():
+    """Test finite order statistic quantiles."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+
+    q = np.linspace(0.01, 0.99, 15)
+    eps = 1e-12
+    x = die.order_statistic_ppf(q, 3, 2)
+    cdf = die.order_statistic_cdf(3, 2)
+    assert np.all(cdf[x - 1] >= q - eps)
+    assert np.all(np.where(x > 1, cdf[x - 2], 0) < q)
+
+    x = die.order_statistic_isf(q, 3, 2)
+    assert np.all(1 - cdf[x - 1] <= q + eps)
+    assert np.all(np.where(x > 1, 1 - cdf[x - 2], 1) > q)
+
+
+def test_finite_rvs():
+    """Test direct sampling of finite order statistics."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+
+    samples = die.order_statistic_rvs(5, 2, size=20000, random_state=0)
+    freq = np.array([np.mean(samples == x) for x in die.x])
+    assert np.allclose(freq, die.order_statistic_pmf(5, 2), atol=0.01)
+
+    joint = die.order_statistic_joint_rvs(5, [1, 5], size=1000, random_state=0)
+    assert np.all(joint[:, 0] <= joint[:, 1])
+
+
+def test_finite_moments():
+    """Test exact finite order statistic moments."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+
+    assert np.isclose(die.order_statistic_mean(1, 1), 3.5)
+    assert np.isclose(die.order_statistic_var(1, 1), 35 / 12)
+    assert np.allclose(die.order_statistic_mean(2, [1, 2]), [91 / 36, 161 / 36])
+    assert np.allclose(die.order_statistic_moment(2, [1, 2], 2), [301 / 36, 791 / 36])
+
+
+def test_finite_table(tmp_path):
+    """Test the precomputed table of all order statistics."""
+    rng = np.random.default_rng(0)
+    dist = FiniteOrderStatistics(np.arange(50), rng.random(50))
+    n = 20
+
+    table = dist.order_statistic_table(n)
+    assert table.table.shape == (n, 50)
+    assert np.allclose(table.table, dist.order_statistic_cdf(n, np.arange(1, n + 1)))
+    assert np.allclose(table.pmf(3), dist.order_statistic_pmf(n, 3))
+
+    dist.order_statistic_table(n, path=tmp_path / "table")
+    loaded = OrderStatisticTable.load(tmp_path / "table")
+    assert isinstance(loaded.table, np.memmap)
+    assert np.allclose(loaded.x, dist.x)
+    assert np.allclose(loaded.cdf(5), table.cdf(5))
+    assert np.allclose(loaded.column(10), table.table[:, 10])
+
+    table.save(tmp_path / "saved")
+    in_memory = OrderStatisticTable.load(tmp_path / "saved", mmap=False)
+    assert np.array_equal(in_memory.table, table.table)
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        table.cdf(n + 1)
+
+
+def test_finite_joint():
+    """Test joint distributions, spacings and ranges of finite order statistics."""
+    p = np.array([0.1, 0.2, 0.3, 0.4])
+    dist = FiniteOrderStatistics(np.arange(1, 5), p)
+
+    # Exhaustive enumeration of all samples of size 3
+    joint_targ = np.zeros((4, 4))
+    for sample in np.ndindex(4, 4, 4):
+        ordered = sorted(sample)
+        joint_targ[ordered[0], ordered[2]] += np.prod(p[list(sample)])
+
+    assert np.allclose(dist.order_statistic_joint_pmf(3, 1, 3), joint_targ)
+    assert np.allclose(
+        dist.order_statistic_joint_cdf(3, 1, 3), np.cumsum(np.cumsum(joint_targ, 0), 1)
+    )
+
+    w, pmf = dist.order_statistic_range_pmf(3)
+    assert np.allclose(w, [0, 1, 2, 3])
+    assert np.allclose(pmf, [np.trace(joint_targ, offset=d) for d in range(4)])
+
+
+def test_histogram_builder():
+    """Test building finite distributions from streams of samples."""
+    rng = np.random.default_rng(0)
+    samples = rng.poisson(20, size=10000)
+    chunks = np.array_split(samples, 7)
+
+    builder = HistogramBuilder(chunks[:4])
+    other = HistogramBuilder().update(iter(chunks[4:]))
+    builder.merge(other)
+
+    values, counts = np.unique(samples, return_counts=True)
+    assert np.array_equal(builder.values, values)
+    assert np.array_equal(builder.counts, counts)
+    assert builder.n_samples == len(samples)
+
+    direct = FiniteOrderStatistics(values, counts)
+    assert np.allclose(
+        builder.distribution().order_statistic_cdf(5, 2), direct.order_statistic_cdf(5, 2)
+    )
+
+    # Float samples, and integer samples too sparse for bincount
+    floats = HistogramBuilder(np.array([0.5, 0.25, 0.5]))
+    assert np.allclose(floats.values, [0.25, 0.5])
+    assert np.array_equal(floats.counts, [1, 2])
+    sparse = HistogramBuilder(np.array([10**9, -(10**9), 10**9], dtype=np.int64))
+    assert np.array_equal(sparse.counts, [1, 2])
+
+    # Dense integer samples beyond the range of int64, and spans beyond the sample dtype
+    large = HistogramBuilder(np.array([2**63 + 6, 2**63 + 5, 2**63 + 5], dtype=np.uint64))
+    assert large.values.dtype == np.uint64
+    assert np.array_equal(large.values, np.array([2**63 + 5, 2**63 + 6], dtype=np.uint64))
+    assert np.array_equal(large.counts, [2, 1])
+    small = HistogramBuilder(np.array([100, -100] * 50 + [100], dtype=np.int8))
+    assert np.array_equal(small.values, [-100, 100])
+    assert np.array_equal(small.counts, [50, 51])
+
+    # Tables refresh in place, and match tables built from scratch
+    builder = HistogramBuilder(chunks[0])
+    table = builder.order_statistic_table(5)
+    for chunk in chunks[1:]:
+        builder.update(np.append(chunk, 100))
+        table = builder.order_statistic_table(5)
+        expected = builder.distribution().order_statistic_table(5)
+        assert np.array_equal(table.x, expected.x)
+        assert np.allclose(table.table, expected.table)
+
+    # No new samples: the table is reused as is
+    assert builder.order_statistic_table(5) is table
+
+    with pytest.raises(ValueError, match="No samples"):
+        HistogramBuilder().distribution()
+
+
+def test_finite_query_points():
+    """Test finite order statistics at arbitrary points."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+    x = np.array([[0.5, 1, 2.5], [3, 6, 7]])
+    cdf = die.order_statistic_cdf(5, 2)
+
+    assert np.allclose(die.order_statistic_cdf(5, 2, x=x), [[0, cdf[0], cdf[1]], [cdf[2], 1, 1]])
+    assert np.allclose(die.order_statistic_sf(5, 2, x=x), 1 - die.order_statistic_cdf(5, 2, x=x))
+    assert np.allclose(die.order_statistic_sf(5, 2), 1 - cdf)
+
+    pmf = die.order_statistic_pmf(5, 2)
+    assert np.allclose(die.order_statistic_pmf(5, 2, x=x), [[0, pmf[0], 0], [pmf[2], pmf[5], 0]])
+
+    assert die.order_statistic_cdf(5, [1, 2, 3], x=x).shape == (3, 2, 3)
+    assert np.allclose(die.order_statistic_sf(5, [1, 2], x=x)[1], die.order_statistic_sf(5, 2, x=x))
+    assert die.order_statistic_pmf(5, [1, 2], x=x).shape == (2, *x.shape)
+    assert np.ndim(die.order_statistic_cdf(5, 2, x=3.5)) == 0
+    assert np.ndim(die.order_statistic_pmf(5, 2, x=3)) == 0
+
+    # The upper tail keeps its precision
+    tail = FiniteOrderStatistics([0, 1], [1 - 1e-20, 1e-20])
+    assert np.isclose(tail.order_statistic_sf(2, 2, x=[0.5]), 2e-20)
@@ -1,5 +1,8 @@
 """Test functions."""
 import numpy as np
+import pytest
+from scipy import stats
+from scipy.stats import _distn_infrastructure
 
 from pyordstat.functions import (
     RVBinomialStatistics,
@@ -8,6 +11,9 @@ from pyordstat.functions import (
     RVUniformStatistics,
 )
 
+# Smallest Kolmogorov-Smirnov p-value accepted for samples of the expected distribution
+KS_PVALUE = 1e-3
+
 
 def test_uniform():
     """Test uniform order statistics."""
@@ -63,3 +69,206 @@ def test_binomial():
 
     assert np.isclose(binom.order_statistic_pmf(0, 2, 1), 1 - (1 - p_0) ** 2)
     assert np.isclose(binom.order_statistic_cdf(0, 2, 1), 1 - (1 - p_0) ** 2)
+
+
+def test_log_functions():
+    """Test log space order statistics with scipy distributions."""
+    normal = RVNormalStatistics(0, 1)
+
+    # Far tail of the maximum of a large sample, where the direct formula underflows
+    n = 10**6
+    x = -3.0
+    logcdf_targ = n * stats.norm.logcdf(x)
+    assert np.isclose(normal.order_statistic_logcdf(x, n, n), logcdf_targ)
+    assert np.isclose(normal.order_statistic_logsf(x, n, 1), n * stats.norm.logsf(x))
+
+    geom = RVGeomStatistics(0.7)
+    assert np.isclose(np.exp(geom.order_statistic_logpmf(1, 2, 1)), 0.91)
+    assert np.isclose(np.exp(geom.order_statistic_logcdf(1, 2, 2)), 0.49)
+    assert np.isclose(np.exp(geom.order_statistic_logsf(1, 2, 2)), 0.51)
+
+
+def test_quantiles():
+    """Test order statistic quantiles of scipy distributions."""
+    normal = RVNormalStatistics(0, 1)
+
+    q = np.linspace(0.05, 0.95, 7)
+    for n, k in [(1, 1), (5, 2), (100, 100)]:
+        x = normal.order_statistic_ppf(q, n, k)
+        assert np.allclose(normal.order_statistic_cdf(x, n, k), q)
+        x = normal.order_statistic_isf(q, n, k)
+        assert np.allclose(1 - normal.order_statistic_cdf(x, n, k), q)
+
+    assert normal.order_statistic_ppf(q, 10, [1, 5, 10]).shape == (3, 7)
+
+    # Median of the maximum of a uniform sample of size n is 0.5 ** (1/n)
+    uniform = RVUniformStatistics(0, 1)
+    assert np.isclose(uniform.order_statistic_ppf(0.5, 4, 4), 0.5**0.25)
+
+    binom = RVBinomialStatistics(10, 0.4)
+    x = binom.order_statistic_ppf(q, 5, 3)
+    assert np.all(binom.order_statistic_cdf(x, 5, 3) >= q)
+    assert np.all(binom.order_statistic_cdf(x - 1, 5, 3) < q)
+    x = binom.order_statistic_isf(q, 5, 3)
+    assert np.all(1 - binom.order_statistic_cdf(x, 5, 3) <= q)
+    assert np.all(1 - binom.order_statistic_cdf(x - 1, 5, 3) > q)
+
+
+def test_rvs():
+    """Test direct sampling of order statistics of scipy distributions."""
+    normal = RVNormalStatistics(0, 1)
+
+    n = 10**6
+    samples = normal.order_statistic_rvs(n, n, size=2000, random_state=0)
+    assert stats.kstest(samples, lambda x: normal.order_statistic_cdf(x, n, n)).pvalue > KS_PVALUE
+
+    joint = normal.order_statistic_joint_rvs(100, [1, 50, 100], size=(10, 20), random_state=0)
+    assert joint.shape == (10, 20, 3)
+    assert np.all(np.diff(joint, axis=-1) > 0)
+
+    geom = RVGeomStatistics(0.3)
+    samples = geom.order_statistic_rvs(5, 3, size=20000, random_state=0)
+    x = np.arange(1, 10)
+    freq = np.array([np.mean(samples == xi) for xi in x])
+    assert np.allclose(freq, geom.order_statistic_pmf(x, 5, 3), atol=0.01)
+
+    # Without a size, a single (n, k) pair gives a single draw
+    assert np.ndim(normal.order_statistic_rvs(n, n, random_state=0)) == 0
+    assert np.ndim(geom.order_statistic_rvs(5, 3, random_state=0)) == 0
+    assert normal.order_statistic_rvs([5, 6], 2, random_state=0).shape == (2,)
+
+
+def test_moments():
+    """Test order statistic moments of scipy distributions."""
+    normal = RVNormalStatistics(0, 1)
+
+    # Expected maximum of two standard normals
+    assert np.isclose(normal.order_statistic_mean(2, 2), 1 / np.sqrt(np.pi))
+    assert np.isclose(normal.order_statistic_var(2, 2), 1 - 1 / np.pi)
+
+    # Symmetry of the order statistics of a symmetric distribution
+    means = normal.order_statistic_mean(10, np.arange(1, 11))
+    assert np.allclose(means, -means[::-1])
+
+    # Uniform order statistics are beta distributed
+    uniform = RVUniformStatistics(0, 1)
+    n = 20
+    k = np.arange(1, n + 1)
+    assert np.allclose(uniform.order_statistic_mean(n, k), k / (n + 1))
+    assert np.allclose(
+        uniform.order_statistic_var(n, k), k * (n - k + 1) / ((n + 1) ** 2 * (n + 2))
+    )
+    assert np.allclose(uniform.order_statistic_moment(n, k, 2), k * (k + 1) / ((n + 1) * (n + 2)))
+
+    # The minimum of n geometric variables is geometric with success 1 - (1-p)^n
+    geom = RVGeomStatistics(0.3)
+    p_min = 1 - 0.7**3
+    assert np.isclose(geom.order_statistic_mean(3, 1), 1 / p_min)
+    assert np.isclose(geom.order_statistic_var(3, 1), (1 - p_min) / p_min**2)
+
+    # The mean of the maximum of a large sample is the sum of its survival function
+    n = 10**6
+    x = np.arange(1, 200)
+    expected = 1 + np.sum(-np.expm1(n * np.log1p(-(0.7**x))))
+    assert np.isclose(geom.order_statistic_mean(n, n), expected)
+
+
+def test_parameter_batch():
+    """Test batched evaluation over arrays of distribution parameters."""
+    x = np.linspace(-3, 3, 7)
+    normal = RVNormalStatistics(np.array([0.0, 1.0, 2.0]), np.array([[1.0], [2.0]]))
+    single = RVNormalStatistics(1.0, 2.0)
+    assert normal.batch_shape == (2, 3)
+
+    pdf = normal.order_statistic_pdf(x, [5, 6], [2, 3])
+    assert pdf.shape == (2, 2, 3, 7)
+    assert np.allclose(pdf[1, 1, 1], single.order_statistic_pdf(x, 6, 3))
+    assert np.allclose(
+        normal.order_statistic_logcdf(x, 5, 2)[1, 1], single.order_statistic_logcdf(x, 5, 2)
+    )
+
+    q = normal.order_statistic_ppf([0.1, 0.5], 6, 3)
+    assert q.shape == (2, 3, 2)
+    assert np.allclose(q[1, 1], single.order_statistic_ppf([0.1, 0.5], 6, 3))
+    assert normal.order_statistic_rvs([5, 6], 2, size=4, random_state=0).shape == (2, 2, 3, 4)
+    assert np.allclose(normal.order_statistic_mean(6, 3)[1, 1], single.order_statistic_mean(6, 3))
+
+    binom = RVBinomialStatistics(10, np.array([0.2, 0.5]))
+    x = np.arange(11)
+    pmf = binom.order_statistic_pmf(x, 3, [1, 2])
+    assert pmf.shape == (2, 2, 11)
+    assert np.allclose(pmf[1, 0], RVBinomialStatistics(10, 0.2).order_statistic_pmf(x, 3, 2))
+    assert np.allclose(np.exp(binom.order_statistic_logpmf(x, 3, 2)), pmf[1])
+
+
+def test_scipy_rv(monkeypatch):
+    """Test order statistics as frozen scipy distributions."""
+
+    # No method may fall back to generic numerical integration or root finding
+    def fail(*args, **kwargs):
+        raise AssertionError("Generic scipy routine called.")
+
+    monkeypatch.setattr(_distn_infrastructure.integrate, "quad", fail)
+    monkeypatch.setattr(_distn_infrastructure.optimize, "brentq", fail)
+
+    # Uniform order statistics are beta distributed
+    rv = RVUniformStatistics(0, 1).order_statistic_rv(10, 3)
+    beta = stats.beta(3, 8)
+    x = np.linspace(0.05, 0.95, 7)
+    q = np.linspace(0.05, 0.95, 7)
+    assert rv.support() == (0.0, 1.0)
+    assert np.allclose(rv.pdf(x), beta.pdf(x))
+    assert np.allclose(rv.logpdf(x), beta.logpdf(x))
+    assert np.allclose(rv.cdf(x), beta.cdf(x))
+    assert np.allclose(rv.sf(x), beta.sf(x))
+    assert np.allclose(rv.ppf(q), beta.ppf(q))
+    assert np.allclose(rv.isf(q), beta.isf(q))
+    assert np.allclose(rv.stats("mv"), beta.stats("mv"))
+    assert np.isclose(rv.moment(3), beta.moment(3))
+    assert np.isclose(rv.entropy(), beta.entropy())
+
+    normal = RVNormalStatistics(0, 1)
+    rv = normal.order_statistic_rv(2, 2)
+    assert np.isclose(rv.mean(), 1 / np.sqrt(np.pi))
+    samples = rv.rvs(size=2000, random_state=0)
+    assert stats.kstest(samples, rv.cdf).pvalue > KS_PVALUE
+
+    geom = RVGeomStatistics(0.3)
+    rv = geom.order_statistic_rv(5, 2)
+    k = np.arange(1, 25)
+    pmf = geom.order_statistic_pmf(k, 5, 2)
+    assert rv.support() == (1, np.inf)
+    assert np.allclose(rv.pmf(k[:10]), pmf[:10])
+    assert np.allclose(rv.cdf(k[:10]), np.cumsum(pmf)[:10])
+    assert rv.ppf(0.5) == geom.order_statistic_ppf(0.5, 5, 2)
+    assert np.isclose(rv.mean(), np.sum(k * pmf))
+    assert np.isclose(rv.entropy(), -np.sum(pmf * np.log(pmf)))
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        normal.order_statistic_rv(2, 3)
+    with pytest.raises(ValueError, match="single parent"):
+        RVNormalStatistics(np.array([0.0, 1.0]), 1.0).order_statistic_rv(2, 1)
+
+
+def test_sample_size():
+    """Test sample size planning against the order statistic CDF and survival function."""
+    normal = RVNormalStatistics(np.array([0.0, 1.0]), 1.0)
+    t = np.array([-1.0, 0.0, 2.0])
+
+    q, k = 0.99, 2
+    n = normal.order_statistic_sample_size(t, q, k)
+    assert n.shape == (2, 3)
+    # P(X_(k) <= t) is the probability that at least k of n samples are at most t
+    cdf = stats.norm.cdf(t, np.array([[0.0], [1.0]]))
+    assert np.all(stats.binom.sf(k - 1, n, cdf) >= q)
+    assert np.all((n == k) | (stats.binom.sf(k - 1, n - 1, cdf) < q))
+
+    # The maximum exceeding a threshold deep in the tail
+    n_max = normal.order_statistic_sample_size(6.0, 0.5, largest=True)
+    sf = stats.norm.sf(6.0, [0.0, 1.0])
+    assert np.allclose(n_max, np.ceil(np.log(0.5) / np.log1p(-sf)))
+
+    q = 0.9
+    rank = normal.order_statistic_rank(0.0, q, 100, largest=True)
+    assert np.all(stats.binom.sf(rank - 1, 100, stats.norm.sf(0.0, [0.0, 1.0])) >= q)
+    assert np.all(stats.binom.sf(rank, 100, stats.norm.sf(0.0, [0.0, 1.0])) < q)
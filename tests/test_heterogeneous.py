@@ -0,0 +1,52 @@
+"""Tests for order statistics of heterogeneous parents."""
+import itertools
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from pyordstat.core import ordstat_cdf
+from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.heterogeneous import HeterogeneousOrderStatistics
+
+
+def test_identical_parents():
+    """Test that identical parents reproduce the i.i.d. order statistics."""
+    x = np.linspace(-3, 3, 13)
+    het = HeterogeneousOrderStatistics([stats.norm()] * 10)
+
+    cdf = het.order_statistic_cdf(x, np.arange(1, 11))
+    assert cdf.shape == (10, 13)
+    for k in range(1, 11):
+        assert np.allclose(cdf[k - 1], ordstat_cdf(stats.norm.cdf(x), 10, k))
+    assert np.allclose(het.order_statistic_sf(x, 3), 1 - cdf[2])
+
+
+def test_heterogeneous_parents():
+    """Test mixed parent types against an exhaustive sum over subsets."""
+    die = FiniteOrderStatistics(np.arange(1, 7), np.ones(6))
+    support = np.array([0.5, 2.5])
+    parents = [stats.expon(scale=2.0), stats.norm.cdf, die, (support, np.ones(2))]
+    het = HeterogeneousOrderStatistics(parents)
+
+    x = np.array([-1.0, 0.5, 1.0, 2.0, 3.5])
+    p = np.stack(
+        [
+            stats.expon(scale=2.0).cdf(x),
+            stats.norm.cdf(x),
+            np.clip(np.floor(x), 0, 6) / 6,
+            np.mean(x >= support[:, None], axis=0),
+        ]
+    )
+    assert np.allclose(het.parent_cdfs(x), p)
+
+    count_targ = np.zeros((5, len(x)))
+    for below in itertools.product([0, 1], repeat=4):
+        prob = np.prod([p[i] if b else 1 - p[i] for i, b in enumerate(below)], axis=0)
+        count_targ[sum(below)] += prob
+
+    assert np.allclose(het.count_pmf(x), count_targ)
+    assert np.allclose(het.order_statistic_cdf(x, 2), count_targ[2:].sum(axis=0))
+
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        het.order_statistic_cdf(x, 5)
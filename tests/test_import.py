@@ -1,8 +1,53 @@
 """Test pyordstat."""
 
+import os
+import subprocess
+import sys
+
+import pytest
+
 import pyordstat
 
+# Import time budget of `import pyordstat`, in seconds, generous enough for slow runners
+IMPORT_TIME_BUDGET = 0.1
+
+# SciPy modules only the SciPy distributions need
+HEAVY_MODULES = ("scipy.stats", "scipy.integrate", "scipy.interpolate")
+
+
+def _run_import(statement: str) -> str:
+    """Run an import statement in a fresh interpreter, and return its standard output."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", statement], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
 
 def test_import() -> None:
     """Test that the package can be imported."""
     assert isinstance(pyordstat.__name__, str)
+
+    for name in pyordstat.__all__:
+        assert getattr(pyordstat, name).__name__ == name
+    assert set(pyordstat.__all__) <= set(dir(pyordstat))
+
+    with pytest.raises(AttributeError, match="no attribute"):
+        pyordstat.NotAClass  # noqa: B018
+
+
+def test_lazy_import() -> None:
+    """Test the loaded modules and import time budget of the package."""
+    modules = _run_import(
+        "import sys, time; t = time.perf_counter(); import pyordstat;"
+        "print(time.perf_counter() - t); print(*sys.modules)"
+    ).split()
+    assert float(modules[0]) < IMPORT_TIME_BUDGET
+    assert not any(m == "scipy" or m.startswith("scipy.") for m in modules)
+
+    modules = _run_import(
+        "import sys; from pyordstat import ContinuousOrderStatistics, DiscreteOrderStatistics,"
+        "FiniteOrderStatistics, HistogramBuilder; print(*sys.modules)"
+    ).split()
+    assert "scipy.special" in modules
+    assert not any(m.startswith(HEAVY_MODULES) for m in modules)
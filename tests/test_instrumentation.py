@@ -0,0 +1,62 @@
+"""Tests for the profiling of order statistics objects."""
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from pyordstat.base import BatchedDistrFunc
+from pyordstat.finite import FiniteOrderStatistics
+from pyordstat.functions.rv_continuous import RVContOrderStatistics
+
+
+def test_profile():
+    """Test call counts, timings, memory tracing, hooks and detaching."""
+    ostat = RVContOrderStatistics(norm(loc=np.array([0.0, 1.0])))
+    x = np.linspace(-3, 3, 1000)
+    expected = ostat.order_statistic_pdf(x, 10, 3)
+    events = []
+
+    with ostat.profile(hook=events.append) as profile:
+        assert np.allclose(ostat.order_statistic_pdf(x, 10, 3), expected)
+        assert ostat.batch_shape == (2,)
+        ostat.order_statistic_mean(10, 3)  # the moment it calls is not counted separately
+        ostat.order_statistic_logcdf(x, 10, 2)
+
+        with pytest.raises(RuntimeError, match="already"), ostat.profile():
+            pass
+
+    stats = profile.as_dict()
+    assert stats["calls"] == {
+        "order_statistic_pdf": 1,
+        "order_statistic_mean": 1,
+        "order_statistic_logcdf": 1,
+    }
+    assert stats["parent_calls"] == {"pdf": 1, "cdf": 1, "ppf": 1, "logcdf": 1, "logsf": 1}
+    assert stats["parent_points"]["cdf"] == x.size
+    assert stats["parent_seconds"] > 0
+    assert stats["transform_seconds"] > 0
+    assert stats["peak_bytes"] is None
+
+    assert [e["event"] for e in events].count("call") == sum(stats["calls"].values())
+    assert sum(e["seconds"] for e in events if e["event"] == "parent") == pytest.approx(
+        stats["parent_seconds"]
+    )
+
+    # Detached: the original functions and methods are back
+    assert type(ostat._pdf) is BatchedDistrFunc
+    assert not any(name.startswith("order_statistic_") for name in vars(ostat))
+
+    # Cached evaluations are not parent calls
+    ostat.enable_cache()
+    with ostat.profile(trace_memory=True) as profile:
+        ostat.order_statistic_cdf(x, 10, 3)
+        ostat.order_statistic_cdf(x, 10, 5)
+    assert profile.parent_calls == {"cdf": 1}
+    assert profile.peak_bytes is not None
+    assert profile.peak_bytes >= x.nbytes
+
+    # Finite distributions have no parent functions to call
+    finite = FiniteOrderStatistics(np.arange(5), np.ones(5))
+    with finite.profile() as profile:
+        finite.order_statistic_cdf(10, 3)
+    assert profile.calls == {"order_statistic_cdf": 1}
+    assert profile.parent_calls == {}
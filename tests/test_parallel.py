@@ -0,0 +1,55 @@
+"""Tests for parallel evaluation."""
+import numpy as np
+import pytest
+
+from pyordstat.functions import RVNormalStatistics
+from pyordstat.parallel import parallel_evaluate, resolve_n_jobs
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_evaluate(backend):
+    """Test that parallel evaluation matches direct evaluation."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    normal.n_jobs = 3
+    normal.parallel_backend = backend
+    x = np.linspace(-4, 4, 1001).reshape(7, 143)
+    n, k = 20, np.arange(1, 21)
+
+    direct = normal.order_statistic_cdf(x, n, k)
+    ans = normal.evaluate_parallel("order_statistic_cdf", x, n, k)
+    assert ans.shape == direct.shape
+    assert np.array_equal(ans, direct)
+
+    ans = normal.evaluate_parallel("order_statistic_logpdf", x[0], 20, 3)
+    assert np.array_equal(ans, normal.order_statistic_logpdf(x[0], 20, 3))
+
+
+def test_parallel_errors():
+    """Test worker counts and error propagation."""
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(-1) >= 1
+    assert resolve_n_jobs(2) == 2  # noqa: PLR2004
+
+    normal = RVNormalStatistics(0.0, 1.0)
+    with pytest.raises(ValueError, match="k must be between 1 and n"):
+        parallel_evaluate(normal.order_statistic_cdf, np.zeros(10), 5, [1, 6], n_jobs=2)
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        parallel_evaluate(normal.order_statistic_cdf, np.zeros(10), 5, 1, backend="gpu")
+
+
+def test_parallel_cache():
+    """Test that threads sharing the evaluation cache keep its byte count consistent."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    normal.n_jobs = 16
+    normal.enable_cache(max_bytes=2**14)
+    x = np.linspace(-4, 4, 2000)
+    k = np.arange(1, 21)
+
+    for shift in range(50):
+        ans = normal.evaluate_parallel("order_statistic_cdf", x + shift, 20, k)
+        assert np.array_equal(ans, normal.order_statistic_cdf(x + shift, 20, k))
+
+        info = normal.cache_info()
+        assert info["nbytes"] == sum(a.nbytes for a in normal._cache._entries.values())
+        assert info["nbytes"] <= info["max_bytes"]
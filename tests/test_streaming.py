@@ -0,0 +1,37 @@
+"""Tests for chunked evaluation."""
+import numpy as np
+
+from pyordstat.functions import RVNormalStatistics
+from pyordstat.streaming import chunk_size, evaluate_chunked, stream
+
+
+def test_stream(tmp_path):
+    """Test that chunked evaluation matches direct evaluation."""
+    normal = RVNormalStatistics(0.0, 1.0)
+    x = np.linspace(-4, 4, 10001)
+    direct = normal.order_statistic_cdf(x, [5, 10], [2, 7])
+
+    # A small budget forces many chunks
+    chunks = list(normal.stream("order_statistic_cdf", x, [5, 10], [2, 7], memory_budget=2**12))
+    assert all(c.shape == (len(direct), c.shape[-1]) for c in chunks)
+    assert max(c.shape[-1] for c in chunks) < len(x) // 8
+    assert np.allclose(np.concatenate(chunks, axis=-1), direct)
+
+    # Memory-mapped input and output
+    x_map = np.lib.format.open_memmap(tmp_path / "x.npy", mode="w+", shape=x.shape)
+    x_map[:] = x
+    out = np.lib.format.open_memmap(tmp_path / "out.npy", mode="w+", shape=(2, len(x)))
+    ans = normal.evaluate_chunked(
+        "order_statistic_cdf", x_map, [5, 10], [2, 7], memory_budget=2**14, out=out
+    )
+    assert ans is out
+    assert np.allclose(np.load(tmp_path / "out.npy"), direct)
+
+    # Iterables of chunks, with and without preallocated output
+    pdf = evaluate_chunked(lambda c: normal.order_statistic_pdf(c, 5, 2), np.array_split(x, 7))
+    assert np.allclose(pdf, normal.order_statistic_pdf(x, 5, 2))
+    assert np.allclose(evaluate_chunked(np.exp, x, memory_budget=2**10), np.exp(x))
+    assert [len(c) for c in stream(np.exp, iter([x[:3], x[3:10]]))] == [3, 7]
+
+    assert chunk_size(8, 1024) == 1024 // 8
+    assert chunk_size(1e9, 1024) == 1
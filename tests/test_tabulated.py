@@ -0,0 +1,64 @@
+"""Tests for tabulated parent distributions."""
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from scipy import stats
+
+from pyordstat.continuous import ContinuousOrderStatistics
+from pyordstat.tabulated import ParentTable
+
+
+def test_tabulated(tmp_path: Path):
+    """Test tabulation of an expensive parent distribution."""
+    calls = []
+
+    def pdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append(np.size(x))
+        return stats.norm.pdf(x)
+
+    def cdf(x: NDArray[np.number]) -> NDArray[np.number]:
+        calls.append(np.size(x))
+        return stats.norm.cdf(x)
+
+    normal = ContinuousOrderStatistics(pdf, cdf)
+    table = normal.tabulate(-9, 9, tol=1e-9)
+
+    x = np.linspace(-8, 8, 1001)
+    assert np.allclose(table.cdf(x), stats.norm.cdf(x), atol=1e-9, rtol=0)
+    assert np.allclose(table.pdf(x), stats.norm.pdf(x), atol=1e-8, rtol=0)
+    assert np.all(np.diff(table.cdf(x)) >= 0)
+    assert np.allclose(table.ppf(stats.norm.cdf(x[400:600])), x[400:600], atol=1e-4)
+
+    # Outside of the table
+    outside = np.array([-20.0, 20.0])
+    assert np.allclose(table.pdf(outside), 0)
+    assert np.allclose(table.cdf(outside), table.cdf(np.array([-9.0, 9.0])))
+
+    # Order statistics no longer call the parent functions
+    expected = {nk: normal.order_statistic_pdf(x, *nk) for nk in [(5, 1), (5, 3), (100, 100)]}
+    calls.clear()
+    fast = ContinuousOrderStatistics.from_table(table)
+    for (n, k), pdf_nk in expected.items():
+        assert np.allclose(fast.order_statistic_pdf(x, n, k), pdf_nk, atol=1e-6)
+    assert not calls
+
+    class NormalStatistics(ContinuousOrderStatistics):
+        pass
+
+    assert isinstance(NormalStatistics.from_table(table), NormalStatistics)
+    assert np.isclose(fast.order_statistic_mean(2, 2), 1 / np.sqrt(np.pi), atol=1e-6)
+
+    # Serialization
+    table.save(tmp_path / "table.npz")
+    loaded = ParentTable.load(tmp_path / "table.npz")
+    assert np.allclose(loaded.cdf(x), table.cdf(x))
+    assert np.allclose(pickle.loads(pickle.dumps(table)).pdf(x), table.pdf(x))
+
+    with pytest.raises(ValueError, match="strictly increasing"):
+        ParentTable(np.array([0.0, 0.0]), np.array([1.0, 1.0]), np.array([0.0, 1.0]))
+
+    with pytest.warns(RuntimeWarning, match="Tabulation stopped"):
+        normal.tabulate(-9, 9, tol=1e-15, max_points=200)